@@ -42,16 +42,32 @@ from line_loop import (
 logger = logging.getLogger('line-loop')
 
 
+# Signals that request a graceful stop after the current iteration
+_SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM, signal.SIGHUP)
+
+
 def _handle_shutdown(signum, frame):
     """Handle SIGINT/SIGTERM/SIGHUP for graceful shutdown."""
     request_shutdown()
     logger.info(f"Shutdown requested (signal {signum})")
 
 
-# Register signal handlers
-signal.signal(signal.SIGINT, _handle_shutdown)
-signal.signal(signal.SIGTERM, _handle_shutdown)
-signal.signal(signal.SIGHUP, _handle_shutdown)
+def _install_signal_handlers() -> dict:
+    """Register _handle_shutdown for the shutdown signals.
+
+    Done from main() rather than at import so importing this module
+    leaves the caller's handlers alone.
+
+    Returns:
+        Previous handler per signal, for _restore_signal_handlers().
+    """
+    return {sig: signal.signal(sig, _handle_shutdown) for sig in _SHUTDOWN_SIGNALS}
+
+
+def _restore_signal_handlers(previous: dict) -> None:
+    """Reinstate handlers returned by _install_signal_handlers()."""
+    for sig, handler in previous.items():
+        signal.signal(sig, handler)
 
 
 def setup_logging(verbose: bool, log_file: Optional[Path] = None):
@@ -207,6 +223,13 @@ Examples:
         default=DEFAULT_MAX_TASK_FAILURES,
         help=f"Skip task after this many failures (default: {DEFAULT_MAX_TASK_FAILURES})"
     )
+    parser.add_argument(
+        "--circuit-cooldown",
+        type=float,
+        default=None,
+        metavar="S",
+        help="When the circuit breaker trips, wait S seconds and probe with one iteration instead of stopping"
+    )
     parser.add_argument(
         "--idle-timeout",
         type=int,
@@ -255,6 +278,9 @@ Examples:
         exit_code = 0 if health['healthy'] else 1
         sys.exit(exit_code)
 
+    # Route shutdown signals to a graceful stop for the rest of the run
+    previous_handlers = _install_signal_handlers()
+
     # Write PID file if requested (atomic to prevent race on concurrent starts)
     if args.pid_file:
         try:
@@ -288,9 +314,11 @@ Examples:
             max_task_failures=args.max_task_failures,
             idle_timeout=args.idle_timeout,
             idle_action=args.idle_action,
-            epic_mode=args.epic
+            epic_mode=args.epic,
+            circuit_cooldown=args.circuit_cooldown
         )
     finally:
+        _restore_signal_handlers(previous_handlers)
         # Clean up PID file on exit
         if args.pid_file and args.pid_file.exists():
             try:
@@ -63,6 +63,7 @@ from .parsing import (
     extract_text_from_event,
     extract_actions_from_event,
     update_action_from_result,
+    loads_json,
 )
 
 # Re-export phase execution functions
@@ -172,6 +173,7 @@ __all__ = [
     "extract_text_from_event",
     "extract_actions_from_event",
     "update_action_from_result",
+    "loads_json",
     # Phase execution
     "run_phase",
     "run_subprocess",
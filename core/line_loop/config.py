@@ -11,6 +11,7 @@ INPUT_SUMMARY_COMMAND_LENGTH = 80
 INPUT_SUMMARY_PATTERN_LENGTH = 60
 GOAL_TEXT_MAX_LENGTH = 200
 BANNER_MIN_WIDTH = 62
+SERVE_RESULT_WINDOW = 512           # Chars after SERVE_RESULT scanned for its fields
 
 # Task and iteration defaults
 DEFAULT_MAX_TASK_FAILURES = 3       # Skip task after this many failures
@@ -23,6 +24,7 @@ PERIODIC_SYNC_INTERVAL = 5          # Run bd sync every N iterations
 
 # Subprocess timeouts (in seconds)
 BD_COMMAND_TIMEOUT = 30             # Standard bd command timeout
+BEAD_SNAPSHOT_CACHE_TTL = 2.0       # Reuse an unchanged bead snapshot this long
 GIT_COMMAND_TIMEOUT = 10            # Short git commands (log, show)
 GIT_SYNC_TIMEOUT = 60               # Longer git operations (fetch, pull)
 DEFAULT_FALLBACK_PHASE_TIMEOUT = 600  # Fallback for unknown phases
@@ -18,7 +18,10 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -26,6 +29,7 @@ from typing import Any, Optional
 from .config import (
     BANNER_MIN_WIDTH,
     BD_COMMAND_TIMEOUT,
+    BEAD_SNAPSHOT_CACHE_TTL,
     CLOSED_TASKS_QUERY_LIMIT,
     DEFAULT_IDLE_ACTION,
     GIT_COMMAND_TIMEOUT,
@@ -44,6 +48,7 @@ from .models import (
     ServeResult,
 )
 from .parsing import (
+    loads_json,
     parse_intent_block,
     parse_serve_feedback,
     parse_serve_result,
@@ -56,6 +61,29 @@ from .phase import (
 
 logger = logging.getLogger(__name__)
 
+# Status indicator per iteration outcome for print_human_iteration
+_STATUS_MAP = {
+    "completed": "[OK]",
+    "needs_retry": "[RETRY]",
+    "blocked": "[BLOCKED]",
+    "crashed": "[CRASH]",
+    "timeout": "[TIMEOUT]",
+    "no_work": "[DONE]",
+    "no_actionable_work": "[IDLE]"
+}
+
+# Bead titles seen during this run (titles don't change while the loop runs)
+_title_cache: dict[str, str] = {}
+
+# Recent snapshots keyed by (cwd, include_closed): (db mtimes, taken_at, snapshot)
+_snapshot_cache: dict[tuple[str, bool], tuple[tuple, float, BeadSnapshot]] = {}
+
+# Files in .beads whose modification means the bead data changed
+_BEADS_DATA_SUFFIXES = (".db", ".db-wal", ".jsonl")
+
+# Latest commit per repo: cwd -> (HEAD signature, short hash)
+_commit_cache: dict[str, tuple[tuple, str]] = {}
+
 
 def atomic_write(path: Path, content: str) -> None:
     """Write file atomically via temp file + rename.
@@ -120,16 +148,7 @@ def print_phase_progress(phase: str, status: str, duration: float = 0, extra: st
 def print_human_iteration(result: IterationResult, retries: int = 0):
     """Print iteration result in human-readable format."""
     # Status indicator
-    status_map = {
-        "completed": "[OK]",
-        "needs_retry": "[RETRY]",
-        "blocked": "[BLOCKED]",
-        "crashed": "[CRASH]",
-        "timeout": "[TIMEOUT]",
-        "no_work": "[DONE]",
-        "no_actionable_work": "[IDLE]"
-    }
-    status = status_map.get(result.outcome, "[?]")
+    status = _STATUS_MAP.get(result.outcome, "[?]")
 
     task_info = f"{result.task_id}: {result.task_title}" if result.task_id else "Unknown task"
     print(f"\n{status} {task_info}")
@@ -262,29 +281,38 @@ def detect_worked_task(
         Task ID that was worked on, or None if no task state change detected.
     """
     # Check for task that moved from ready to in_progress
-    new_in_progress = set(after.in_progress_ids) - set(before.in_progress_ids)
+    new_in_progress = after.in_progress_set - before.in_progress_set
     if new_in_progress:
         if target_task_id and target_task_id in new_in_progress:
             return target_task_id
         return next(iter(new_in_progress))
 
     # Check for task that moved from ready to closed
-    new_closed = set(after.closed_ids) - set(before.closed_ids)
-    disappeared_ready = set(before.ready_ids) - set(after.ready_ids)
+    new_closed = after.closed_set - before.closed_set
+    disappeared_ready = before.ready_set - after.ready_set
     worked = new_closed & disappeared_ready
     if worked:
         return _prefer_target_or_deepest(worked, target_task_id)
 
     # Check for any task that was in_progress and is now closed
-    was_in_progress = set(before.in_progress_ids)
-    now_closed = set(after.closed_ids)
-    completed = was_in_progress & now_closed
+    completed = before.in_progress_set & after.closed_set
     if completed:
         return _prefer_target_or_deepest(completed, target_task_id)
 
     return None
 
 
+def clear_bead_caches() -> None:
+    """Drop cached bead titles and snapshots.
+
+    run_loop calls this on start so a long-lived process (or one driving
+    several projects, whose bead IDs may overlap) never serves a title
+    cached by an earlier run.
+    """
+    _title_cache.clear()
+    _snapshot_cache.clear()
+
+
 def get_task_title(task_id: str, cwd: Path) -> Optional[str]:
     """Get the title for a task ID from bead database.
 
@@ -294,14 +322,20 @@ def get_task_title(task_id: str, cwd: Path) -> Optional[str]:
 
     Returns:
         Task title string, or None if task not found or query fails.
+        Titles are cached until clear_bead_caches() (called when a loop starts).
     """
+    if task_id in _title_cache:
+        return _title_cache[task_id]
     try:
         result = run_subprocess(["bd", "show", task_id, "--json"], BD_COMMAND_TIMEOUT, cwd)
         if result.returncode == 0 and result.stdout.strip():
-            data = json.loads(result.stdout)
+            data = loads_json(result.stdout)
             issue = parse_bd_json_item(data)
             if issue:
-                return issue.get("title")
+                title = issue.get("title")
+                if title:
+                    _title_cache[task_id] = title
+                return title
     except subprocess.TimeoutExpired:
         logger.warning(f"Timeout getting title for {task_id}")
     except json.JSONDecodeError as e:
@@ -368,7 +402,7 @@ def find_epic_ancestor(bead: BeadInfo, snapshot: BeadSnapshot, cwd: Path) -> Opt
                 result = run_subprocess(["bd", "show", parent_id, "--json"], BD_COMMAND_TIMEOUT, cwd)
                 if result.returncode != 0:
                     break
-                data = json.loads(result.stdout)
+                data = loads_json(result.stdout)
                 issue = parse_bd_json_item(data)
                 if not issue:
                     break
@@ -423,7 +457,7 @@ def is_descendant_of_epic(bead: BeadInfo, epic_id: str, snapshot: BeadSnapshot,
                 result = run_subprocess(["bd", "show", parent_id, "--json"], BD_COMMAND_TIMEOUT, cwd)
                 if result.returncode != 0:
                     break
-                data = json.loads(result.stdout)
+                data = loads_json(result.stdout)
                 issue = parse_bd_json_item(data)
                 if not issue:
                     break
@@ -486,7 +520,7 @@ def build_epic_ancestor_map(snapshot: BeadSnapshot, cwd: Path) -> dict[str, Opti
                     )
                     if result.returncode != 0:
                         break
-                    data = json.loads(result.stdout)
+                    data = loads_json(result.stdout)
                     issue = parse_bd_json_item(data)
                     if not issue:
                         break
@@ -524,15 +558,81 @@ def _parse_bead_info(issue: dict) -> BeadInfo:
     )
 
 
-def get_bead_snapshot(cwd: Path) -> BeadSnapshot:
+def _query_bead_list(args: list[str], label: str, cwd: Path) -> list[BeadInfo]:
+    """Run one bd list-style query and parse its issues into BeadInfo objects.
+
+    Errors are logged rather than raised so a failed query leaves the rest
+    of the snapshot intact.
+
+    Args:
+        args: bd arguments (without the leading "bd").
+        label: Short description of the query for log messages.
+        cwd: Working directory containing the .beads project.
+
+    Returns:
+        List of BeadInfo, or empty list if the query fails.
+    """
+    try:
+        result = run_subprocess(["bd", *args], BD_COMMAND_TIMEOUT, cwd)
+        if result.returncode == 0:
+            # Check the first non-blank char instead of strip()-copying the
+            # whole payload; anything but a list/object can't parse anyway
+            if result.stdout[:64].lstrip()[:1] not in ("[", "{"):
+                if result.stdout.strip():
+                    logger.debug(f"Ignoring non-JSON {label} output")
+                return []
+            issues = loads_json(result.stdout)
+            return [_parse_bead_info(i) for i in issues if isinstance(i, dict)]
+    except subprocess.TimeoutExpired:
+        err = LoopError.from_timeout(f"bd {' '.join(args)}", BD_COMMAND_TIMEOUT)
+        logger.warning(str(err))
+    except json.JSONDecodeError as e:
+        err = LoopError.from_json_decode(f"{label} output", e)
+        logger.warning(str(err))
+    except Exception as e:
+        logger.debug(f"Error getting {label}: {e}")
+    return []
+
+
+def _beads_data_mtimes(cwd: Path) -> Optional[tuple]:
+    """Stat the bead database files under cwd/.beads.
+
+    Args:
+        cwd: Working directory containing the .beads project.
+
+    Returns:
+        Sorted tuple of (filename, mtime_ns, size), or None if .beads is
+        missing or unreadable (which disables snapshot caching).
+    """
+    mtimes = []
+    try:
+        with os.scandir(cwd / ".beads") as entries:
+            for entry in entries:
+                if entry.name.endswith(_BEADS_DATA_SUFFIXES):
+                    stat = entry.stat()
+                    mtimes.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    except OSError:
+        return None
+    return tuple(sorted(mtimes))
+
+
+def get_bead_snapshot(cwd: Path, include_closed: bool = True) -> BeadSnapshot:
     """Capture current state of beads (issues) for before/after comparison.
 
     Queries bd for ready, in_progress, and recently closed issues. The snapshot
     enables detecting which task was worked on by comparing state before and
     after a loop iteration. Stores full BeadInfo metadata from the JSON response.
 
+    The three queries are independent, so they run concurrently and the
+    snapshot costs one bd round-trip instead of three. A snapshot taken less
+    than BEAD_SNAPSHOT_CACHE_TTL seconds ago is returned as-is while the
+    .beads database files are unmodified.
+
     Args:
         cwd: Working directory containing the .beads project.
+        include_closed: Query recently closed beads. Closed IDs only matter
+            for before/after diffs, so callers that just count ready work
+            can pass False to skip that bd call.
 
     Returns:
         BeadSnapshot with BeadInfo lists. Use properties like .ready_ids,
@@ -542,56 +642,37 @@ def get_bead_snapshot(cwd: Path) -> BeadSnapshot:
         Errors from bd commands are logged but don't raise exceptions.
         Returns partially-populated snapshot on individual query failures.
     """
-    snapshot = BeadSnapshot()
-
-    # Get all ready items (full metadata)
-    cmd_ready = "bd ready --json"
-    try:
-        result = run_subprocess(["bd", "ready", "--json"], BD_COMMAND_TIMEOUT, cwd)
-        if result.returncode == 0 and result.stdout.strip():
-            issues = json.loads(result.stdout)
-            snapshot.ready = [_parse_bead_info(i) for i in issues if isinstance(i, dict)]
-    except subprocess.TimeoutExpired:
-        err = LoopError.from_timeout(cmd_ready, BD_COMMAND_TIMEOUT)
-        logger.warning(str(err))
-    except json.JSONDecodeError as e:
-        err = LoopError.from_json_decode("bd ready output", e)
-        logger.warning(str(err))
-    except Exception as e:
-        logger.debug(f"Error getting ready items: {e}")
-
-    # Get in_progress tasks
-    cmd_in_progress = "bd list --status=in_progress --json"
-    try:
-        result = run_subprocess(["bd", "list", "--status=in_progress", "--json"], BD_COMMAND_TIMEOUT, cwd)
-        if result.returncode == 0 and result.stdout.strip():
-            issues = json.loads(result.stdout)
-            snapshot.in_progress = [_parse_bead_info(i) for i in issues if isinstance(i, dict)]
-    except subprocess.TimeoutExpired:
-        err = LoopError.from_timeout(cmd_in_progress, BD_COMMAND_TIMEOUT)
-        logger.warning(str(err))
-    except json.JSONDecodeError as e:
-        err = LoopError.from_json_decode("bd list in_progress output", e)
-        logger.warning(str(err))
-    except Exception as e:
-        logger.debug(f"Error getting in_progress tasks: {e}")
-
-    # Get recently closed tasks (limited for performance)
-    cmd_closed = f"bd list --status=closed --limit={CLOSED_TASKS_QUERY_LIMIT} --json"
-    try:
-        result = run_subprocess(["bd", "list", "--status=closed", f"--limit={CLOSED_TASKS_QUERY_LIMIT}", "--json"], BD_COMMAND_TIMEOUT, cwd)
-        if result.returncode == 0 and result.stdout.strip():
-            issues = json.loads(result.stdout)
-            snapshot.closed = [_parse_bead_info(i) for i in issues if isinstance(i, dict)]
-    except subprocess.TimeoutExpired:
-        err = LoopError.from_timeout(cmd_closed, BD_COMMAND_TIMEOUT)
-        logger.warning(str(err))
-    except json.JSONDecodeError as e:
-        err = LoopError.from_json_decode("bd list closed output", e)
-        logger.warning(str(err))
-    except Exception as e:
-        logger.debug(f"Error getting closed tasks: {e}")
+    cache_key = (str(cwd), include_closed)
+    # Stat before querying so a write racing the queries invalidates the entry
+    mtimes = _beads_data_mtimes(cwd)
+    if mtimes is not None:
+        cached = _snapshot_cache.get(cache_key)
+        if cached and cached[0] == mtimes and time.monotonic() - cached[1] < BEAD_SNAPSHOT_CACHE_TTL:
+            logger.debug("Reusing bead snapshot (beads database unchanged)")
+            return cached[2]
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        ready = pool.submit(_query_bead_list, ["ready", "--json"], "bd ready", cwd)
+        in_progress = pool.submit(
+            _query_bead_list, ["list", "--status=in_progress", "--json"], "bd list in_progress", cwd
+        )
+        closed = pool.submit(
+            _query_bead_list,
+            ["list", "--status=closed", f"--limit={CLOSED_TASKS_QUERY_LIMIT}", "--json"],
+            "bd list closed", cwd
+        ) if include_closed else None
+        snapshot = BeadSnapshot(
+            ready=ready.result(),
+            in_progress=in_progress.result(),
+            closed=closed.result() if closed else [],
+        )
 
+    # Seed the title cache so later get_task_title calls skip bd show
+    for bead in snapshot.ready + snapshot.in_progress + snapshot.closed:
+        if bead.title:
+            _title_cache[bead.id] = bead.title
+    if mtimes is not None:
+        _snapshot_cache[cache_key] = (mtimes, time.monotonic(), snapshot)
     return snapshot
 
 
@@ -613,7 +694,7 @@ def get_task_info(task_id: str, cwd: Path) -> Optional[dict]:
     try:
         result = run_subprocess(["bd", "show", task_id, "--json"], GIT_COMMAND_TIMEOUT, cwd)
         if result.returncode == 0 and result.stdout.strip():
-            data = json.loads(result.stdout)
+            data = loads_json(result.stdout)
             return parse_bd_json_item(data)
     except subprocess.TimeoutExpired:
         err = LoopError.from_timeout(cmd, GIT_COMMAND_TIMEOUT, task_id=task_id)
@@ -647,7 +728,7 @@ def get_children(parent_id: str, cwd: Path) -> list[dict]:
             BD_COMMAND_TIMEOUT, cwd
         )
         if result.returncode == 0 and result.stdout.strip():
-            children = json.loads(result.stdout)
+            children = loads_json(result.stdout)
             if isinstance(children, list):
                 return [c for c in children if isinstance(c, dict)]
     except subprocess.TimeoutExpired:
@@ -732,11 +813,52 @@ def _get_title_from_snapshot_or_cache(
     return None
 
 
+def _git_head_signature(cwd: Path) -> Optional[tuple]:
+    """Fingerprint what HEAD resolves to without running git.
+
+    A commit rewrites the branch ref (loose or packed), not the HEAD
+    symref itself, so the signature covers HEAD's content plus the stat
+    of both places the ref can live. Reftable repositories keep refs in
+    .git/reftable/ and leave HEAD as a placeholder, so they aren't
+    fingerprinted.
+
+    Args:
+        cwd: Working directory of the git repository.
+
+    Returns:
+        Tuple that changes whenever HEAD may point at a new commit, or None
+        if .git isn't a plain directory (worktrees, submodules) or uses the
+        reftable ref format.
+    """
+    git_dir = cwd / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    if (git_dir / "reftable").exists():
+        return None
+    paths = [git_dir / "HEAD", git_dir / "packed-refs"]
+    if head.startswith("ref: "):
+        paths.append(git_dir / head[5:])
+    signature: list = [head]
+    for path in paths:
+        try:
+            stat = path.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+        except OSError:
+            return None
+    return tuple(signature)
+
+
 def get_latest_commit(cwd: Path) -> Optional[str]:
     """Get the short hash of the latest git commit.
 
     Used to record which commit was created by the tidy phase for
-    traceability in iteration results and status reports.
+    traceability in iteration results and status reports. The hash is
+    cached per repository and reused until HEAD or the branch ref changes,
+    so iterations that made no commit skip the git call.
 
     Args:
         cwd: Working directory of the git repository.
@@ -744,10 +866,17 @@ def get_latest_commit(cwd: Path) -> Optional[str]:
     Returns:
         Short commit hash (e.g., "a1b2c3d"), or None if git command fails.
     """
+    signature = _git_head_signature(cwd)
+    cached = _commit_cache.get(str(cwd))
+    if signature is not None and cached and cached[0] == signature:
+        return cached[1]
     try:
         result = run_subprocess(["git", "log", "-1", "--format=%h"], GIT_COMMAND_TIMEOUT, cwd)
         if result.returncode == 0:
-            return result.stdout.strip()
+            commit = result.stdout.strip()
+            if signature is not None and commit:
+                _commit_cache[str(cwd)] = (signature, commit)
+            return commit
     except Exception as e:
         logger.debug(f"Error getting latest commit: {e}")
     return None
@@ -797,7 +926,7 @@ def get_epic_for_task(task_id: str, cwd: Path) -> Optional[str]:
             result = run_subprocess(["bd", "show", current_id, "--json"], BD_COMMAND_TIMEOUT, cwd)
             if result.returncode != 0:
                 return None
-            data = json.loads(result.stdout)
+            data = loads_json(result.stdout)
             issue = parse_bd_json_item(data)
             if not issue:
                 return None
@@ -862,7 +991,7 @@ def is_first_epic_work(epic_id: str, cwd: Path) -> bool:
                 BD_COMMAND_TIMEOUT, cwd
             )
             if result.returncode == 0 and result.stdout.strip():
-                data = json.loads(result.stdout)
+                data = loads_json(result.stdout)
                 if data:
                     return False
         except (subprocess.TimeoutExpired, json.JSONDecodeError) as e:
@@ -902,9 +1031,9 @@ def check_task_completed(
         definitive_signals.extend(streamed_signals)
 
     # DEFINITIVE: Bead state - task moved to closed
-    new_closed = set(after.closed_ids) - set(before.closed_ids)
-    # Use ready_work_ids for consistency with loop focus (tasks + features, not epics)
-    disappeared = set(before.ready_work_ids) - set(after.ready_work_ids) - set(after.in_progress_ids)
+    new_closed = after.closed_set - before.closed_set
+    # Use ready work for consistency with loop focus (tasks + features, not epics)
+    disappeared = before.ready_work_set - after.ready_work_set - after.in_progress_set
     if new_closed or disappeared:
         definitive_signals.append("bead_closed")
 
@@ -913,7 +1042,7 @@ def check_task_completed(
         try:
             result = run_subprocess(["bd", "show", task_id, "--json"], GIT_COMMAND_TIMEOUT, cwd)
             if result.returncode == 0 and result.stdout.strip():
-                task_data = parse_bd_json_item(json.loads(result.stdout))
+                task_data = parse_bd_json_item(loads_json(result.stdout))
                 if isinstance(task_data, dict) and task_data.get("status") == "closed":
                     definitive_signals.append("bd_status_closed")
         except subprocess.TimeoutExpired:
@@ -1070,7 +1199,7 @@ def get_epic_summary(epic_id: str, cwd: Path) -> dict:
     try:
         result = run_subprocess(["bd", "show", epic_id, "--json"], GIT_COMMAND_TIMEOUT, cwd)
         if result.returncode == 0 and result.stdout.strip():
-            epic = parse_bd_json_item(json.loads(result.stdout))
+            epic = parse_bd_json_item(loads_json(result.stdout))
             if epic:
                 epic_data["title"] = epic.get("title")
                 epic_data["description"] = epic.get("description")
@@ -1086,7 +1215,7 @@ def get_epic_summary(epic_id: str, cwd: Path) -> dict:
             BD_COMMAND_TIMEOUT, cwd
         )
         if result.returncode == 0 and result.stdout.strip():
-            children = json.loads(result.stdout)
+            children = loads_json(result.stdout)
             epic_data["children"] = [
                 {"id": c.get("id"), "title": c.get("title"), "issue_type": c.get("issue_type")}
                 for c in children if isinstance(c, dict)
@@ -1134,7 +1263,7 @@ def detect_eligible_epics(cwd: Path) -> list[str]:
         if result.returncode != 0 or not result.stdout.strip():
             return []
 
-        eligible = json.loads(result.stdout)
+        eligible = loads_json(result.stdout)
         if not eligible:
             return []
 
@@ -1301,7 +1430,7 @@ def run_iteration(
         idle_action: Action on idle - "warn" or "terminate"
         before_snapshot: Optional pre-captured snapshot (avoids redundant bd query)
     """
-    start_time = datetime.now()
+    start_time = time.monotonic()
     logger.info(f"Starting iteration {iteration}/{max_iterations}")
     closed_epic_ids: list[str] = []
 
@@ -1389,7 +1518,7 @@ def run_iteration(
                     print_phase_progress("cook", "error", cook_result.duration_seconds, "timeout")
                 logger.warning(f"Cook phase timed out on attempt {cook_attempts}")
                 if cook_attempts > max_cook_retries:
-                    duration = (datetime.now() - start_time).total_seconds()
+                    duration = time.monotonic() - start_time
                     # Reuse after_cook snapshot from above
                     return IterationResult(
                         iteration=iteration,
@@ -1405,7 +1534,8 @@ def run_iteration(
                         after_ready=len(after_cook.ready_ids),
                         after_in_progress=len(after_cook.in_progress_ids),
                         actions=all_actions,
-                        delta=BeadDelta.compute(before, after_cook)
+                        delta=BeadDelta.compute(before, after_cook),
+                        after_snapshot=after_cook
                     )
                 continue
 
@@ -1424,7 +1554,7 @@ def run_iteration(
             if not json_output:
                 print_phase_progress("cook", "done", cook_result.duration_seconds, "IDLE")
             logger.info("Cook found no actionable work (KITCHEN_IDLE)")
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.monotonic() - start_time
             # State unchanged since no work was done - reuse before snapshot values
             return IterationResult(
                 iteration=iteration,
@@ -1521,7 +1651,7 @@ def run_iteration(
                     print_phase_progress("serve", "done", serve_result.duration_seconds,
                                        f"{_action_dots(len(serve_result.actions))}{len(serve_result.actions)} actions, BLOCKED")
                 logger.warning("Serve returned BLOCKED verdict")
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = time.monotonic() - start_time
                 after = get_bead_snapshot(cwd)
                 return IterationResult(
                     iteration=iteration,
@@ -1537,7 +1667,8 @@ def run_iteration(
                     after_ready=len(after.ready_ids),
                     after_in_progress=len(after.in_progress_ids),
                     actions=all_actions,
-                    delta=BeadDelta.compute(before, after)
+                    delta=BeadDelta.compute(before, after),
+                    after_snapshot=after
                 )
             elif serve_verdict == "SKIPPED":
                 if not json_output:
@@ -1581,7 +1712,7 @@ def run_iteration(
                     print_phase_progress("serve", "done", serve_result.duration_seconds,
                                        f"{_action_dots(len(serve_result.actions))}{len(serve_result.actions)} actions, BLOCKED")
                 logger.warning("Serve returned BLOCKED verdict (from signal)")
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = time.monotonic() - start_time
                 after = get_bead_snapshot(cwd)
                 return IterationResult(
                     iteration=iteration,
@@ -1597,7 +1728,8 @@ def run_iteration(
                     after_ready=len(after.ready_ids),
                     after_in_progress=len(after.in_progress_ids),
                     actions=all_actions,
-                    delta=BeadDelta.compute(before, after)
+                    delta=BeadDelta.compute(before, after),
+                    after_snapshot=after
                 )
             else:
                 # No verdict parsed and no signals detected - retry full cook→serve cycle
@@ -1617,7 +1749,7 @@ def run_iteration(
 
     # Check if we exhausted retries
     if not cook_succeeded:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.monotonic() - start_time
         # Safety fallback: after snapshot may be None if we failed before any snapshot
         # was taken (e.g., immediate cook failure before post-cook snapshot)
         if after is None:
@@ -1636,7 +1768,8 @@ def run_iteration(
             after_ready=len(after.ready_ids),
             after_in_progress=len(after.in_progress_ids),
             actions=all_actions,
-            delta=BeadDelta.compute(before, after)
+            delta=BeadDelta.compute(before, after),
+            after_snapshot=after
         )
 
     # ===== PHASE 3: TIDY =====
@@ -1674,14 +1807,26 @@ def run_iteration(
     task_title = _get_title_from_snapshot_or_cache(task_id, before, task_info_cache) if task_id else None
 
     # Check if task was closed
-    new_closed = set(after.closed_ids) - set(before.closed_ids)
-    task_closed = bool(new_closed) or (task_id and task_id not in after.ready_work_ids and task_id not in after.in_progress_ids)
-
-    # Parse intent from cook output
-    combined_output = "".join(all_output)
-    intent, before_state, after_state = parse_intent_block(combined_output)
+    new_closed = after.closed_set - before.closed_set
+    task_closed = bool(new_closed) or (task_id and task_id not in after.ready_work_set and task_id not in after.in_progress_set)
+
+    # Parse intent from cook output, scanning each phase's buffer in turn
+    # instead of joining them into one copy of the whole iteration's output
+    intent: Optional[str] = None
+    before_state: Optional[str] = None
+    after_state: Optional[str] = None
+    for phase_output in all_output:
+        found_intent, found_before, found_after = parse_intent_block(phase_output)
+        if intent is None:
+            intent = found_intent
+        if before_state is None and found_before is not None:
+            before_state, after_state = found_before, found_after
+        if intent is not None and before_state is not None:
+            break
 
     # ===== PHASE 4: FEATURE/EPIC COMPLETION CHECK =====
+    # Plate and close-service change bead state after the snapshot above
+    after_is_current = True
     if task_id and task_closed:
         # Check if completing this task completes a feature
         feature_complete, feature_id = check_feature_completion(task_id, cwd, task_info_cache=task_info_cache, children_cache=children_cache)
@@ -1698,6 +1843,7 @@ def run_iteration(
 
             if progress_state:
                 progress_state.start_phase("plate")
+            after_is_current = False
             plate_result = run_phase("plate", cwd, args=feature_id, on_progress=progress_callback, phase_timeouts=phase_timeouts, idle_timeout=idle_timeout, idle_action=idle_action)
             all_actions.extend(plate_result.actions)
             all_output.append("\n=== PLATE PHASE ===\n")
@@ -1739,7 +1885,7 @@ def run_iteration(
                         logger.info(f"Close-service phase completed for epic {epic_id}")
                         closed_epic_ids.append(epic_id)
 
-    duration = (datetime.now() - start_time).total_seconds()
+    duration = time.monotonic() - start_time
 
     success = task_closed or serve_verdict == "APPROVED"
     outcome = "completed" if success else "needs_retry"
@@ -1769,5 +1915,6 @@ def run_iteration(
         actions=all_actions,
         delta=delta,
         findings_count=findings_count,
-        closed_epics=closed_epic_ids
+        closed_epics=closed_epic_ids,
+        after_snapshot=after if after_is_current else None
     )
@@ -7,7 +7,8 @@ Functions for the outer loop:
 - generate_escalation_report: Report failures for human intervention
 
 Also includes helper functions for:
-- Serialization (serialize_iteration_for_status, serialize_action, serialize_full_iteration)
+- Serialization (serialize_iteration_for_status, serialize_action, serialize_full_iteration,
+  serialize_iteration_for_report)
 - History tracking (append_iteration_to_history, write_history_summary)
 - Retry delay calculation (calculate_retry_delay)
 - Task selection (get_next_ready_task)
@@ -20,10 +21,12 @@ import logging
 import random
 import re
 import subprocess
+import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from .config import (
     BD_COMMAND_TIMEOUT,
@@ -38,6 +41,7 @@ from .config import (
 )
 from .models import (
     ActionRecord,
+    BeadDelta,
     BeadInfo,
     BeadSnapshot,
     CircuitBreaker,
@@ -53,6 +57,7 @@ from .iteration import (
     build_epic_ancestor_map,
     build_hierarchy_chain,
     check_epic_completion,
+    clear_bead_caches,
     find_epic_ancestor,
     format_duration,
     get_bead_snapshot,
@@ -65,12 +70,18 @@ from .iteration import (
     print_human_iteration,
     run_iteration,
 )
+from .parsing import loads_json
 from .phase import run_subprocess
 
 logger = logging.getLogger(__name__)
 
+# Characters allowed in an epic ID used as an epic/<id> branch name
+_BRANCH_SAFE_ID_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
+
 # Global shutdown flag for graceful termination
 _shutdown_requested = False
+# Set alongside the flag so retry backoff waits can end early
+_shutdown_event = threading.Event()
 
 
 def request_shutdown() -> None:
@@ -89,12 +100,26 @@ def request_shutdown() -> None:
     """
     global _shutdown_requested
     _shutdown_requested = True
+    _shutdown_event.set()
 
 
 def reset_shutdown_flag() -> None:
     """Reset the shutdown flag (for testing or loop restart)."""
     global _shutdown_requested
     _shutdown_requested = False
+    _shutdown_event.clear()
+
+
+def wait_unless_shutdown(delay: float) -> bool:
+    """Sleep for delay seconds, returning early if shutdown is requested.
+
+    A plain time.sleep() resumes after a signal handler runs, so a SIGTERM
+    during retry backoff would still wait out the full delay.
+
+    Returns:
+        True if shutdown was requested before the delay elapsed.
+    """
+    return _shutdown_event.wait(delay)
 
 
 def calculate_retry_delay(attempt: int, base: float = 2.0) -> float:
@@ -208,7 +233,7 @@ def validate_epic_id(epic_id: str, cwd: Path) -> Optional[str]:
     try:
         result = run_subprocess(["bd", "show", epic_id, "--json"], BD_COMMAND_TIMEOUT, cwd)
         if result.returncode == 0 and result.stdout.strip():
-            data = json.loads(result.stdout)
+            data = loads_json(result.stdout)
             issue = parse_bd_json_item(data)
             if issue and issue.get("issue_type") == "epic":
                 return issue.get("title", "")
@@ -303,7 +328,7 @@ def get_next_ready_task(
     try:
         result = run_subprocess(["bd", "ready", "--json"], BD_COMMAND_TIMEOUT, cwd)
         if result.returncode == 0 and result.stdout.strip():
-            issues = json.loads(result.stdout)
+            issues = loads_json(result.stdout)
             # Two-pass: prefer tasks over features
             work_items = [
                 i for i in issues
@@ -387,16 +412,49 @@ def serialize_full_iteration(result: IterationResult) -> dict:
         "actions": [serialize_action(a) for a in result.actions]
     }
     if result.delta:
-        data["delta"] = {
-            "newly_closed": [
-                {"id": b.id, "title": b.title, "type": b.issue_type}
-                for b in result.delta.newly_closed
-            ],
-            "newly_filed": [
-                {"id": b.id, "title": b.title, "type": b.issue_type}
-                for b in result.delta.newly_filed
-            ],
-        }
+        data["delta"] = serialize_delta(result.delta)
+    return data
+
+
+def serialize_delta(delta: BeadDelta) -> dict:
+    """Serialize a BeadDelta as id/title/type records."""
+    return {
+        "newly_closed": [
+            {"id": b.id, "title": b.title, "type": b.issue_type}
+            for b in delta.newly_closed
+        ],
+        "newly_filed": [
+            {"id": b.id, "title": b.title, "type": b.issue_type}
+            for b in delta.newly_filed
+        ],
+    }
+
+
+def serialize_iteration_for_report(result: IterationResult) -> dict:
+    """Serialize an IterationResult for the --json / --output loop report."""
+    data = {
+        "iteration": result.iteration,
+        "task_id": result.task_id,
+        "task_title": result.task_title,
+        "intent": result.intent,
+        "before_state": result.before_state,
+        "after_state": result.after_state,
+        "outcome": result.outcome,
+        "duration_seconds": result.duration_seconds,
+        "serve_verdict": result.serve_verdict,
+        "commit_hash": result.commit_hash,
+        "beads_before": {
+            "ready": result.before_ready,
+            "in_progress": result.before_in_progress
+        },
+        "beads_after": {
+            "ready": result.after_ready,
+            "in_progress": result.after_in_progress
+        },
+        "findings_count": result.findings_count
+    }
+    if result.delta:
+        data["delta"] = serialize_delta(result.delta)
     return data
 
 
@@ -566,12 +624,15 @@ def write_status_file(
     skipped_tasks: Optional[list] = None,
     escalation: Optional[dict] = None,
     epic_mode: Optional[str] = None,
-    current_epic: Optional[str] = None
+    current_epic: Optional[str] = None,
+    recent_iterations: Optional[Iterable[dict]] = None
 ):
     """Write live status JSON for external monitoring.
 
     Includes recent_iterations array with last 5 completed iterations
-    for watch mode milestone display.
+    for watch mode milestone display. Callers that keep those entries
+    already serialized pass them as recent_iterations; otherwise they are
+    derived from iterations on every write.
 
     Intra-iteration progress fields (for real-time visibility):
         current_phase: Currently executing phase (cook, serve, tidy, plate)
@@ -615,7 +676,9 @@ def write_status_file(
         status["last_action_time"] = last_action_time.isoformat()
 
     # Add recent_iterations (limited for display)
-    if iterations:
+    if recent_iterations is not None:
+        status["recent_iterations"] = list(recent_iterations)
+    elif iterations:
         completed = [i for i in iterations if i.outcome == "completed"]
         status["recent_iterations"] = [
             serialize_iteration_for_status(i)
@@ -775,7 +838,7 @@ def ensure_epic_branch(task_id: str, cwd: Path) -> tuple[Optional[str], bool]:
         return (None, False)
 
     # Validate epic_id contains only valid git branch characters
-    if not re.match(r'^[a-zA-Z0-9._-]+$', epic_id):
+    if not _BRANCH_SAFE_ID_RE.match(epic_id):
         logger.warning(f"Epic ID '{epic_id}' contains invalid branch characters, skipping branch switch")
         return (None, False)
 
@@ -940,7 +1003,8 @@ def run_loop(
     max_task_failures: int = DEFAULT_MAX_TASK_FAILURES,
     idle_timeout: Optional[int] = None,
     idle_action: str = DEFAULT_IDLE_ACTION,
-    epic_mode: Optional[str] = None
+    epic_mode: Optional[str] = None,
+    circuit_cooldown: Optional[float] = None
 ) -> LoopReport:
     """Main loop: check ready, run iteration, handle outcome, repeat.
 
@@ -956,21 +1020,30 @@ def run_loop(
     - None: default mode, excludes Retrospective/Backlog epics
     - "auto": auto-detect first non-excluded epic, work only its tasks
     - "<id>": work only the specified epic's tasks
+
+    Circuit breaker: by default the loop stops once too many iterations fail.
+    With circuit_cooldown set, it instead waits that many seconds and probes
+    with one more iteration, stopping only via max_iterations or shutdown.
     """
     global _shutdown_requested
 
     started_at = datetime.now()
+    start_time = time.monotonic()  # Durations use the monotonic clock
     iterations: list[IterationResult] = []
+    # Status file entries for the latest completed iterations, serialized once
+    recent_completed: deque[dict] = deque(maxlen=RECENT_ITERATIONS_DISPLAY)
     completed_count = 0
     failed_count = 0
+    blocked_count = 0  # Subset of failed_count, for the summary line
     stop_reason = "unknown"
-    circuit_breaker = CircuitBreaker()
+    circuit_breaker = CircuitBreaker(cooldown=circuit_cooldown)
     skip_list = SkipList(max_failures=max_task_failures)
     current_epic_id: Optional[str] = None
     current_epic_title: Optional[str] = None
     exhausted_epic_ids: set[str] = set()  # Epics already tried in auto mode
 
     logger.info(f"Loop starting: max_iterations={max_iterations}, epic_mode={epic_mode}")
+    clear_bead_caches()
 
     # Validate explicit epic ID upfront
     if epic_mode and epic_mode != "auto":
@@ -1007,6 +1080,8 @@ def run_loop(
     iteration = 0
     current_retries = 0
     last_task_id = None
+    # After-snapshot of the previous iteration, while nothing has changed since
+    reusable_snapshot: Optional[BeadSnapshot] = None
 
     while iteration < max_iterations:
         # Check for shutdown request
@@ -1019,14 +1094,24 @@ def run_loop(
 
         # Check circuit breaker
         if circuit_breaker.is_open():
-            stop_reason = "circuit_breaker"
-            logger.warning("Circuit breaker tripped after consecutive failures")
+            if circuit_breaker.cooldown is None:
+                stop_reason = "circuit_breaker"
+                logger.warning("Circuit breaker tripped after consecutive failures")
+                if not json_output:
+                    print("\nCircuit breaker tripped: too many consecutive failures. Stopping.")
+                break
+            # Half-open: wait out the cooldown, then let one iteration probe
+            delay = circuit_breaker.retry_after()
+            logger.warning(f"Circuit breaker open, probing again in {delay:.0f}s")
             if not json_output:
-                print("\nCircuit breaker tripped: too many consecutive failures. Stopping.")
-            break
+                print(f"\nCircuit breaker open: too many failures. Retrying in {delay:.0f}s...")
+            wait_unless_shutdown(delay)
+            reusable_snapshot = None  # Beads may have changed while waiting
+            continue
 
         # Check for ready work items (tasks + features, not epics)
-        snapshot = get_bead_snapshot(cwd)
+        snapshot = reusable_snapshot or get_bead_snapshot(cwd)
+        reusable_snapshot = None
 
         # Compute excluded epic IDs (Retrospective/Backlog) each iteration
         excluded_ids = get_excluded_epic_ids(snapshot)
@@ -1079,6 +1164,7 @@ def run_loop(
                 exhausted_epic_ids.add(current_epic_id)
                 current_epic_id = None
                 current_epic_title = None
+                reusable_snapshot = snapshot
                 continue
             stop_reason = "no_work"
             if snapshot.ready_ids:
@@ -1152,7 +1238,11 @@ def run_loop(
                 tasks_completed=completed_count,
                 tasks_remaining=ready_work_count,
                 started_at=started_at,
-                iterations=iterations
+                iterations=iterations,
+                recent_iterations=recent_completed,
+                epic_mode=epic_mode,
+                current_epic=current_epic_id,
+                _status_writer=write_status_file
             )
 
         # Run iteration with individual phase invocations
@@ -1168,6 +1258,9 @@ def run_loop(
             target_task_id=target_task_id
         )
         iterations.append(result)
+        reusable_snapshot = result.after_snapshot
+        if result.outcome == "completed":
+            recent_completed.append(serialize_iteration_for_status(result))
 
         # Circuit breaker: track failures, reset on success
         if result.success:
@@ -1196,7 +1289,8 @@ def run_loop(
                 started_at=started_at,
                 iterations=iterations,
                 epic_mode=epic_mode,
-                current_epic=current_epic_id
+                current_epic=current_epic_id,
+                recent_iterations=recent_completed
             )
 
         # Append iteration to history JSONL file (full action details)
@@ -1210,6 +1304,7 @@ def run_loop(
 
         # Periodic bd sync to keep bead state fresh during long runs
         if should_periodic_sync(iteration, PERIODIC_SYNC_INTERVAL):
+            reusable_snapshot = None
             sync_ok = periodic_sync(cwd)
             if not json_output:
                 if sync_ok:
@@ -1264,10 +1359,12 @@ def run_loop(
                 logger.info(f"Retry {current_retries}/{max_retries} for {result.task_id}, waiting {delay:.1f}s")
                 if not json_output:
                     print(f"\n  Waiting {delay:.1f}s before retry...")
-                time.sleep(delay)
+                wait_unless_shutdown(delay)
+                reusable_snapshot = None  # Beads may have changed while waiting
 
         elif result.outcome == "blocked":
             failed_count += 1
+            blocked_count += 1
             # Record failure to skip_list for blocked tasks
             if result.task_id:
                 now_skipped = skip_list.record_failure(result.task_id)
@@ -1304,6 +1401,7 @@ def run_loop(
 
         # Merge epic branches closed during this iteration
         if result.success and result.closed_epics:
+            reusable_snapshot = None
             for closed_epic_id in result.closed_epics:
                 epic_title = get_task_title(closed_epic_id, cwd) or ""
                 merged, merge_error = merge_epic_on_close(closed_epic_id, epic_title, cwd)
@@ -1320,6 +1418,7 @@ def run_loop(
             already_handled = set(result.closed_epics)
             epic_summaries = check_epic_completion(cwd, exclude_ids=already_handled)
             if epic_summaries:
+                reusable_snapshot = None
                 # Merge epic branches to main for each completed epic
                 for epic in epic_summaries:
                     epic_id = epic.get("id")
@@ -1369,7 +1468,7 @@ def run_loop(
             print(f"\nReached iteration limit ({max_iterations}). Stopping.")
 
     ended_at = datetime.now()
-    duration = (ended_at - started_at).total_seconds()
+    duration = time.monotonic() - start_time
 
     # Compute metrics
     metrics = LoopMetrics.from_iterations(iterations)
@@ -1395,9 +1494,14 @@ def run_loop(
             print(format_escalation_report(escalation))
         logger.warning(f"Escalation: {stop_reason} - {len(escalation.get('skipped_tasks', []))} tasks skipped")
 
+    # Final bead state, shared by the status file and the summary (only
+    # ready work is reported, so closed beads aren't queried)
+    final_snapshot: Optional[BeadSnapshot] = None
+    if status_file or not json_output:
+        final_snapshot = reusable_snapshot or get_bead_snapshot(cwd, include_closed=False)
+
     # Write final status (running=false)
     if status_file:
-        final_snapshot = get_bead_snapshot(cwd)
         write_status_file(
             status_file=status_file,
             running=False,
@@ -1414,7 +1518,8 @@ def run_loop(
             skipped_tasks=skip_list.get_skipped_tasks(),
             escalation=escalation,
             epic_mode=epic_mode,
-            current_epic=current_epic_id
+            current_epic=current_epic_id,
+            recent_iterations=recent_completed
         )
 
     # Write history summary record to mark end of loop
@@ -1437,14 +1542,13 @@ def run_loop(
         print("LOOP COMPLETE")
         print("=" * 44)
         print(f"Duration: {format_duration(duration)}")
-        print(f"Completed: {completed_count} | Failed: {failed_count} | Blocked: {sum(1 for i in iterations if i.outcome == 'blocked')}")
+        print(f"Completed: {completed_count} | Failed: {failed_count} | Blocked: {blocked_count}")
 
         # Metrics
         if iterations:
             print(f"Success rate: {metrics.success_rate:.0%} | P50: {format_duration(metrics.p50_duration)} | P95: {format_duration(metrics.p95_duration)}")
 
         # Final state (show work items, note if epics remain)
-        final_snapshot = get_bead_snapshot(cwd)
         work_count = len(final_snapshot.ready_work_ids)
         epic_count = len(final_snapshot.ready_ids) - work_count
         if epic_count > 0:
@@ -1468,43 +1572,17 @@ def run_loop(
                 "timeout_rate": metrics.timeout_rate,
                 "retry_rate": metrics.retry_rate
             },
-            "iterations": [
-                {
-                    "iteration": i.iteration,
-                    "task_id": i.task_id,
-                    "task_title": i.task_title,
-                    "intent": i.intent,
-                    "before_state": i.before_state,
-                    "after_state": i.after_state,
-                    "outcome": i.outcome,
-                    "duration_seconds": i.duration_seconds,
-                    "serve_verdict": i.serve_verdict,
-                    "commit_hash": i.commit_hash,
-                    "beads_before": {
-                        "ready": i.before_ready,
-                        "in_progress": i.before_in_progress
-                    },
-                    "beads_after": {
-                        "ready": i.after_ready,
-                        "in_progress": i.after_in_progress
-                    },
-                    "findings_count": i.findings_count,
-                    **({
-                        "delta": {
-                            "newly_closed": [{"id": b.id, "title": b.title, "type": b.issue_type} for b in i.delta.newly_closed],
-                            "newly_filed": [{"id": b.id, "title": b.title, "type": b.issue_type} for b in i.delta.newly_filed],
-                        }
-                    } if i.delta else {})
-                }
-                for i in report.iterations
-            ]
+            "iterations": [serialize_iteration_for_report(i) for i in report.iterations]
         }
 
+        # Serialize once; stdout and the output file share the same text
+        payload = json.dumps(json_data, indent=2)
         if json_output:
-            print(json.dumps(json_data, indent=2))
+            print(payload)
 
         if output_file:
-            output_file.write_text(json.dumps(json_data, indent=2))
+            # Atomic so a killed loop never leaves a truncated report behind
+            atomic_write(output_file, payload)
             if not json_output:
                 print(f"\nReport written to: {output_file}")
 
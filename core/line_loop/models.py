@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import json
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -60,27 +61,60 @@ if TYPE_CHECKING:
 
 @dataclass
 class CircuitBreaker:
-    """Stops loop after too many failures within a sliding window."""
+    """Stops loop after too many failures within a sliding window.
+
+    With a cooldown set, a tripped breaker goes half-open once the cooldown
+    has passed: is_open() lets one attempt through as a probe. A failed
+    probe re-opens it for another cooldown; a success (reset) closes it.
+    Without a cooldown it stays open until reset.
+    """
     failure_threshold: int = 5
     window_size: int = CIRCUIT_BREAKER_WINDOW_SIZE
-    window: list = field(default_factory=list)
+    window: deque = field(default_factory=deque)
+    cooldown: Optional[float] = None  # Seconds open before a half-open probe
+    recent_failures: int = field(default=0, init=False)  # Failures currently in window
+    opened_at: Optional[float] = field(default=None, init=False)  # Monotonic time of last trip
+
+    def __post_init__(self):
+        # Bounded deque: appending past window_size drops the oldest result
+        self.window = deque(self.window, maxlen=self.window_size)
+        self.recent_failures = sum(1 for s in self.window if not s)
+        if self.recent_failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
 
     def record(self, success: bool):
         """Record a result (True=success, False=failure)."""
+        # The deque evicts silently, so account for the oldest result first
+        if self.window and len(self.window) == self.window_size and not self.window[0]:
+            self.recent_failures -= 1
         self.window.append(success)
-        if len(self.window) > self.window_size:
-            self.window.pop(0)
+        if not success:
+            self.recent_failures += 1
+            # A failure while tripped (including a half-open probe) restarts the cooldown
+            if self.recent_failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
 
     def is_open(self) -> bool:
-        """Check if circuit breaker has tripped (too many failures)."""
-        if len(self.window) < self.failure_threshold:
-            return False
-        recent_failures = sum(1 for s in self.window if not s)
-        return recent_failures >= self.failure_threshold
+        """Check if circuit breaker has tripped (too many failures) and isn't due a probe."""
+        return self.retry_after() > 0
+
+    def retry_after(self) -> float:
+        """Seconds until a tripped breaker allows a half-open probe.
+
+        Returns 0.0 if the breaker isn't tripped or the cooldown has passed,
+        and infinity if it is tripped with no cooldown configured.
+        """
+        if self.recent_failures < self.failure_threshold:
+            return 0.0
+        if self.cooldown is None:
+            return float("inf")
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
 
     def reset(self):
         """Reset the circuit breaker."""
         self.window.clear()
+        self.recent_failures = 0
+        self.opened_at = None
 
 
 @dataclass
@@ -232,11 +266,20 @@ class LoopMetrics:
             return cls(0.0, 0.0, 0.0, 0.0, 0.0)
 
         total = len(iterations)
-        successes = sum(1 for i in iterations if i.success)
-        timeouts = sum(1 for i in iterations if i.outcome == 'timeout')
-        retries = sum(1 for i in iterations if i.outcome == 'needs_retry')
-
-        durations = sorted(i.duration_seconds for i in iterations)
+        successes = timeouts = retries = 0
+        durations = []
+        # One pass for the counts and durations
+        for i in iterations:
+            if i.success:
+                successes += 1
+            if i.outcome == 'timeout':
+                timeouts += 1
+            elif i.outcome == 'needs_retry':
+                retries += 1
+            durations.append(i.duration_seconds)
+        # Nearest-rank percentiles on the exact values (a run has at most
+        # max_iterations entries, so sorting beats pulling in numpy)
+        durations.sort()
         p50_idx = int(len(durations) * 0.5)
         p95_idx = min(int(len(durations) * 0.95), len(durations) - 1)
 
@@ -274,12 +317,12 @@ class BeadSnapshot:
     ready: list[BeadInfo] = field(default_factory=list)
     in_progress: list[BeadInfo] = field(default_factory=list)
     closed: list[BeadInfo] = field(default_factory=list)
-    timestamp: str = ""
+    timestamp: str = ""  # ISO time; left empty unless a caller sets it
     _index: Optional[dict[str, BeadInfo]] = field(default=None, repr=False, compare=False)
-
-    def __post_init__(self):
-        if not self.timestamp:
-            self.timestamp = datetime.now().isoformat()
+    _ready_set: Optional[frozenset[str]] = field(default=None, repr=False, compare=False)
+    _ready_work_set: Optional[frozenset[str]] = field(default=None, repr=False, compare=False)
+    _in_progress_set: Optional[frozenset[str]] = field(default=None, repr=False, compare=False)
+    _closed_set: Optional[frozenset[str]] = field(default=None, repr=False, compare=False)
 
     def _build_index(self) -> dict[str, BeadInfo]:
         """Build dict mapping bead ID to BeadInfo across all lists."""
@@ -307,6 +350,34 @@ class BeadSnapshot:
     def closed_ids(self) -> list[str]:
         return [b.id for b in self.closed]
 
+    @property
+    def ready_set(self) -> frozenset[str]:
+        """Ready IDs as a frozenset, built once on first use for set diffs."""
+        if self._ready_set is None:
+            self._ready_set = frozenset(b.id for b in self.ready)
+        return self._ready_set
+
+    @property
+    def ready_work_set(self) -> frozenset[str]:
+        """Ready work IDs (excluding epics) as a frozenset, built once."""
+        if self._ready_work_set is None:
+            self._ready_work_set = frozenset(b.id for b in self.ready if b.issue_type != "epic")
+        return self._ready_work_set
+
+    @property
+    def in_progress_set(self) -> frozenset[str]:
+        """In-progress IDs as a frozenset, built once on first use."""
+        if self._in_progress_set is None:
+            self._in_progress_set = frozenset(b.id for b in self.in_progress)
+        return self._in_progress_set
+
+    @property
+    def closed_set(self) -> frozenset[str]:
+        """Closed IDs as a frozenset, built once on first use."""
+        if self._closed_set is None:
+            self._closed_set = frozenset(b.id for b in self.closed)
+        return self._closed_set
+
     def get_by_id(self, bead_id: str) -> Optional[BeadInfo]:
         """Look up a BeadInfo by ID across all lists. Uses lazy dict index for O(1) lookup."""
         if self._index is None:
@@ -327,10 +398,10 @@ class BeadDelta:
         newly_closed: beads in after.closed that weren't in before.closed
         newly_filed: beads in after.ready that weren't in any before list
         """
-        before_closed = set(before.closed_ids)
+        before_closed = before.closed_set
         newly_closed = [b for b in after.closed if b.id not in before_closed]
 
-        before_all = set(before.ready_ids + before.in_progress_ids + before.closed_ids)
+        before_all = before.ready_set | before.in_progress_set | before_closed
         newly_filed = [b for b in after.ready if b.id not in before_all]
 
         return cls(newly_closed=newly_closed, newly_filed=newly_filed)
@@ -427,6 +498,7 @@ class ActionRecord:
     success: bool            # True if no error
     timestamp: str           # ISO timestamp
     duration_ms: Optional[float] = None  # Duration in milliseconds (set on result)
+    _started: float = field(default_factory=time.monotonic, init=False, repr=False, compare=False)
 
     @classmethod
     def from_tool_use(cls, block: dict) -> 'ActionRecord':
@@ -478,6 +550,10 @@ class IterationResult:
     # Epics closed during this iteration (for branch merge in run_loop)
     closed_epics: list[str] = field(default_factory=list)
 
+    # Bead state at the end of the iteration, if still current (run_loop
+    # reuses it as the next iteration's snapshot instead of re-querying bd)
+    after_snapshot: Optional[BeadSnapshot] = field(default=None, repr=False, compare=False)
+
     @property
     def action_counts(self) -> dict[str, int]:
         """Count actions by tool name."""
@@ -533,6 +609,11 @@ class ProgressState:
     tasks_remaining: int
     started_at: datetime
     iterations: list
+    # Serialized recent completions, shared with run_loop so in-phase writes
+    # reuse them instead of re-serializing iterations
+    recent_iterations: Optional[deque] = None
+    epic_mode: Optional[str] = None
+    current_epic: Optional[str] = None
 
     # Intra-iteration progress fields
     current_phase: Optional[str] = None
@@ -590,6 +671,9 @@ class ProgressState:
             tasks_remaining=self.tasks_remaining,
             started_at=self.started_at,
             iterations=self.iterations,
+            recent_iterations=self.recent_iterations,
+            epic_mode=self.epic_mode,
+            current_epic=self.current_epic,
             current_phase=self.current_phase,
             phase_start_time=self.phase_start_time,
             current_action_count=self.current_action_count,
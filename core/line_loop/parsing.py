@@ -8,18 +8,58 @@ Functions for parsing Claude output:
 - extract_text_from_event: Get text from streaming event
 - extract_actions_from_event: Get tool actions from event
 - update_action_from_result: Update actions with tool results
+- loads_json: Parse bd JSON output (orjson when installed)
 """
 
 from __future__ import annotations
 
+import importlib
 import json
 import re
-from datetime import datetime
-from typing import Optional
+import time
+from typing import Any, Callable, Optional
 
-from .config import OUTPUT_SUMMARY_MAX_LENGTH
+from .config import OUTPUT_SUMMARY_MAX_LENGTH, SERVE_RESULT_WINDOW
 from .models import ActionRecord, ServeFeedback, ServeFeedbackIssue, ServeResult
 
+# Patterns used on every iteration's output, compiled once at import.
+# SERVE_RESULT fields: one alternation so a buffer is walked once. Values
+# sit in lookaheads so a greedy next_step value never swallows a later key
+# (stream-json output joins the fields with escaped newlines).
+_SERVE_FIELD_RE = re.compile(
+    r"verdict:\s*(?=(APPROVED|NEEDS_CHANGES|BLOCKED|SKIPPED))"
+    r"|continue:\s*(?=(true|false))"
+    r"|blocking_issues:\s*(?=(\d+))"
+    r"|next_step:\s*(?=(\S+))",
+    re.IGNORECASE
+)
+# Gate for parse_serve_result; case-insensitive like the field pattern
+_VERDICT_KEY_RE = re.compile(r"verdict:", re.IGNORECASE)
+_INTENT_RE = re.compile(r"INTENT:\s*\n\s*(.+?)(?:\n\s*Goal:\s*(.+?))?(?:\n\n|\nBEFORE)", re.DOTALL)
+_BEFORE_AFTER_RE = re.compile(r"BEFORE\s*→\s*AFTER:\s*\n\s*(.+?)\s*→\s*(.+?)(?:\n|$)", re.IGNORECASE)
+
+# Serve feedback sections, parsed on every NEEDS_CHANGES retry
+_SUMMARY_RE = re.compile(
+    r"Summary:\s*\n\s*(.+?)(?:\n\n|\nAuto-fixed:|\nIssues|\nPositive)",
+    re.DOTALL | re.IGNORECASE
+)
+_ISSUES_TO_FILE_RE = re.compile(r"Issues to file[^\n]*:\s*\n((?:\s*-[^\n]+\n?)+)", re.IGNORECASE)
+_ISSUES_FOUND_RE = re.compile(r"Issues found:\s*\n", re.IGNORECASE)
+_POSITIVE_LINE_RE = re.compile(r"\nPositive", re.IGNORECASE)
+# Lines like: - [P1] "title" - description or - [major] description
+_ISSUE_LINE_RE = re.compile(
+    r'-\s*\[([^\]]+)\]\s*(?:"([^"]+)"\s*-\s*)?(.+?)(?=\n\s*-|\n\n|$)',
+    re.MULTILINE | re.DOTALL
+)
+# Structured sous-chef blocks: Severity / File/line / Issue / Suggestion.
+# Each field is searched separately within one Severity block; a single
+# DOTALL pattern with several lazy gaps backtracks exponentially when a
+# block lacks a field.
+_SEVERITY_FIELD_RE = re.compile(r"Severity:\s*(\w+)", re.IGNORECASE)
+_LOCATION_FIELD_RE = re.compile(r"(?:File/line:|Location:)\s*([^\n]+)", re.IGNORECASE)
+_ISSUE_FIELD_RE = re.compile(r"Issue:\s*([^\n]+)", re.IGNORECASE)
+_SUGGESTION_FIELD_RE = re.compile(r"Suggestion:\s*([^\n]+)", re.IGNORECASE)
+
 
 def parse_serve_result(output: str) -> Optional[ServeResult]:
     """Parse SERVE_RESULT block from serve phase output.
@@ -41,33 +81,48 @@ def parse_serve_result(output: str) -> Optional[ServeResult]:
         ServeResult with verdict, continue flag, next_step, and blocking_issues.
         Returns None if SERVE_RESULT block cannot be parsed.
     """
-    # Look for the SERVE_RESULT block
-    pattern = r"SERVE_RESULT\s*\n(?:│\s*)?verdict:\s*(\w+).*?(?:│\s*)?continue:\s*(true|false).*?(?:│\s*)?(?:next_step:\s*(\S+))?.*?(?:│\s*)?blocking_issues:\s*(\d+)"
-    match = re.search(pattern, output, re.DOTALL | re.IGNORECASE)
-
-    if match:
-        return ServeResult(
-            verdict=match.group(1).upper(),
-            continue_=match.group(2).lower() == "true",
-            next_step=match.group(3),
-            blocking_issues=int(match.group(4))
-        )
+    # Every accepted form carries a verdict field; skip the field scans
+    # entirely when it is absent
+    if not _VERDICT_KEY_RE.search(output):
+        return None
 
-    # Try simpler patterns for each field
-    verdict_match = re.search(r"verdict:\s*(APPROVED|NEEDS_CHANGES|BLOCKED|SKIPPED)", output, re.IGNORECASE)
-    if verdict_match:
-        continue_match = re.search(r"continue:\s*(true|false)", output, re.IGNORECASE)
-        blocking_match = re.search(r"blocking_issues:\s*(\d+)", output, re.IGNORECASE)
-        next_step_match = re.search(r"next_step:\s*(\S+)", output, re.IGNORECASE)
-
-        return ServeResult(
-            verdict=verdict_match.group(1).upper(),
-            continue_=continue_match.group(1).lower() == "true" if continue_match else True,
-            next_step=next_step_match.group(1) if next_step_match else None,
-            blocking_issues=int(blocking_match.group(1)) if blocking_match else 0
-        )
+    # Staged parse: the block's fields follow its anchor, so scan a short
+    # window there before falling back to the whole output
+    anchor = output.find("SERVE_RESULT")
+    if anchor >= 0:
+        result = _scan_serve_fields(output[anchor:anchor + SERVE_RESULT_WINDOW])
+        if result:
+            return result
 
-    return None
+    return _scan_serve_fields(output)
+
+
+def _scan_serve_fields(text: str) -> Optional[ServeResult]:
+    """Build a ServeResult from the first occurrence of each field in text.
+
+    Returns None if text has no valid verdict. Missing optional fields
+    default to continue=True, next_step=None, blocking_issues=0.
+    """
+    fields: list[Optional[str]] = [None, None, None, None]
+    found = 0
+    for field_match in _SERVE_FIELD_RE.finditer(text):
+        slot = field_match.lastindex - 1
+        if fields[slot] is None:
+            fields[slot] = field_match.group(slot + 1)
+            found += 1
+            if found == 4:
+                break
+
+    verdict, continue_value, blocking, next_step = fields
+    if verdict is None:
+        return None
+
+    return ServeResult(
+        verdict=verdict.upper(),
+        continue_=continue_value.lower() == "true" if continue_value else True,
+        next_step=next_step,
+        blocking_issues=int(blocking) if blocking else 0
+    )
 
 
 def parse_serve_feedback(output: str, task_id: Optional[str] = None, task_title: Optional[str] = None, attempt: int = 1) -> Optional[ServeFeedback]:
@@ -82,11 +137,7 @@ def parse_serve_feedback(output: str, task_id: Optional[str] = None, task_title:
     """
     # Extract summary - look for Summary: section
     summary = ""
-    summary_match = re.search(
-        r"Summary:\s*\n\s*(.+?)(?:\n\n|\nAuto-fixed:|\nIssues|\nPositive)",
-        output,
-        re.DOTALL | re.IGNORECASE
-    )
+    summary_match = _SUMMARY_RE.search(output)
     if summary_match:
         summary = summary_match.group(1).strip()
 
@@ -95,29 +146,16 @@ def parse_serve_feedback(output: str, task_id: Optional[str] = None, task_title:
 
     # Pattern 1: Issues to file in /tidy section with severity markers
     # e.g., "- [P1] "title" - description" or "- [major] file:line - issue"
-    issue_section_match = re.search(
-        r"Issues to file[^\n]*:\s*\n((?:\s*-[^\n]+\n?)+)",
-        output,
-        re.IGNORECASE
-    )
+    issue_section_match = _ISSUES_TO_FILE_RE.search(output)
 
     # Pattern 2: Issues found section from sous-chef
     # e.g., "Issues found:\n  - Severity: major\n    File/line: src/foo.py:42\n    Issue: desc"
-    issues_found_match = re.search(
-        r"Issues found:\s*\n((?:.*?\n)+?)(?:\n\n|Positive|$)",
-        output,
-        re.DOTALL | re.IGNORECASE
-    )
+    issues_found_text = _find_issues_found_section(output)
 
     # Parse simple issue list (Pattern 1)
     if issue_section_match:
         issue_text = issue_section_match.group(1)
-        # Match lines like: - [P1] "title" - description or - [major] description
-        issue_pattern = re.compile(
-            r'-\s*\[([^\]]+)\]\s*(?:"([^"]+)"\s*-\s*)?(.+?)(?=\n\s*-|\n\n|$)',
-            re.MULTILINE | re.DOTALL
-        )
-        for match in issue_pattern.finditer(issue_text):
+        for match in _ISSUE_LINE_RE.finditer(issue_text):
             severity_raw = match.group(1).lower()
             # Normalize severity: P1/P2 -> major, P3 -> minor, P4 -> nit
             if severity_raw in ('p1', 'p2', 'critical'):
@@ -140,21 +178,8 @@ def parse_serve_feedback(output: str, task_id: Optional[str] = None, task_title:
             ))
 
     # Parse detailed issue format (Pattern 2) from sous-chef
-    if issues_found_match and not issues:
-        issue_text = issues_found_match.group(1)
-        # Look for structured issue blocks
-        severity_matches = re.findall(
-            r"Severity:\s*(\w+).*?(?:File/line:|Location:)\s*([^\n]+).*?Issue:\s*([^\n]+)(?:.*?Suggestion:\s*([^\n]+))?",
-            issue_text,
-            re.DOTALL | re.IGNORECASE
-        )
-        for sev, loc, prob, sugg in severity_matches:
-            issues.append(ServeFeedbackIssue(
-                severity=sev.lower(),
-                location=loc.strip(),
-                problem=prob.strip(),
-                suggestion=sugg.strip() if sugg else None
-            ))
+    if issues_found_text and not issues:
+        issues.extend(_parse_issue_blocks(issues_found_text))
 
     # If we found a summary or issues, create feedback
     if summary or issues:
@@ -174,6 +199,57 @@ def parse_serve_feedback(output: str, task_id: Optional[str] = None, task_title:
     return None
 
 
+def _find_issues_found_section(output: str) -> Optional[str]:
+    """Return the text of the "Issues found:" section, or None if absent.
+
+    The section runs to two consecutive blank lines, a line starting with
+    "Positive", or the end of output, whichever comes first. Located with
+    plain substring searches so the cost stays linear in the output size.
+
+    A final line with no trailing newline is part of the section. (The
+    earlier regex dropped it, losing the last field of output that ends
+    without a newline.)
+    """
+    header = _ISSUES_FOUND_RE.search(output)
+    if not header:
+        return None
+    start = header.end()
+    end = len(output)
+    blank = output.find("\n\n\n", start)
+    if blank >= 0:
+        end = blank + 1
+    positive = _POSITIVE_LINE_RE.search(output, start, end)
+    if positive:
+        end = positive.start() + 1
+    return output[start:end]
+
+
+def _parse_issue_blocks(text: str) -> list[ServeFeedbackIssue]:
+    """Parse sous-chef issue blocks (Severity, File/line, Issue, Suggestion).
+
+    Each block spans from one "Severity:" to the next. Blocks without a
+    location or issue description are skipped.
+    """
+    issues: list[ServeFeedbackIssue] = []
+    severities = list(_SEVERITY_FIELD_RE.finditer(text))
+    for n, severity in enumerate(severities):
+        block_end = severities[n + 1].start() if n + 1 < len(severities) else len(text)
+        location = _LOCATION_FIELD_RE.search(text, severity.end(), block_end)
+        if not location:
+            continue
+        problem = _ISSUE_FIELD_RE.search(text, location.end(), block_end)
+        if not problem:
+            continue
+        suggestion = _SUGGESTION_FIELD_RE.search(text, problem.end(), block_end)
+        issues.append(ServeFeedbackIssue(
+            severity=severity.group(1).lower(),
+            location=location.group(1).strip(),
+            problem=problem.group(1).strip(),
+            suggestion=suggestion.group(1).strip() if suggestion else None
+        ))
+    return issues
+
+
 def parse_intent_block(output: str) -> tuple[Optional[str], Optional[str], Optional[str]]:
     """Parse INTENT and BEFORE -> AFTER from cook output.
 
@@ -191,23 +267,15 @@ def parse_intent_block(output: str) -> tuple[Optional[str], Optional[str], Optio
     before_state = None
     after_state = None
 
-    # Parse INTENT block
-    intent_match = re.search(
-        r"INTENT:\s*\n\s*(.+?)(?:\n\s*Goal:\s*(.+?))?(?:\n\n|\nBEFORE)",
-        output,
-        re.DOTALL
-    )
+    # Parse INTENT block (substring checks gate each scan)
+    intent_match = _INTENT_RE.search(output) if "INTENT:" in output else None
     if intent_match:
         intent = intent_match.group(1).strip()
         if intent_match.group(2):
             intent = f"{intent} | Goal: {intent_match.group(2).strip()}"
 
     # Parse BEFORE -> AFTER block
-    before_after_match = re.search(
-        r"BEFORE\s*→\s*AFTER:\s*\n\s*(.+?)\s*→\s*(.+?)(?:\n|$)",
-        output,
-        re.IGNORECASE
-    )
+    before_after_match = _BEFORE_AFTER_RE.search(output) if "→" in output else None
     if before_after_match:
         before_state = before_after_match.group(1).strip()
         after_state = before_after_match.group(2).strip()
@@ -215,6 +283,35 @@ def parse_intent_block(output: str) -> tuple[Optional[str], Optional[str], Optio
     return intent, before_state, after_state
 
 
+_json_loads: Optional[Callable[[str], Any]] = None
+
+
+def loads_json(text: str) -> Any:
+    """Parse JSON text, using orjson when it is installed.
+
+    orjson is resolved through importlib on first use rather than a
+    top-level import, so it stays optional in the bundled script (which
+    hoists every import statement). Its decode error subclasses
+    json.JSONDecodeError, so callers catch the same exceptions either way.
+
+    Args:
+        text: JSON document, typically stdout from a bd --json command.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON.
+    """
+    global _json_loads
+    if _json_loads is None:
+        try:
+            _json_loads = importlib.import_module("orjson").loads
+        except ImportError:
+            _json_loads = json.loads
+    return _json_loads(text)
+
+
 def parse_stream_json_event(line: str) -> Optional[dict]:
     """Parse a single line of Claude's stream-json output format.
 
@@ -333,12 +430,8 @@ def update_action_from_result(
             tool_use_id = block.get("tool_use_id", "")
             if tool_use_id in pending_actions:
                 action = pending_actions[tool_use_id]
-                # Compute duration from start timestamp
-                try:
-                    start = datetime.fromisoformat(action.timestamp)
-                    action.duration_ms = (datetime.now() - start).total_seconds() * 1000
-                except (ValueError, TypeError):
-                    pass
+                # Compute duration on the monotonic clock (immune to wall-clock steps)
+                action.duration_ms = (time.monotonic() - action._started) * 1000
                 # Check for error
                 is_error = block.get("is_error", False)
                 action.success = not is_error
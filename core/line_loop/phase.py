@@ -11,7 +11,9 @@ Functions for running workflow phases:
 from __future__ import annotations
 
 import logging
+import os
 import select
+import shutil
 import subprocess
 import time
 from datetime import datetime
@@ -35,6 +37,24 @@ from .parsing import (
 
 logger = logging.getLogger(__name__)
 
+# Absolute paths of executables already looked up on PATH (bd, git, ...)
+_resolved_executables: dict[str, str] = {}
+
+
+def _resolve_executable(name: str) -> str:
+    """Return the absolute path for name, looking it up on PATH only once.
+
+    Falls back to the bare name (and skips caching) when it isn't found, so
+    subprocess raises the usual FileNotFoundError.
+    """
+    path = _resolved_executables.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is None:
+            return name
+        _resolved_executables[name] = path
+    return path
+
 
 def check_idle(last_action_time: Optional[datetime], idle_timeout: int) -> bool:
     """Check if the phase has been idle beyond the threshold.
@@ -85,12 +105,23 @@ def run_subprocess(cmd: list, timeout: int, cwd: Path) -> subprocess.CompletedPr
 
     Raises:
         subprocess.TimeoutExpired: If command doesn't complete within timeout.
+
+    Note:
+        The executable is resolved to an absolute path once per process, and
+        stdin is closed (DEVNULL) since none of these tools read it. When cwd
+        is already the process working directory it is not passed on, which
+        keeps the child off the chdir path (and lets CPython use posix_spawn
+        where it supports it).
     """
     logger.debug(f"Running: {' '.join(cmd)} (timeout={timeout}s)")
-    start = time.time()
+    start = time.monotonic()
+    run_cwd = None if os.fspath(cwd) == os.getcwd() else cwd
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd, timeout=timeout)
-        logger.debug(f"Completed in {time.time()-start:.1f}s, exit={result.returncode}")
+        result = subprocess.run(
+            [_resolve_executable(cmd[0]), *cmd[1:]],
+            stdin=subprocess.DEVNULL, capture_output=True, text=True, cwd=run_cwd, timeout=timeout
+        )
+        logger.debug(f"Completed in {time.monotonic()-start:.1f}s, exit={result.returncode}")
         return result
     except subprocess.TimeoutExpired:
         logger.warning(f"Timeout after {timeout}s: {' '.join(cmd)}")
@@ -166,7 +197,7 @@ def run_phase(
         skill = f"{skill} {args}"
 
     logger.debug(f"Running phase {phase}: claude -p '{skill}' (timeout={timeout}s)")
-    start_time = time.time()
+    start_time = time.monotonic()
 
     actions: list[ActionRecord] = []
     pending_actions: dict[str, ActionRecord] = {}
@@ -189,9 +220,9 @@ def run_phase(
             cwd=cwd
         )
 
-        deadline = time.time() + timeout
+        deadline = time.monotonic() + timeout
         while True:
-            remaining = deadline - time.time()
+            remaining = deadline - time.monotonic()
             if remaining <= 0:
                 # Graceful termination: SIGTERM first, then SIGKILL as fallback
                 logger.debug(f"Phase {phase} timeout - sending SIGTERM")
@@ -277,15 +308,13 @@ def run_phase(
                             logger.warning(f"Phase {phase} idle for {idle_seconds:.0f}s (threshold: {idle_timeout}s)")
                             idle_warned = True
 
-        # Read any remaining output
-        remaining_out = process.stdout.read()
-        if remaining_out:
-            output_lines.extend(remaining_out.splitlines(keepends=True))
+        # Drain any remaining output line by line (no second full-size copy)
+        output_lines.extend(process.stdout)
         process.wait()
         exit_code = process.returncode
 
     except subprocess.TimeoutExpired:
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         logger.warning(f"Phase {phase} timed out after {duration:.1f}s")
         return PhaseResult(
             phase=phase,
@@ -298,7 +327,7 @@ def run_phase(
             error=f"Timeout after {timeout}s"
         )
     except Exception as e:
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         logger.error(f"Phase {phase} crashed: {e}")
         return PhaseResult(
             phase=phase,
@@ -311,7 +340,7 @@ def run_phase(
             error=str(e)
         )
 
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     output = "".join(output_lines)
     # Phase is successful if exit code is 0 OR if it signaled early completion
     early_completion = "phase_complete" in signals
@@ -1,21 +1,46 @@
 """Shared helpers for Line Cook scripts.
 
-Provides validate_bead_id, run_cmd, and run_bd_json to avoid duplication
-across helper scripts.
+Provides validate_bead_id, run_cmd, run_bd_json, and loads_json to avoid
+duplication across helper scripts.
 """
 
 import json
 import re
 import subprocess
+import time
+
+_BEAD_ID_MATCH = re.compile(r'\A[a-zA-Z0-9._-]+\Z').match
+
+
+class _Budget:
+    """Wall-clock ceiling shared by every run_cmd call in a script run."""
+    deadline = None
+
+
+_budget = _Budget()
+
+
+def set_budget(seconds):
+    """Cap the total wall time of subsequent run_cmd calls.
+
+    Pass None to remove the ceiling. Once the deadline passes, run_cmd
+    returns a failure without spawning the command.
+    """
+    _budget.deadline = None if seconds is None else time.monotonic() + seconds
 
 
 def validate_bead_id(bid):
     """Validate bead ID format to prevent malformed input in subprocess calls."""
-    return bool(bid and re.match(r'^[a-zA-Z0-9._-]+$', bid))
+    return bool(bid) and _BEAD_ID_MATCH(bid) is not None
 
 
 def run_cmd(args, timeout=15):
     """Run a command and return (returncode, stdout, stderr)."""
+    if _budget.deadline is not None:
+        remaining = _budget.deadline - time.monotonic()
+        if remaining <= 0:
+            return -1, "", "budget exceeded"
+        timeout = min(timeout, max(0.01, remaining))
     try:
         result = subprocess.run(
             args, capture_output=True, text=True, timeout=timeout
@@ -27,6 +52,26 @@ def run_cmd(args, timeout=15):
         return -1, "", "timeout after {}s".format(timeout)
 
 
+_loads = None
+
+
+def loads_json(text):
+    """Parse JSON text, using orjson when it is installed.
+
+    The parser is imported on first use so commands that never parse JSON
+    skip the import. orjson's decode error subclasses json.JSONDecodeError,
+    so callers catch the same exceptions either way.
+    """
+    global _loads
+    if _loads is None:
+        try:
+            import orjson
+            _loads = orjson.loads
+        except ImportError:
+            _loads = json.loads
+    return _loads(text)
+
+
 def run_bd_json(args, timeout=15):
     """Run a bd command with --json and parse the result.
 
@@ -37,7 +82,7 @@ def run_bd_json(args, timeout=15):
     if rc != 0 or not out:
         return None
     try:
-        data = json.loads(out)
+        data = loads_json(out)
         if isinstance(data, list) and len(data) == 1:
             return data[0]
         return data
@@ -12,6 +12,7 @@ Platform Support:
 
 # === Standard library imports ===
 import argparse
+import importlib
 import json
 import logging
 import logging.handlers
@@ -23,11 +24,14 @@ import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Optional, Protocol
+from typing import Any, Callable, Iterable, Optional, Protocol
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -44,6 +48,7 @@ INPUT_SUMMARY_COMMAND_LENGTH = 80
 INPUT_SUMMARY_PATTERN_LENGTH = 60
 GOAL_TEXT_MAX_LENGTH = 200
 BANNER_MIN_WIDTH = 62
+SERVE_RESULT_WINDOW = 512           # Chars after SERVE_RESULT scanned for its fields
 
 # Task and iteration defaults
 DEFAULT_MAX_TASK_FAILURES = 3       # Skip task after this many failures
@@ -56,6 +61,7 @@ PERIODIC_SYNC_INTERVAL = 5          # Run bd sync every N iterations
 
 # Subprocess timeouts (in seconds)
 BD_COMMAND_TIMEOUT = 30             # Standard bd command timeout
+BEAD_SNAPSHOT_CACHE_TTL = 2.0       # Reuse an unchanged bead snapshot this long
 GIT_COMMAND_TIMEOUT = 10            # Short git commands (log, show)
 GIT_SYNC_TIMEOUT = 60               # Longer git operations (fetch, pull)
 DEFAULT_FALLBACK_PHASE_TIMEOUT = 600  # Fallback for unknown phases
@@ -128,27 +134,60 @@ if TYPE_CHECKING:
 
 @dataclass
 class CircuitBreaker:
-    """Stops loop after too many failures within a sliding window."""
+    """Stops loop after too many failures within a sliding window.
+
+    With a cooldown set, a tripped breaker goes half-open once the cooldown
+    has passed: is_open() lets one attempt through as a probe. A failed
+    probe re-opens it for another cooldown; a success (reset) closes it.
+    Without a cooldown it stays open until reset.
+    """
     failure_threshold: int = 5
     window_size: int = CIRCUIT_BREAKER_WINDOW_SIZE
-    window: list = field(default_factory=list)
+    window: deque = field(default_factory=deque)
+    cooldown: Optional[float] = None  # Seconds open before a half-open probe
+    recent_failures: int = field(default=0, init=False)  # Failures currently in window
+    opened_at: Optional[float] = field(default=None, init=False)  # Monotonic time of last trip
+
+    def __post_init__(self):
+        # Bounded deque: appending past window_size drops the oldest result
+        self.window = deque(self.window, maxlen=self.window_size)
+        self.recent_failures = sum(1 for s in self.window if not s)
+        if self.recent_failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
 
     def record(self, success: bool):
         """Record a result (True=success, False=failure)."""
+        # The deque evicts silently, so account for the oldest result first
+        if self.window and len(self.window) == self.window_size and not self.window[0]:
+            self.recent_failures -= 1
         self.window.append(success)
-        if len(self.window) > self.window_size:
-            self.window.pop(0)
+        if not success:
+            self.recent_failures += 1
+            # A failure while tripped (including a half-open probe) restarts the cooldown
+            if self.recent_failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
 
     def is_open(self) -> bool:
-        """Check if circuit breaker has tripped (too many failures)."""
-        if len(self.window) < self.failure_threshold:
-            return False
-        recent_failures = sum(1 for s in self.window if not s)
-        return recent_failures >= self.failure_threshold
+        """Check if circuit breaker has tripped (too many failures) and isn't due a probe."""
+        return self.retry_after() > 0
+
+    def retry_after(self) -> float:
+        """Seconds until a tripped breaker allows a half-open probe.
+
+        Returns 0.0 if the breaker isn't tripped or the cooldown has passed,
+        and infinity if it is tripped with no cooldown configured.
+        """
+        if self.recent_failures < self.failure_threshold:
+            return 0.0
+        if self.cooldown is None:
+            return float("inf")
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
 
     def reset(self):
         """Reset the circuit breaker."""
         self.window.clear()
+        self.recent_failures = 0
+        self.opened_at = None
 
 
 @dataclass
@@ -300,11 +339,20 @@ class LoopMetrics:
             return cls(0.0, 0.0, 0.0, 0.0, 0.0)
 
         total = len(iterations)
-        successes = sum(1 for i in iterations if i.success)
-        timeouts = sum(1 for i in iterations if i.outcome == 'timeout')
-        retries = sum(1 for i in iterations if i.outcome == 'needs_retry')
-
-        durations = sorted(i.duration_seconds for i in iterations)
+        successes = timeouts = retries = 0
+        durations = []
+        # One pass for the counts and durations
+        for i in iterations:
+            if i.success:
+                successes += 1
+            if i.outcome == 'timeout':
+                timeouts += 1
+            elif i.outcome == 'needs_retry':
+                retries += 1
+            durations.append(i.duration_seconds)
+        # Nearest-rank percentiles on the exact values (a run has at most
+        # max_iterations entries, so sorting beats pulling in numpy)
+        durations.sort()
         p50_idx = int(len(durations) * 0.5)
         p95_idx = min(int(len(durations) * 0.95), len(durations) - 1)
 
@@ -342,12 +390,12 @@ class BeadSnapshot:
     ready: list[BeadInfo] = field(default_factory=list)
     in_progress: list[BeadInfo] = field(default_factory=list)
     closed: list[BeadInfo] = field(default_factory=list)
-    timestamp: str = ""
+    timestamp: str = ""  # ISO time; left empty unless a caller sets it
     _index: Optional[dict[str, BeadInfo]] = field(default=None, repr=False, compare=False)
-
-    def __post_init__(self):
-        if not self.timestamp:
-            self.timestamp = datetime.now().isoformat()
+    _ready_set: Optional[frozenset[str]] = field(default=None, repr=False, compare=False)
+    _ready_work_set: Optional[frozenset[str]] = field(default=None, repr=False, compare=False)
+    _in_progress_set: Optional[frozenset[str]] = field(default=None, repr=False, compare=False)
+    _closed_set: Optional[frozenset[str]] = field(default=None, repr=False, compare=False)
 
     def _build_index(self) -> dict[str, BeadInfo]:
         """Build dict mapping bead ID to BeadInfo across all lists."""
@@ -375,6 +423,34 @@ class BeadSnapshot:
     def closed_ids(self) -> list[str]:
         return [b.id for b in self.closed]
 
+    @property
+    def ready_set(self) -> frozenset[str]:
+        """Ready IDs as a frozenset, built once on first use for set diffs."""
+        if self._ready_set is None:
+            self._ready_set = frozenset(b.id for b in self.ready)
+        return self._ready_set
+
+    @property
+    def ready_work_set(self) -> frozenset[str]:
+        """Ready work IDs (excluding epics) as a frozenset, built once."""
+        if self._ready_work_set is None:
+            self._ready_work_set = frozenset(b.id for b in self.ready if b.issue_type != "epic")
+        return self._ready_work_set
+
+    @property
+    def in_progress_set(self) -> frozenset[str]:
+        """In-progress IDs as a frozenset, built once on first use."""
+        if self._in_progress_set is None:
+            self._in_progress_set = frozenset(b.id for b in self.in_progress)
+        return self._in_progress_set
+
+    @property
+    def closed_set(self) -> frozenset[str]:
+        """Closed IDs as a frozenset, built once on first use."""
+        if self._closed_set is None:
+            self._closed_set = frozenset(b.id for b in self.closed)
+        return self._closed_set
+
     def get_by_id(self, bead_id: str) -> Optional[BeadInfo]:
         """Look up a BeadInfo by ID across all lists. Uses lazy dict index for O(1) lookup."""
         if self._index is None:
@@ -395,10 +471,10 @@ class BeadDelta:
         newly_closed: beads in after.closed that weren't in before.closed
         newly_filed: beads in after.ready that weren't in any before list
         """
-        before_closed = set(before.closed_ids)
+        before_closed = before.closed_set
         newly_closed = [b for b in after.closed if b.id not in before_closed]
 
-        before_all = set(before.ready_ids + before.in_progress_ids + before.closed_ids)
+        before_all = before.ready_set | before.in_progress_set | before_closed
         newly_filed = [b for b in after.ready if b.id not in before_all]
 
         return cls(newly_closed=newly_closed, newly_filed=newly_filed)
@@ -495,6 +571,7 @@ class ActionRecord:
     success: bool            # True if no error
     timestamp: str           # ISO timestamp
     duration_ms: Optional[float] = None  # Duration in milliseconds (set on result)
+    _started: float = field(default_factory=time.monotonic, init=False, repr=False, compare=False)
 
     @classmethod
     def from_tool_use(cls, block: dict) -> 'ActionRecord':
@@ -546,6 +623,10 @@ class IterationResult:
     # Epics closed during this iteration (for branch merge in run_loop)
     closed_epics: list[str] = field(default_factory=list)
 
+    # Bead state at the end of the iteration, if still current (run_loop
+    # reuses it as the next iteration's snapshot instead of re-querying bd)
+    after_snapshot: Optional[BeadSnapshot] = field(default=None, repr=False, compare=False)
+
     @property
     def action_counts(self) -> dict[str, int]:
         """Count actions by tool name."""
@@ -601,6 +682,11 @@ class ProgressState:
     tasks_remaining: int
     started_at: datetime
     iterations: list
+    # Serialized recent completions, shared with run_loop so in-phase writes
+    # reuse them instead of re-serializing iterations
+    recent_iterations: Optional[deque] = None
+    epic_mode: Optional[str] = None
+    current_epic: Optional[str] = None
 
     # Intra-iteration progress fields
     current_phase: Optional[str] = None
@@ -658,6 +744,9 @@ class ProgressState:
             tasks_remaining=self.tasks_remaining,
             started_at=self.started_at,
             iterations=self.iterations,
+            recent_iterations=self.recent_iterations,
+            epic_mode=self.epic_mode,
+            current_epic=self.current_epic,
             current_phase=self.current_phase,
             phase_start_time=self.phase_start_time,
             current_action_count=self.current_action_count,
@@ -667,6 +756,45 @@ class ProgressState:
 
 # --- parsing.py ---
 
+# Patterns used on every iteration's output, compiled once at import.
+# SERVE_RESULT fields: one alternation so a buffer is walked once. Values
+# sit in lookaheads so a greedy next_step value never swallows a later key
+# (stream-json output joins the fields with escaped newlines).
+_SERVE_FIELD_RE = re.compile(
+    r"verdict:\s*(?=(APPROVED|NEEDS_CHANGES|BLOCKED|SKIPPED))"
+    r"|continue:\s*(?=(true|false))"
+    r"|blocking_issues:\s*(?=(\d+))"
+    r"|next_step:\s*(?=(\S+))",
+    re.IGNORECASE
+)
+# Gate for parse_serve_result; case-insensitive like the field pattern
+_VERDICT_KEY_RE = re.compile(r"verdict:", re.IGNORECASE)
+_INTENT_RE = re.compile(r"INTENT:\s*\n\s*(.+?)(?:\n\s*Goal:\s*(.+?))?(?:\n\n|\nBEFORE)", re.DOTALL)
+_BEFORE_AFTER_RE = re.compile(r"BEFORE\s*→\s*AFTER:\s*\n\s*(.+?)\s*→\s*(.+?)(?:\n|$)", re.IGNORECASE)
+
+# Serve feedback sections, parsed on every NEEDS_CHANGES retry
+_SUMMARY_RE = re.compile(
+    r"Summary:\s*\n\s*(.+?)(?:\n\n|\nAuto-fixed:|\nIssues|\nPositive)",
+    re.DOTALL | re.IGNORECASE
+)
+_ISSUES_TO_FILE_RE = re.compile(r"Issues to file[^\n]*:\s*\n((?:\s*-[^\n]+\n?)+)", re.IGNORECASE)
+_ISSUES_FOUND_RE = re.compile(r"Issues found:\s*\n", re.IGNORECASE)
+_POSITIVE_LINE_RE = re.compile(r"\nPositive", re.IGNORECASE)
+# Lines like: - [P1] "title" - description or - [major] description
+_ISSUE_LINE_RE = re.compile(
+    r'-\s*\[([^\]]+)\]\s*(?:"([^"]+)"\s*-\s*)?(.+?)(?=\n\s*-|\n\n|$)',
+    re.MULTILINE | re.DOTALL
+)
+# Structured sous-chef blocks: Severity / File/line / Issue / Suggestion.
+# Each field is searched separately within one Severity block; a single
+# DOTALL pattern with several lazy gaps backtracks exponentially when a
+# block lacks a field.
+_SEVERITY_FIELD_RE = re.compile(r"Severity:\s*(\w+)", re.IGNORECASE)
+_LOCATION_FIELD_RE = re.compile(r"(?:File/line:|Location:)\s*([^\n]+)", re.IGNORECASE)
+_ISSUE_FIELD_RE = re.compile(r"Issue:\s*([^\n]+)", re.IGNORECASE)
+_SUGGESTION_FIELD_RE = re.compile(r"Suggestion:\s*([^\n]+)", re.IGNORECASE)
+
+
 def parse_serve_result(output: str) -> Optional[ServeResult]:
     """Parse SERVE_RESULT block from serve phase output.
 
@@ -687,33 +815,48 @@ def parse_serve_result(output: str) -> Optional[ServeResult]:
         ServeResult with verdict, continue flag, next_step, and blocking_issues.
         Returns None if SERVE_RESULT block cannot be parsed.
     """
-    # Look for the SERVE_RESULT block
-    pattern = r"SERVE_RESULT\s*\n(?:│\s*)?verdict:\s*(\w+).*?(?:│\s*)?continue:\s*(true|false).*?(?:│\s*)?(?:next_step:\s*(\S+))?.*?(?:│\s*)?blocking_issues:\s*(\d+)"
-    match = re.search(pattern, output, re.DOTALL | re.IGNORECASE)
-
-    if match:
-        return ServeResult(
-            verdict=match.group(1).upper(),
-            continue_=match.group(2).lower() == "true",
-            next_step=match.group(3),
-            blocking_issues=int(match.group(4))
-        )
+    # Every accepted form carries a verdict field; skip the field scans
+    # entirely when it is absent
+    if not _VERDICT_KEY_RE.search(output):
+        return None
 
-    # Try simpler patterns for each field
-    verdict_match = re.search(r"verdict:\s*(APPROVED|NEEDS_CHANGES|BLOCKED|SKIPPED)", output, re.IGNORECASE)
-    if verdict_match:
-        continue_match = re.search(r"continue:\s*(true|false)", output, re.IGNORECASE)
-        blocking_match = re.search(r"blocking_issues:\s*(\d+)", output, re.IGNORECASE)
-        next_step_match = re.search(r"next_step:\s*(\S+)", output, re.IGNORECASE)
-
-        return ServeResult(
-            verdict=verdict_match.group(1).upper(),
-            continue_=continue_match.group(1).lower() == "true" if continue_match else True,
-            next_step=next_step_match.group(1) if next_step_match else None,
-            blocking_issues=int(blocking_match.group(1)) if blocking_match else 0
-        )
+    # Staged parse: the block's fields follow its anchor, so scan a short
+    # window there before falling back to the whole output
+    anchor = output.find("SERVE_RESULT")
+    if anchor >= 0:
+        result = _scan_serve_fields(output[anchor:anchor + SERVE_RESULT_WINDOW])
+        if result:
+            return result
+
+    return _scan_serve_fields(output)
 
-    return None
+
+def _scan_serve_fields(text: str) -> Optional[ServeResult]:
+    """Build a ServeResult from the first occurrence of each field in text.
+
+    Returns None if text has no valid verdict. Missing optional fields
+    default to continue=True, next_step=None, blocking_issues=0.
+    """
+    fields: list[Optional[str]] = [None, None, None, None]
+    found = 0
+    for field_match in _SERVE_FIELD_RE.finditer(text):
+        slot = field_match.lastindex - 1
+        if fields[slot] is None:
+            fields[slot] = field_match.group(slot + 1)
+            found += 1
+            if found == 4:
+                break
+
+    verdict, continue_value, blocking, next_step = fields
+    if verdict is None:
+        return None
+
+    return ServeResult(
+        verdict=verdict.upper(),
+        continue_=continue_value.lower() == "true" if continue_value else True,
+        next_step=next_step,
+        blocking_issues=int(blocking) if blocking else 0
+    )
 
 
 def parse_serve_feedback(output: str, task_id: Optional[str] = None, task_title: Optional[str] = None, attempt: int = 1) -> Optional[ServeFeedback]:
@@ -728,11 +871,7 @@ def parse_serve_feedback(output: str, task_id: Optional[str] = None, task_title:
     """
     # Extract summary - look for Summary: section
     summary = ""
-    summary_match = re.search(
-        r"Summary:\s*\n\s*(.+?)(?:\n\n|\nAuto-fixed:|\nIssues|\nPositive)",
-        output,
-        re.DOTALL | re.IGNORECASE
-    )
+    summary_match = _SUMMARY_RE.search(output)
     if summary_match:
         summary = summary_match.group(1).strip()
 
@@ -741,29 +880,16 @@ def parse_serve_feedback(output: str, task_id: Optional[str] = None, task_title:
 
     # Pattern 1: Issues to file in /tidy section with severity markers
     # e.g., "- [P1] "title" - description" or "- [major] file:line - issue"
-    issue_section_match = re.search(
-        r"Issues to file[^\n]*:\s*\n((?:\s*-[^\n]+\n?)+)",
-        output,
-        re.IGNORECASE
-    )
+    issue_section_match = _ISSUES_TO_FILE_RE.search(output)
 
     # Pattern 2: Issues found section from sous-chef
     # e.g., "Issues found:\n  - Severity: major\n    File/line: src/foo.py:42\n    Issue: desc"
-    issues_found_match = re.search(
-        r"Issues found:\s*\n((?:.*?\n)+?)(?:\n\n|Positive|$)",
-        output,
-        re.DOTALL | re.IGNORECASE
-    )
+    issues_found_text = _find_issues_found_section(output)
 
     # Parse simple issue list (Pattern 1)
     if issue_section_match:
         issue_text = issue_section_match.group(1)
-        # Match lines like: - [P1] "title" - description or - [major] description
-        issue_pattern = re.compile(
-            r'-\s*\[([^\]]+)\]\s*(?:"([^"]+)"\s*-\s*)?(.+?)(?=\n\s*-|\n\n|$)',
-            re.MULTILINE | re.DOTALL
-        )
-        for match in issue_pattern.finditer(issue_text):
+        for match in _ISSUE_LINE_RE.finditer(issue_text):
             severity_raw = match.group(1).lower()
             # Normalize severity: P1/P2 -> major, P3 -> minor, P4 -> nit
             if severity_raw in ('p1', 'p2', 'critical'):
@@ -786,21 +912,8 @@ def parse_serve_feedback(output: str, task_id: Optional[str] = None, task_title:
             ))
 
     # Parse detailed issue format (Pattern 2) from sous-chef
-    if issues_found_match and not issues:
-        issue_text = issues_found_match.group(1)
-        # Look for structured issue blocks
-        severity_matches = re.findall(
-            r"Severity:\s*(\w+).*?(?:File/line:|Location:)\s*([^\n]+).*?Issue:\s*([^\n]+)(?:.*?Suggestion:\s*([^\n]+))?",
-            issue_text,
-            re.DOTALL | re.IGNORECASE
-        )
-        for sev, loc, prob, sugg in severity_matches:
-            issues.append(ServeFeedbackIssue(
-                severity=sev.lower(),
-                location=loc.strip(),
-                problem=prob.strip(),
-                suggestion=sugg.strip() if sugg else None
-            ))
+    if issues_found_text and not issues:
+        issues.extend(_parse_issue_blocks(issues_found_text))
 
     # If we found a summary or issues, create feedback
     if summary or issues:
@@ -820,6 +933,57 @@ def parse_serve_feedback(output: str, task_id: Optional[str] = None, task_title:
     return None
 
 
+def _find_issues_found_section(output: str) -> Optional[str]:
+    """Return the text of the "Issues found:" section, or None if absent.
+
+    The section runs to two consecutive blank lines, a line starting with
+    "Positive", or the end of output, whichever comes first. Located with
+    plain substring searches so the cost stays linear in the output size.
+
+    A final line with no trailing newline is part of the section. (The
+    earlier regex dropped it, losing the last field of output that ends
+    without a newline.)
+    """
+    header = _ISSUES_FOUND_RE.search(output)
+    if not header:
+        return None
+    start = header.end()
+    end = len(output)
+    blank = output.find("\n\n\n", start)
+    if blank >= 0:
+        end = blank + 1
+    positive = _POSITIVE_LINE_RE.search(output, start, end)
+    if positive:
+        end = positive.start() + 1
+    return output[start:end]
+
+
+def _parse_issue_blocks(text: str) -> list[ServeFeedbackIssue]:
+    """Parse sous-chef issue blocks (Severity, File/line, Issue, Suggestion).
+
+    Each block spans from one "Severity:" to the next. Blocks without a
+    location or issue description are skipped.
+    """
+    issues: list[ServeFeedbackIssue] = []
+    severities = list(_SEVERITY_FIELD_RE.finditer(text))
+    for n, severity in enumerate(severities):
+        block_end = severities[n + 1].start() if n + 1 < len(severities) else len(text)
+        location = _LOCATION_FIELD_RE.search(text, severity.end(), block_end)
+        if not location:
+            continue
+        problem = _ISSUE_FIELD_RE.search(text, location.end(), block_end)
+        if not problem:
+            continue
+        suggestion = _SUGGESTION_FIELD_RE.search(text, problem.end(), block_end)
+        issues.append(ServeFeedbackIssue(
+            severity=severity.group(1).lower(),
+            location=location.group(1).strip(),
+            problem=problem.group(1).strip(),
+            suggestion=suggestion.group(1).strip() if suggestion else None
+        ))
+    return issues
+
+
 def parse_intent_block(output: str) -> tuple[Optional[str], Optional[str], Optional[str]]:
     """Parse INTENT and BEFORE -> AFTER from cook output.
 
@@ -837,23 +1001,15 @@ def parse_intent_block(output: str) -> tuple[Optional[str], Optional[str], Optio
     before_state = None
     after_state = None
 
-    # Parse INTENT block
-    intent_match = re.search(
-        r"INTENT:\s*\n\s*(.+?)(?:\n\s*Goal:\s*(.+?))?(?:\n\n|\nBEFORE)",
-        output,
-        re.DOTALL
-    )
+    # Parse INTENT block (substring checks gate each scan)
+    intent_match = _INTENT_RE.search(output) if "INTENT:" in output else None
     if intent_match:
         intent = intent_match.group(1).strip()
         if intent_match.group(2):
             intent = f"{intent} | Goal: {intent_match.group(2).strip()}"
 
     # Parse BEFORE -> AFTER block
-    before_after_match = re.search(
-        r"BEFORE\s*→\s*AFTER:\s*\n\s*(.+?)\s*→\s*(.+?)(?:\n|$)",
-        output,
-        re.IGNORECASE
-    )
+    before_after_match = _BEFORE_AFTER_RE.search(output) if "→" in output else None
     if before_after_match:
         before_state = before_after_match.group(1).strip()
         after_state = before_after_match.group(2).strip()
@@ -861,6 +1017,35 @@ def parse_intent_block(output: str) -> tuple[Optional[str], Optional[str], Optio
     return intent, before_state, after_state
 
 
+_json_loads: Optional[Callable[[str], Any]] = None
+
+
+def loads_json(text: str) -> Any:
+    """Parse JSON text, using orjson when it is installed.
+
+    orjson is resolved through importlib on first use rather than a
+    top-level import, so it stays optional in the bundled script (which
+    hoists every import statement). Its decode error subclasses
+    json.JSONDecodeError, so callers catch the same exceptions either way.
+
+    Args:
+        text: JSON document, typically stdout from a bd --json command.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON.
+    """
+    global _json_loads
+    if _json_loads is None:
+        try:
+            _json_loads = importlib.import_module("orjson").loads
+        except ImportError:
+            _json_loads = json.loads
+    return _json_loads(text)
+
+
 def parse_stream_json_event(line: str) -> Optional[dict]:
     """Parse a single line of Claude's stream-json output format.
 
@@ -979,12 +1164,8 @@ def update_action_from_result(
             tool_use_id = block.get("tool_use_id", "")
             if tool_use_id in pending_actions:
                 action = pending_actions[tool_use_id]
-                # Compute duration from start timestamp
-                try:
-                    start = datetime.fromisoformat(action.timestamp)
-                    action.duration_ms = (datetime.now() - start).total_seconds() * 1000
-                except (ValueError, TypeError):
-                    pass
+                # Compute duration on the monotonic clock (immune to wall-clock steps)
+                action.duration_ms = (time.monotonic() - action._started) * 1000
                 # Check for error
                 is_error = block.get("is_error", False)
                 action.success = not is_error
@@ -1012,6 +1193,25 @@ def update_action_from_result(
 
 # --- phase.py ---
 
+# Absolute paths of executables already looked up on PATH (bd, git, ...)
+_resolved_executables: dict[str, str] = {}
+
+
+def _resolve_executable(name: str) -> str:
+    """Return the absolute path for name, looking it up on PATH only once.
+
+    Falls back to the bare name (and skips caching) when it isn't found, so
+    subprocess raises the usual FileNotFoundError.
+    """
+    path = _resolved_executables.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is None:
+            return name
+        _resolved_executables[name] = path
+    return path
+
+
 def check_idle(last_action_time: Optional[datetime], idle_timeout: int) -> bool:
     """Check if the phase has been idle beyond the threshold.
 
@@ -1061,12 +1261,23 @@ def run_subprocess(cmd: list, timeout: int, cwd: Path) -> subprocess.CompletedPr
 
     Raises:
         subprocess.TimeoutExpired: If command doesn't complete within timeout.
+
+    Note:
+        The executable is resolved to an absolute path once per process, and
+        stdin is closed (DEVNULL) since none of these tools read it. When cwd
+        is already the process working directory it is not passed on, which
+        keeps the child off the chdir path (and lets CPython use posix_spawn
+        where it supports it).
     """
     logger.debug(f"Running: {' '.join(cmd)} (timeout={timeout}s)")
-    start = time.time()
+    start = time.monotonic()
+    run_cwd = None if os.fspath(cwd) == os.getcwd() else cwd
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd, timeout=timeout)
-        logger.debug(f"Completed in {time.time()-start:.1f}s, exit={result.returncode}")
+        result = subprocess.run(
+            [_resolve_executable(cmd[0]), *cmd[1:]],
+            stdin=subprocess.DEVNULL, capture_output=True, text=True, cwd=run_cwd, timeout=timeout
+        )
+        logger.debug(f"Completed in {time.monotonic()-start:.1f}s, exit={result.returncode}")
         return result
     except subprocess.TimeoutExpired:
         logger.warning(f"Timeout after {timeout}s: {' '.join(cmd)}")
@@ -1142,7 +1353,7 @@ def run_phase(
         skill = f"{skill} {args}"
 
     logger.debug(f"Running phase {phase}: claude -p '{skill}' (timeout={timeout}s)")
-    start_time = time.time()
+    start_time = time.monotonic()
 
     actions: list[ActionRecord] = []
     pending_actions: dict[str, ActionRecord] = {}
@@ -1165,9 +1376,9 @@ def run_phase(
             cwd=cwd
         )
 
-        deadline = time.time() + timeout
+        deadline = time.monotonic() + timeout
         while True:
-            remaining = deadline - time.time()
+            remaining = deadline - time.monotonic()
             if remaining <= 0:
                 # Graceful termination: SIGTERM first, then SIGKILL as fallback
                 logger.debug(f"Phase {phase} timeout - sending SIGTERM")
@@ -1253,15 +1464,13 @@ def run_phase(
                             logger.warning(f"Phase {phase} idle for {idle_seconds:.0f}s (threshold: {idle_timeout}s)")
                             idle_warned = True
 
-        # Read any remaining output
-        remaining_out = process.stdout.read()
-        if remaining_out:
-            output_lines.extend(remaining_out.splitlines(keepends=True))
+        # Drain any remaining output line by line (no second full-size copy)
+        output_lines.extend(process.stdout)
         process.wait()
         exit_code = process.returncode
 
     except subprocess.TimeoutExpired:
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         logger.warning(f"Phase {phase} timed out after {duration:.1f}s")
         return PhaseResult(
             phase=phase,
@@ -1274,7 +1483,7 @@ def run_phase(
             error=f"Timeout after {timeout}s"
         )
     except Exception as e:
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         logger.error(f"Phase {phase} crashed: {e}")
         return PhaseResult(
             phase=phase,
@@ -1287,7 +1496,7 @@ def run_phase(
             error=str(e)
         )
 
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     output = "".join(output_lines)
     # Phase is successful if exit code is 0 OR if it signaled early completion
     early_completion = "phase_complete" in signals
@@ -1310,6 +1519,30 @@ def run_phase(
 
 # --- iteration.py ---
 
+# Status indicator per iteration outcome for print_human_iteration
+_STATUS_MAP = {
+    "completed": "[OK]",
+    "needs_retry": "[RETRY]",
+    "blocked": "[BLOCKED]",
+    "crashed": "[CRASH]",
+    "timeout": "[TIMEOUT]",
+    "no_work": "[DONE]",
+    "no_actionable_work": "[IDLE]"
+}
+
+# Bead titles seen during this run (titles don't change while the loop runs)
+_title_cache: dict[str, str] = {}
+
+# Recent snapshots keyed by (cwd, include_closed): (db mtimes, taken_at, snapshot)
+_snapshot_cache: dict[tuple[str, bool], tuple[tuple, float, BeadSnapshot]] = {}
+
+# Files in .beads whose modification means the bead data changed
+_BEADS_DATA_SUFFIXES = (".db", ".db-wal", ".jsonl")
+
+# Latest commit per repo: cwd -> (HEAD signature, short hash)
+_commit_cache: dict[str, tuple[tuple, str]] = {}
+
+
 def atomic_write(path: Path, content: str) -> None:
     """Write file atomically via temp file + rename.
 
@@ -1373,16 +1606,7 @@ def print_phase_progress(phase: str, status: str, duration: float = 0, extra: st
 def print_human_iteration(result: IterationResult, retries: int = 0):
     """Print iteration result in human-readable format."""
     # Status indicator
-    status_map = {
-        "completed": "[OK]",
-        "needs_retry": "[RETRY]",
-        "blocked": "[BLOCKED]",
-        "crashed": "[CRASH]",
-        "timeout": "[TIMEOUT]",
-        "no_work": "[DONE]",
-        "no_actionable_work": "[IDLE]"
-    }
-    status = status_map.get(result.outcome, "[?]")
+    status = _STATUS_MAP.get(result.outcome, "[?]")
 
     task_info = f"{result.task_id}: {result.task_title}" if result.task_id else "Unknown task"
     print(f"\n{status} {task_info}")
@@ -1515,29 +1739,38 @@ def detect_worked_task(
         Task ID that was worked on, or None if no task state change detected.
     """
     # Check for task that moved from ready to in_progress
-    new_in_progress = set(after.in_progress_ids) - set(before.in_progress_ids)
+    new_in_progress = after.in_progress_set - before.in_progress_set
     if new_in_progress:
         if target_task_id and target_task_id in new_in_progress:
             return target_task_id
         return next(iter(new_in_progress))
 
     # Check for task that moved from ready to closed
-    new_closed = set(after.closed_ids) - set(before.closed_ids)
-    disappeared_ready = set(before.ready_ids) - set(after.ready_ids)
+    new_closed = after.closed_set - before.closed_set
+    disappeared_ready = before.ready_set - after.ready_set
     worked = new_closed & disappeared_ready
     if worked:
         return _prefer_target_or_deepest(worked, target_task_id)
 
     # Check for any task that was in_progress and is now closed
-    was_in_progress = set(before.in_progress_ids)
-    now_closed = set(after.closed_ids)
-    completed = was_in_progress & now_closed
+    completed = before.in_progress_set & after.closed_set
     if completed:
         return _prefer_target_or_deepest(completed, target_task_id)
 
     return None
 
 
+def clear_bead_caches() -> None:
+    """Drop cached bead titles and snapshots.
+
+    run_loop calls this on start so a long-lived process (or one driving
+    several projects, whose bead IDs may overlap) never serves a title
+    cached by an earlier run.
+    """
+    _title_cache.clear()
+    _snapshot_cache.clear()
+
+
 def get_task_title(task_id: str, cwd: Path) -> Optional[str]:
     """Get the title for a task ID from bead database.
 
@@ -1547,14 +1780,20 @@ def get_task_title(task_id: str, cwd: Path) -> Optional[str]:
 
     Returns:
         Task title string, or None if task not found or query fails.
+        Titles are cached until clear_bead_caches() (called when a loop starts).
     """
+    if task_id in _title_cache:
+        return _title_cache[task_id]
     try:
         result = run_subprocess(["bd", "show", task_id, "--json"], BD_COMMAND_TIMEOUT, cwd)
         if result.returncode == 0 and result.stdout.strip():
-            data = json.loads(result.stdout)
+            data = loads_json(result.stdout)
             issue = parse_bd_json_item(data)
             if issue:
-                return issue.get("title")
+                title = issue.get("title")
+                if title:
+                    _title_cache[task_id] = title
+                return title
     except subprocess.TimeoutExpired:
         logger.warning(f"Timeout getting title for {task_id}")
     except json.JSONDecodeError as e:
@@ -1621,7 +1860,7 @@ def find_epic_ancestor(bead: BeadInfo, snapshot: BeadSnapshot, cwd: Path) -> Opt
                 result = run_subprocess(["bd", "show", parent_id, "--json"], BD_COMMAND_TIMEOUT, cwd)
                 if result.returncode != 0:
                     break
-                data = json.loads(result.stdout)
+                data = loads_json(result.stdout)
                 issue = parse_bd_json_item(data)
                 if not issue:
                     break
@@ -1676,7 +1915,7 @@ def is_descendant_of_epic(bead: BeadInfo, epic_id: str, snapshot: BeadSnapshot,
                 result = run_subprocess(["bd", "show", parent_id, "--json"], BD_COMMAND_TIMEOUT, cwd)
                 if result.returncode != 0:
                     break
-                data = json.loads(result.stdout)
+                data = loads_json(result.stdout)
                 issue = parse_bd_json_item(data)
                 if not issue:
                     break
@@ -1739,7 +1978,7 @@ def build_epic_ancestor_map(snapshot: BeadSnapshot, cwd: Path) -> dict[str, Opti
                     )
                     if result.returncode != 0:
                         break
-                    data = json.loads(result.stdout)
+                    data = loads_json(result.stdout)
                     issue = parse_bd_json_item(data)
                     if not issue:
                         break
@@ -1777,15 +2016,81 @@ def _parse_bead_info(issue: dict) -> BeadInfo:
     )
 
 
-def get_bead_snapshot(cwd: Path) -> BeadSnapshot:
+def _query_bead_list(args: list[str], label: str, cwd: Path) -> list[BeadInfo]:
+    """Run one bd list-style query and parse its issues into BeadInfo objects.
+
+    Errors are logged rather than raised so a failed query leaves the rest
+    of the snapshot intact.
+
+    Args:
+        args: bd arguments (without the leading "bd").
+        label: Short description of the query for log messages.
+        cwd: Working directory containing the .beads project.
+
+    Returns:
+        List of BeadInfo, or empty list if the query fails.
+    """
+    try:
+        result = run_subprocess(["bd", *args], BD_COMMAND_TIMEOUT, cwd)
+        if result.returncode == 0:
+            # Check the first non-blank char instead of strip()-copying the
+            # whole payload; anything but a list/object can't parse anyway
+            if result.stdout[:64].lstrip()[:1] not in ("[", "{"):
+                if result.stdout.strip():
+                    logger.debug(f"Ignoring non-JSON {label} output")
+                return []
+            issues = loads_json(result.stdout)
+            return [_parse_bead_info(i) for i in issues if isinstance(i, dict)]
+    except subprocess.TimeoutExpired:
+        err = LoopError.from_timeout(f"bd {' '.join(args)}", BD_COMMAND_TIMEOUT)
+        logger.warning(str(err))
+    except json.JSONDecodeError as e:
+        err = LoopError.from_json_decode(f"{label} output", e)
+        logger.warning(str(err))
+    except Exception as e:
+        logger.debug(f"Error getting {label}: {e}")
+    return []
+
+
+def _beads_data_mtimes(cwd: Path) -> Optional[tuple]:
+    """Stat the bead database files under cwd/.beads.
+
+    Args:
+        cwd: Working directory containing the .beads project.
+
+    Returns:
+        Sorted tuple of (filename, mtime_ns, size), or None if .beads is
+        missing or unreadable (which disables snapshot caching).
+    """
+    mtimes = []
+    try:
+        with os.scandir(cwd / ".beads") as entries:
+            for entry in entries:
+                if entry.name.endswith(_BEADS_DATA_SUFFIXES):
+                    stat = entry.stat()
+                    mtimes.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    except OSError:
+        return None
+    return tuple(sorted(mtimes))
+
+
+def get_bead_snapshot(cwd: Path, include_closed: bool = True) -> BeadSnapshot:
     """Capture current state of beads (issues) for before/after comparison.
 
     Queries bd for ready, in_progress, and recently closed issues. The snapshot
     enables detecting which task was worked on by comparing state before and
     after a loop iteration. Stores full BeadInfo metadata from the JSON response.
 
+    The three queries are independent, so they run concurrently and the
+    snapshot costs one bd round-trip instead of three. A snapshot taken less
+    than BEAD_SNAPSHOT_CACHE_TTL seconds ago is returned as-is while the
+    .beads database files are unmodified.
+
     Args:
         cwd: Working directory containing the .beads project.
+        include_closed: Query recently closed beads. Closed IDs only matter
+            for before/after diffs, so callers that just count ready work
+            can pass False to skip that bd call.
 
     Returns:
         BeadSnapshot with BeadInfo lists. Use properties like .ready_ids,
@@ -1795,56 +2100,37 @@ def get_bead_snapshot(cwd: Path) -> BeadSnapshot:
         Errors from bd commands are logged but don't raise exceptions.
         Returns partially-populated snapshot on individual query failures.
     """
-    snapshot = BeadSnapshot()
-
-    # Get all ready items (full metadata)
-    cmd_ready = "bd ready --json"
-    try:
-        result = run_subprocess(["bd", "ready", "--json"], BD_COMMAND_TIMEOUT, cwd)
-        if result.returncode == 0 and result.stdout.strip():
-            issues = json.loads(result.stdout)
-            snapshot.ready = [_parse_bead_info(i) for i in issues if isinstance(i, dict)]
-    except subprocess.TimeoutExpired:
-        err = LoopError.from_timeout(cmd_ready, BD_COMMAND_TIMEOUT)
-        logger.warning(str(err))
-    except json.JSONDecodeError as e:
-        err = LoopError.from_json_decode("bd ready output", e)
-        logger.warning(str(err))
-    except Exception as e:
-        logger.debug(f"Error getting ready items: {e}")
-
-    # Get in_progress tasks
-    cmd_in_progress = "bd list --status=in_progress --json"
-    try:
-        result = run_subprocess(["bd", "list", "--status=in_progress", "--json"], BD_COMMAND_TIMEOUT, cwd)
-        if result.returncode == 0 and result.stdout.strip():
-            issues = json.loads(result.stdout)
-            snapshot.in_progress = [_parse_bead_info(i) for i in issues if isinstance(i, dict)]
-    except subprocess.TimeoutExpired:
-        err = LoopError.from_timeout(cmd_in_progress, BD_COMMAND_TIMEOUT)
-        logger.warning(str(err))
-    except json.JSONDecodeError as e:
-        err = LoopError.from_json_decode("bd list in_progress output", e)
-        logger.warning(str(err))
-    except Exception as e:
-        logger.debug(f"Error getting in_progress tasks: {e}")
-
-    # Get recently closed tasks (limited for performance)
-    cmd_closed = f"bd list --status=closed --limit={CLOSED_TASKS_QUERY_LIMIT} --json"
-    try:
-        result = run_subprocess(["bd", "list", "--status=closed", f"--limit={CLOSED_TASKS_QUERY_LIMIT}", "--json"], BD_COMMAND_TIMEOUT, cwd)
-        if result.returncode == 0 and result.stdout.strip():
-            issues = json.loads(result.stdout)
-            snapshot.closed = [_parse_bead_info(i) for i in issues if isinstance(i, dict)]
-    except subprocess.TimeoutExpired:
-        err = LoopError.from_timeout(cmd_closed, BD_COMMAND_TIMEOUT)
-        logger.warning(str(err))
-    except json.JSONDecodeError as e:
-        err = LoopError.from_json_decode("bd list closed output", e)
-        logger.warning(str(err))
-    except Exception as e:
-        logger.debug(f"Error getting closed tasks: {e}")
+    cache_key = (str(cwd), include_closed)
+    # Stat before querying so a write racing the queries invalidates the entry
+    mtimes = _beads_data_mtimes(cwd)
+    if mtimes is not None:
+        cached = _snapshot_cache.get(cache_key)
+        if cached and cached[0] == mtimes and time.monotonic() - cached[1] < BEAD_SNAPSHOT_CACHE_TTL:
+            logger.debug("Reusing bead snapshot (beads database unchanged)")
+            return cached[2]
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        ready = pool.submit(_query_bead_list, ["ready", "--json"], "bd ready", cwd)
+        in_progress = pool.submit(
+            _query_bead_list, ["list", "--status=in_progress", "--json"], "bd list in_progress", cwd
+        )
+        closed = pool.submit(
+            _query_bead_list,
+            ["list", "--status=closed", f"--limit={CLOSED_TASKS_QUERY_LIMIT}", "--json"],
+            "bd list closed", cwd
+        ) if include_closed else None
+        snapshot = BeadSnapshot(
+            ready=ready.result(),
+            in_progress=in_progress.result(),
+            closed=closed.result() if closed else [],
+        )
 
+    # Seed the title cache so later get_task_title calls skip bd show
+    for bead in snapshot.ready + snapshot.in_progress + snapshot.closed:
+        if bead.title:
+            _title_cache[bead.id] = bead.title
+    if mtimes is not None:
+        _snapshot_cache[cache_key] = (mtimes, time.monotonic(), snapshot)
     return snapshot
 
 
@@ -1866,7 +2152,7 @@ def get_task_info(task_id: str, cwd: Path) -> Optional[dict]:
     try:
         result = run_subprocess(["bd", "show", task_id, "--json"], GIT_COMMAND_TIMEOUT, cwd)
         if result.returncode == 0 and result.stdout.strip():
-            data = json.loads(result.stdout)
+            data = loads_json(result.stdout)
             return parse_bd_json_item(data)
     except subprocess.TimeoutExpired:
         err = LoopError.from_timeout(cmd, GIT_COMMAND_TIMEOUT, task_id=task_id)
@@ -1900,7 +2186,7 @@ def get_children(parent_id: str, cwd: Path) -> list[dict]:
             BD_COMMAND_TIMEOUT, cwd
         )
         if result.returncode == 0 and result.stdout.strip():
-            children = json.loads(result.stdout)
+            children = loads_json(result.stdout)
             if isinstance(children, list):
                 return [c for c in children if isinstance(c, dict)]
     except subprocess.TimeoutExpired:
@@ -1985,11 +2271,52 @@ def _get_title_from_snapshot_or_cache(
     return None
 
 
+def _git_head_signature(cwd: Path) -> Optional[tuple]:
+    """Fingerprint what HEAD resolves to without running git.
+
+    A commit rewrites the branch ref (loose or packed), not the HEAD
+    symref itself, so the signature covers HEAD's content plus the stat
+    of both places the ref can live. Reftable repositories keep refs in
+    .git/reftable/ and leave HEAD as a placeholder, so they aren't
+    fingerprinted.
+
+    Args:
+        cwd: Working directory of the git repository.
+
+    Returns:
+        Tuple that changes whenever HEAD may point at a new commit, or None
+        if .git isn't a plain directory (worktrees, submodules) or uses the
+        reftable ref format.
+    """
+    git_dir = cwd / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    if (git_dir / "reftable").exists():
+        return None
+    paths = [git_dir / "HEAD", git_dir / "packed-refs"]
+    if head.startswith("ref: "):
+        paths.append(git_dir / head[5:])
+    signature: list = [head]
+    for path in paths:
+        try:
+            stat = path.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+        except OSError:
+            return None
+    return tuple(signature)
+
+
 def get_latest_commit(cwd: Path) -> Optional[str]:
     """Get the short hash of the latest git commit.
 
     Used to record which commit was created by the tidy phase for
-    traceability in iteration results and status reports.
+    traceability in iteration results and status reports. The hash is
+    cached per repository and reused until HEAD or the branch ref changes,
+    so iterations that made no commit skip the git call.
 
     Args:
         cwd: Working directory of the git repository.
@@ -1997,10 +2324,17 @@ def get_latest_commit(cwd: Path) -> Optional[str]:
     Returns:
         Short commit hash (e.g., "a1b2c3d"), or None if git command fails.
     """
+    signature = _git_head_signature(cwd)
+    cached = _commit_cache.get(str(cwd))
+    if signature is not None and cached and cached[0] == signature:
+        return cached[1]
     try:
         result = run_subprocess(["git", "log", "-1", "--format=%h"], GIT_COMMAND_TIMEOUT, cwd)
         if result.returncode == 0:
-            return result.stdout.strip()
+            commit = result.stdout.strip()
+            if signature is not None and commit:
+                _commit_cache[str(cwd)] = (signature, commit)
+            return commit
     except Exception as e:
         logger.debug(f"Error getting latest commit: {e}")
     return None
@@ -2050,7 +2384,7 @@ def get_epic_for_task(task_id: str, cwd: Path) -> Optional[str]:
             result = run_subprocess(["bd", "show", current_id, "--json"], BD_COMMAND_TIMEOUT, cwd)
             if result.returncode != 0:
                 return None
-            data = json.loads(result.stdout)
+            data = loads_json(result.stdout)
             issue = parse_bd_json_item(data)
             if not issue:
                 return None
@@ -2115,7 +2449,7 @@ def is_first_epic_work(epic_id: str, cwd: Path) -> bool:
                 BD_COMMAND_TIMEOUT, cwd
             )
             if result.returncode == 0 and result.stdout.strip():
-                data = json.loads(result.stdout)
+                data = loads_json(result.stdout)
                 if data:
                     return False
         except (subprocess.TimeoutExpired, json.JSONDecodeError) as e:
@@ -2155,9 +2489,9 @@ def check_task_completed(
         definitive_signals.extend(streamed_signals)
 
     # DEFINITIVE: Bead state - task moved to closed
-    new_closed = set(after.closed_ids) - set(before.closed_ids)
-    # Use ready_work_ids for consistency with loop focus (tasks + features, not epics)
-    disappeared = set(before.ready_work_ids) - set(after.ready_work_ids) - set(after.in_progress_ids)
+    new_closed = after.closed_set - before.closed_set
+    # Use ready work for consistency with loop focus (tasks + features, not epics)
+    disappeared = before.ready_work_set - after.ready_work_set - after.in_progress_set
     if new_closed or disappeared:
         definitive_signals.append("bead_closed")
 
@@ -2166,7 +2500,7 @@ def check_task_completed(
         try:
             result = run_subprocess(["bd", "show", task_id, "--json"], GIT_COMMAND_TIMEOUT, cwd)
             if result.returncode == 0 and result.stdout.strip():
-                task_data = parse_bd_json_item(json.loads(result.stdout))
+                task_data = parse_bd_json_item(loads_json(result.stdout))
                 if isinstance(task_data, dict) and task_data.get("status") == "closed":
                     definitive_signals.append("bd_status_closed")
         except subprocess.TimeoutExpired:
@@ -2323,7 +2657,7 @@ def get_epic_summary(epic_id: str, cwd: Path) -> dict:
     try:
         result = run_subprocess(["bd", "show", epic_id, "--json"], GIT_COMMAND_TIMEOUT, cwd)
         if result.returncode == 0 and result.stdout.strip():
-            epic = parse_bd_json_item(json.loads(result.stdout))
+            epic = parse_bd_json_item(loads_json(result.stdout))
             if epic:
                 epic_data["title"] = epic.get("title")
                 epic_data["description"] = epic.get("description")
@@ -2339,7 +2673,7 @@ def get_epic_summary(epic_id: str, cwd: Path) -> dict:
             BD_COMMAND_TIMEOUT, cwd
         )
         if result.returncode == 0 and result.stdout.strip():
-            children = json.loads(result.stdout)
+            children = loads_json(result.stdout)
             epic_data["children"] = [
                 {"id": c.get("id"), "title": c.get("title"), "issue_type": c.get("issue_type")}
                 for c in children if isinstance(c, dict)
@@ -2387,7 +2721,7 @@ def detect_eligible_epics(cwd: Path) -> list[str]:
         if result.returncode != 0 or not result.stdout.strip():
             return []
 
-        eligible = json.loads(result.stdout)
+        eligible = loads_json(result.stdout)
         if not eligible:
             return []
 
@@ -2554,7 +2888,7 @@ def run_iteration(
         idle_action: Action on idle - "warn" or "terminate"
         before_snapshot: Optional pre-captured snapshot (avoids redundant bd query)
     """
-    start_time = datetime.now()
+    start_time = time.monotonic()
     logger.info(f"Starting iteration {iteration}/{max_iterations}")
     closed_epic_ids: list[str] = []
 
@@ -2642,7 +2976,7 @@ def run_iteration(
                     print_phase_progress("cook", "error", cook_result.duration_seconds, "timeout")
                 logger.warning(f"Cook phase timed out on attempt {cook_attempts}")
                 if cook_attempts > max_cook_retries:
-                    duration = (datetime.now() - start_time).total_seconds()
+                    duration = time.monotonic() - start_time
                     # Reuse after_cook snapshot from above
                     return IterationResult(
                         iteration=iteration,
@@ -2658,7 +2992,8 @@ def run_iteration(
                         after_ready=len(after_cook.ready_ids),
                         after_in_progress=len(after_cook.in_progress_ids),
                         actions=all_actions,
-                        delta=BeadDelta.compute(before, after_cook)
+                        delta=BeadDelta.compute(before, after_cook),
+                        after_snapshot=after_cook
                     )
                 continue
 
@@ -2677,7 +3012,7 @@ def run_iteration(
             if not json_output:
                 print_phase_progress("cook", "done", cook_result.duration_seconds, "IDLE")
             logger.info("Cook found no actionable work (KITCHEN_IDLE)")
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.monotonic() - start_time
             # State unchanged since no work was done - reuse before snapshot values
             return IterationResult(
                 iteration=iteration,
@@ -2774,7 +3109,7 @@ def run_iteration(
                     print_phase_progress("serve", "done", serve_result.duration_seconds,
                                        f"{_action_dots(len(serve_result.actions))}{len(serve_result.actions)} actions, BLOCKED")
                 logger.warning("Serve returned BLOCKED verdict")
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = time.monotonic() - start_time
                 after = get_bead_snapshot(cwd)
                 return IterationResult(
                     iteration=iteration,
@@ -2790,7 +3125,8 @@ def run_iteration(
                     after_ready=len(after.ready_ids),
                     after_in_progress=len(after.in_progress_ids),
                     actions=all_actions,
-                    delta=BeadDelta.compute(before, after)
+                    delta=BeadDelta.compute(before, after),
+                    after_snapshot=after
                 )
             elif serve_verdict == "SKIPPED":
                 if not json_output:
@@ -2834,7 +3170,7 @@ def run_iteration(
                     print_phase_progress("serve", "done", serve_result.duration_seconds,
                                        f"{_action_dots(len(serve_result.actions))}{len(serve_result.actions)} actions, BLOCKED")
                 logger.warning("Serve returned BLOCKED verdict (from signal)")
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = time.monotonic() - start_time
                 after = get_bead_snapshot(cwd)
                 return IterationResult(
                     iteration=iteration,
@@ -2850,7 +3186,8 @@ def run_iteration(
                     after_ready=len(after.ready_ids),
                     after_in_progress=len(after.in_progress_ids),
                     actions=all_actions,
-                    delta=BeadDelta.compute(before, after)
+                    delta=BeadDelta.compute(before, after),
+                    after_snapshot=after
                 )
             else:
                 # No verdict parsed and no signals detected - retry full cook→serve cycle
@@ -2870,7 +3207,7 @@ def run_iteration(
 
     # Check if we exhausted retries
     if not cook_succeeded:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.monotonic() - start_time
         # Safety fallback: after snapshot may be None if we failed before any snapshot
         # was taken (e.g., immediate cook failure before post-cook snapshot)
         if after is None:
@@ -2889,7 +3226,8 @@ def run_iteration(
             after_ready=len(after.ready_ids),
             after_in_progress=len(after.in_progress_ids),
             actions=all_actions,
-            delta=BeadDelta.compute(before, after)
+            delta=BeadDelta.compute(before, after),
+            after_snapshot=after
         )
 
     # ===== PHASE 3: TIDY =====
@@ -2927,14 +3265,26 @@ def run_iteration(
     task_title = _get_title_from_snapshot_or_cache(task_id, before, task_info_cache) if task_id else None
 
     # Check if task was closed
-    new_closed = set(after.closed_ids) - set(before.closed_ids)
-    task_closed = bool(new_closed) or (task_id and task_id not in after.ready_work_ids and task_id not in after.in_progress_ids)
+    new_closed = after.closed_set - before.closed_set
+    task_closed = bool(new_closed) or (task_id and task_id not in after.ready_work_set and task_id not in after.in_progress_set)
 
-    # Parse intent from cook output
-    combined_output = "".join(all_output)
-    intent, before_state, after_state = parse_intent_block(combined_output)
+    # Parse intent from cook output, scanning each phase's buffer in turn
+    # instead of joining them into one copy of the whole iteration's output
+    intent: Optional[str] = None
+    before_state: Optional[str] = None
+    after_state: Optional[str] = None
+    for phase_output in all_output:
+        found_intent, found_before, found_after = parse_intent_block(phase_output)
+        if intent is None:
+            intent = found_intent
+        if before_state is None and found_before is not None:
+            before_state, after_state = found_before, found_after
+        if intent is not None and before_state is not None:
+            break
 
     # ===== PHASE 4: FEATURE/EPIC COMPLETION CHECK =====
+    # Plate and close-service change bead state after the snapshot above
+    after_is_current = True
     if task_id and task_closed:
         # Check if completing this task completes a feature
         feature_complete, feature_id = check_feature_completion(task_id, cwd, task_info_cache=task_info_cache, children_cache=children_cache)
@@ -2951,6 +3301,7 @@ def run_iteration(
 
             if progress_state:
                 progress_state.start_phase("plate")
+            after_is_current = False
             plate_result = run_phase("plate", cwd, args=feature_id, on_progress=progress_callback, phase_timeouts=phase_timeouts, idle_timeout=idle_timeout, idle_action=idle_action)
             all_actions.extend(plate_result.actions)
             all_output.append("\n=== PLATE PHASE ===\n")
@@ -2992,7 +3343,7 @@ def run_iteration(
                         logger.info(f"Close-service phase completed for epic {epic_id}")
                         closed_epic_ids.append(epic_id)
 
-    duration = (datetime.now() - start_time).total_seconds()
+    duration = time.monotonic() - start_time
 
     success = task_closed or serve_verdict == "APPROVED"
     outcome = "completed" if success else "needs_retry"
@@ -3022,14 +3373,20 @@ def run_iteration(
         actions=all_actions,
         delta=delta,
         findings_count=findings_count,
-        closed_epics=closed_epic_ids
+        closed_epics=closed_epic_ids,
+        after_snapshot=after if after_is_current else None
     )
 
 
 # --- loop.py ---
 
+# Characters allowed in an epic ID used as an epic/<id> branch name
+_BRANCH_SAFE_ID_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
+
 # Global shutdown flag for graceful termination
 _shutdown_requested = False
+# Set alongside the flag so retry backoff waits can end early
+_shutdown_event = threading.Event()
 
 
 def request_shutdown() -> None:
@@ -3046,12 +3403,26 @@ def request_shutdown() -> None:
     """
     global _shutdown_requested
     _shutdown_requested = True
+    _shutdown_event.set()
 
 
 def reset_shutdown_flag() -> None:
     """Reset the shutdown flag (for testing or loop restart)."""
     global _shutdown_requested
     _shutdown_requested = False
+    _shutdown_event.clear()
+
+
+def wait_unless_shutdown(delay: float) -> bool:
+    """Sleep for delay seconds, returning early if shutdown is requested.
+
+    A plain time.sleep() resumes after a signal handler runs, so a SIGTERM
+    during retry backoff would still wait out the full delay.
+
+    Returns:
+        True if shutdown was requested before the delay elapsed.
+    """
+    return _shutdown_event.wait(delay)
 
 
 def calculate_retry_delay(attempt: int, base: float = 2.0) -> float:
@@ -3165,7 +3536,7 @@ def validate_epic_id(epic_id: str, cwd: Path) -> Optional[str]:
     try:
         result = run_subprocess(["bd", "show", epic_id, "--json"], BD_COMMAND_TIMEOUT, cwd)
         if result.returncode == 0 and result.stdout.strip():
-            data = json.loads(result.stdout)
+            data = loads_json(result.stdout)
             issue = parse_bd_json_item(data)
             if issue and issue.get("issue_type") == "epic":
                 return issue.get("title", "")
@@ -3260,7 +3631,7 @@ def get_next_ready_task(
     try:
         result = run_subprocess(["bd", "ready", "--json"], BD_COMMAND_TIMEOUT, cwd)
         if result.returncode == 0 and result.stdout.strip():
-            issues = json.loads(result.stdout)
+            issues = loads_json(result.stdout)
             # Two-pass: prefer tasks over features
             work_items = [
                 i for i in issues
@@ -3344,16 +3715,49 @@ def serialize_full_iteration(result: IterationResult) -> dict:
         "actions": [serialize_action(a) for a in result.actions]
     }
     if result.delta:
-        data["delta"] = {
-            "newly_closed": [
-                {"id": b.id, "title": b.title, "type": b.issue_type}
-                for b in result.delta.newly_closed
-            ],
-            "newly_filed": [
-                {"id": b.id, "title": b.title, "type": b.issue_type}
-                for b in result.delta.newly_filed
-            ],
-        }
+        data["delta"] = serialize_delta(result.delta)
+    return data
+
+
+def serialize_delta(delta: BeadDelta) -> dict:
+    """Serialize a BeadDelta as id/title/type records."""
+    return {
+        "newly_closed": [
+            {"id": b.id, "title": b.title, "type": b.issue_type}
+            for b in delta.newly_closed
+        ],
+        "newly_filed": [
+            {"id": b.id, "title": b.title, "type": b.issue_type}
+            for b in delta.newly_filed
+        ],
+    }
+
+
+def serialize_iteration_for_report(result: IterationResult) -> dict:
+    """Serialize an IterationResult for the --json / --output loop report."""
+    data = {
+        "iteration": result.iteration,
+        "task_id": result.task_id,
+        "task_title": result.task_title,
+        "intent": result.intent,
+        "before_state": result.before_state,
+        "after_state": result.after_state,
+        "outcome": result.outcome,
+        "duration_seconds": result.duration_seconds,
+        "serve_verdict": result.serve_verdict,
+        "commit_hash": result.commit_hash,
+        "beads_before": {
+            "ready": result.before_ready,
+            "in_progress": result.before_in_progress
+        },
+        "beads_after": {
+            "ready": result.after_ready,
+            "in_progress": result.after_in_progress
+        },
+        "findings_count": result.findings_count
+    }
+    if result.delta:
+        data["delta"] = serialize_delta(result.delta)
     return data
 
 
@@ -3523,12 +3927,15 @@ def write_status_file(
     skipped_tasks: Optional[list] = None,
     escalation: Optional[dict] = None,
     epic_mode: Optional[str] = None,
-    current_epic: Optional[str] = None
+    current_epic: Optional[str] = None,
+    recent_iterations: Optional[Iterable[dict]] = None
 ):
     """Write live status JSON for external monitoring.
 
     Includes recent_iterations array with last 5 completed iterations
-    for watch mode milestone display.
+    for watch mode milestone display. Callers that keep those entries
+    already serialized pass them as recent_iterations; otherwise they are
+    derived from iterations on every write.
 
     Intra-iteration progress fields (for real-time visibility):
         current_phase: Currently executing phase (cook, serve, tidy, plate)
@@ -3572,7 +3979,9 @@ def write_status_file(
         status["last_action_time"] = last_action_time.isoformat()
 
     # Add recent_iterations (limited for display)
-    if iterations:
+    if recent_iterations is not None:
+        status["recent_iterations"] = list(recent_iterations)
+    elif iterations:
         completed = [i for i in iterations if i.outcome == "completed"]
         status["recent_iterations"] = [
             serialize_iteration_for_status(i)
@@ -3732,7 +4141,7 @@ def ensure_epic_branch(task_id: str, cwd: Path) -> tuple[Optional[str], bool]:
         return (None, False)
 
     # Validate epic_id contains only valid git branch characters
-    if not re.match(r'^[a-zA-Z0-9._-]+$', epic_id):
+    if not _BRANCH_SAFE_ID_RE.match(epic_id):
         logger.warning(f"Epic ID '{epic_id}' contains invalid branch characters, skipping branch switch")
         return (None, False)
 
@@ -3897,7 +4306,8 @@ def run_loop(
     max_task_failures: int = DEFAULT_MAX_TASK_FAILURES,
     idle_timeout: Optional[int] = None,
     idle_action: str = DEFAULT_IDLE_ACTION,
-    epic_mode: Optional[str] = None
+    epic_mode: Optional[str] = None,
+    circuit_cooldown: Optional[float] = None
 ) -> LoopReport:
     """Main loop: check ready, run iteration, handle outcome, repeat.
 
@@ -3913,21 +4323,30 @@ def run_loop(
     - None: default mode, excludes Retrospective/Backlog epics
     - "auto": auto-detect first non-excluded epic, work only its tasks
     - "<id>": work only the specified epic's tasks
+
+    Circuit breaker: by default the loop stops once too many iterations fail.
+    With circuit_cooldown set, it instead waits that many seconds and probes
+    with one more iteration, stopping only via max_iterations or shutdown.
     """
     global _shutdown_requested
 
     started_at = datetime.now()
+    start_time = time.monotonic()  # Durations use the monotonic clock
     iterations: list[IterationResult] = []
+    # Status file entries for the latest completed iterations, serialized once
+    recent_completed: deque[dict] = deque(maxlen=RECENT_ITERATIONS_DISPLAY)
     completed_count = 0
     failed_count = 0
+    blocked_count = 0  # Subset of failed_count, for the summary line
     stop_reason = "unknown"
-    circuit_breaker = CircuitBreaker()
+    circuit_breaker = CircuitBreaker(cooldown=circuit_cooldown)
     skip_list = SkipList(max_failures=max_task_failures)
     current_epic_id: Optional[str] = None
     current_epic_title: Optional[str] = None
     exhausted_epic_ids: set[str] = set()  # Epics already tried in auto mode
 
     logger.info(f"Loop starting: max_iterations={max_iterations}, epic_mode={epic_mode}")
+    clear_bead_caches()
 
     # Validate explicit epic ID upfront
     if epic_mode and epic_mode != "auto":
@@ -3964,6 +4383,8 @@ def run_loop(
     iteration = 0
     current_retries = 0
     last_task_id = None
+    # After-snapshot of the previous iteration, while nothing has changed since
+    reusable_snapshot: Optional[BeadSnapshot] = None
 
     while iteration < max_iterations:
         # Check for shutdown request
@@ -3976,14 +4397,24 @@ def run_loop(
 
         # Check circuit breaker
         if circuit_breaker.is_open():
-            stop_reason = "circuit_breaker"
-            logger.warning("Circuit breaker tripped after consecutive failures")
+            if circuit_breaker.cooldown is None:
+                stop_reason = "circuit_breaker"
+                logger.warning("Circuit breaker tripped after consecutive failures")
+                if not json_output:
+                    print("\nCircuit breaker tripped: too many consecutive failures. Stopping.")
+                break
+            # Half-open: wait out the cooldown, then let one iteration probe
+            delay = circuit_breaker.retry_after()
+            logger.warning(f"Circuit breaker open, probing again in {delay:.0f}s")
             if not json_output:
-                print("\nCircuit breaker tripped: too many consecutive failures. Stopping.")
-            break
+                print(f"\nCircuit breaker open: too many failures. Retrying in {delay:.0f}s...")
+            wait_unless_shutdown(delay)
+            reusable_snapshot = None  # Beads may have changed while waiting
+            continue
 
         # Check for ready work items (tasks + features, not epics)
-        snapshot = get_bead_snapshot(cwd)
+        snapshot = reusable_snapshot or get_bead_snapshot(cwd)
+        reusable_snapshot = None
 
         # Compute excluded epic IDs (Retrospective/Backlog) each iteration
         excluded_ids = get_excluded_epic_ids(snapshot)
@@ -4036,6 +4467,7 @@ def run_loop(
                 exhausted_epic_ids.add(current_epic_id)
                 current_epic_id = None
                 current_epic_title = None
+                reusable_snapshot = snapshot
                 continue
             stop_reason = "no_work"
             if snapshot.ready_ids:
@@ -4109,7 +4541,11 @@ def run_loop(
                 tasks_completed=completed_count,
                 tasks_remaining=ready_work_count,
                 started_at=started_at,
-                iterations=iterations
+                iterations=iterations,
+                recent_iterations=recent_completed,
+                epic_mode=epic_mode,
+                current_epic=current_epic_id,
+                _status_writer=write_status_file
             )
 
         # Run iteration with individual phase invocations
@@ -4125,6 +4561,9 @@ def run_loop(
             target_task_id=target_task_id
         )
         iterations.append(result)
+        reusable_snapshot = result.after_snapshot
+        if result.outcome == "completed":
+            recent_completed.append(serialize_iteration_for_status(result))
 
         # Circuit breaker: track failures, reset on success
         if result.success:
@@ -4153,7 +4592,8 @@ def run_loop(
                 started_at=started_at,
                 iterations=iterations,
                 epic_mode=epic_mode,
-                current_epic=current_epic_id
+                current_epic=current_epic_id,
+                recent_iterations=recent_completed
             )
 
         # Append iteration to history JSONL file (full action details)
@@ -4167,6 +4607,7 @@ def run_loop(
 
         # Periodic bd sync to keep bead state fresh during long runs
         if should_periodic_sync(iteration, PERIODIC_SYNC_INTERVAL):
+            reusable_snapshot = None
             sync_ok = periodic_sync(cwd)
             if not json_output:
                 if sync_ok:
@@ -4221,10 +4662,12 @@ def run_loop(
                 logger.info(f"Retry {current_retries}/{max_retries} for {result.task_id}, waiting {delay:.1f}s")
                 if not json_output:
                     print(f"\n  Waiting {delay:.1f}s before retry...")
-                time.sleep(delay)
+                wait_unless_shutdown(delay)
+                reusable_snapshot = None  # Beads may have changed while waiting
 
         elif result.outcome == "blocked":
             failed_count += 1
+            blocked_count += 1
             # Record failure to skip_list for blocked tasks
             if result.task_id:
                 now_skipped = skip_list.record_failure(result.task_id)
@@ -4261,6 +4704,7 @@ def run_loop(
 
         # Merge epic branches closed during this iteration
         if result.success and result.closed_epics:
+            reusable_snapshot = None
             for closed_epic_id in result.closed_epics:
                 epic_title = get_task_title(closed_epic_id, cwd) or ""
                 merged, merge_error = merge_epic_on_close(closed_epic_id, epic_title, cwd)
@@ -4277,6 +4721,7 @@ def run_loop(
             already_handled = set(result.closed_epics)
             epic_summaries = check_epic_completion(cwd, exclude_ids=already_handled)
             if epic_summaries:
+                reusable_snapshot = None
                 # Merge epic branches to main for each completed epic
                 for epic in epic_summaries:
                     epic_id = epic.get("id")
@@ -4326,7 +4771,7 @@ def run_loop(
             print(f"\nReached iteration limit ({max_iterations}). Stopping.")
 
     ended_at = datetime.now()
-    duration = (ended_at - started_at).total_seconds()
+    duration = time.monotonic() - start_time
 
     # Compute metrics
     metrics = LoopMetrics.from_iterations(iterations)
@@ -4352,9 +4797,14 @@ def run_loop(
             print(format_escalation_report(escalation))
         logger.warning(f"Escalation: {stop_reason} - {len(escalation.get('skipped_tasks', []))} tasks skipped")
 
+    # Final bead state, shared by the status file and the summary (only
+    # ready work is reported, so closed beads aren't queried)
+    final_snapshot: Optional[BeadSnapshot] = None
+    if status_file or not json_output:
+        final_snapshot = reusable_snapshot or get_bead_snapshot(cwd, include_closed=False)
+
     # Write final status (running=false)
     if status_file:
-        final_snapshot = get_bead_snapshot(cwd)
         write_status_file(
             status_file=status_file,
             running=False,
@@ -4371,7 +4821,8 @@ def run_loop(
             skipped_tasks=skip_list.get_skipped_tasks(),
             escalation=escalation,
             epic_mode=epic_mode,
-            current_epic=current_epic_id
+            current_epic=current_epic_id,
+            recent_iterations=recent_completed
         )
 
     # Write history summary record to mark end of loop
@@ -4394,14 +4845,13 @@ def run_loop(
         print("LOOP COMPLETE")
         print("=" * 44)
         print(f"Duration: {format_duration(duration)}")
-        print(f"Completed: {completed_count} | Failed: {failed_count} | Blocked: {sum(1 for i in iterations if i.outcome == 'blocked')}")
+        print(f"Completed: {completed_count} | Failed: {failed_count} | Blocked: {blocked_count}")
 
         # Metrics
         if iterations:
             print(f"Success rate: {metrics.success_rate:.0%} | P50: {format_duration(metrics.p50_duration)} | P95: {format_duration(metrics.p95_duration)}")
 
         # Final state (show work items, note if epics remain)
-        final_snapshot = get_bead_snapshot(cwd)
         work_count = len(final_snapshot.ready_work_ids)
         epic_count = len(final_snapshot.ready_ids) - work_count
         if epic_count > 0:
@@ -4425,43 +4875,17 @@ def run_loop(
                 "timeout_rate": metrics.timeout_rate,
                 "retry_rate": metrics.retry_rate
             },
-            "iterations": [
-                {
-                    "iteration": i.iteration,
-                    "task_id": i.task_id,
-                    "task_title": i.task_title,
-                    "intent": i.intent,
-                    "before_state": i.before_state,
-                    "after_state": i.after_state,
-                    "outcome": i.outcome,
-                    "duration_seconds": i.duration_seconds,
-                    "serve_verdict": i.serve_verdict,
-                    "commit_hash": i.commit_hash,
-                    "beads_before": {
-                        "ready": i.before_ready,
-                        "in_progress": i.before_in_progress
-                    },
-                    "beads_after": {
-                        "ready": i.after_ready,
-                        "in_progress": i.after_in_progress
-                    },
-                    "findings_count": i.findings_count,
-                    **({
-                        "delta": {
-                            "newly_closed": [{"id": b.id, "title": b.title, "type": b.issue_type} for b in i.delta.newly_closed],
-                            "newly_filed": [{"id": b.id, "title": b.title, "type": b.issue_type} for b in i.delta.newly_filed],
-                        }
-                    } if i.delta else {})
-                }
-                for i in report.iterations
-            ]
+            "iterations": [serialize_iteration_for_report(i) for i in report.iterations]
         }
 
+        # Serialize once; stdout and the output file share the same text
+        payload = json.dumps(json_data, indent=2)
         if json_output:
-            print(json.dumps(json_data, indent=2))
+            print(payload)
 
         if output_file:
-            output_file.write_text(json.dumps(json_data, indent=2))
+            # Atomic so a killed loop never leaves a truncated report behind
+            atomic_write(output_file, payload)
             if not json_output:
                 print(f"\nReport written to: {output_file}")
 
@@ -4476,16 +4900,32 @@ def run_loop(
 logger = logging.getLogger('line-loop')
 
 
+# Signals that request a graceful stop after the current iteration
+_SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM, signal.SIGHUP)
+
+
 def _handle_shutdown(signum, frame):
     """Handle SIGINT/SIGTERM/SIGHUP for graceful shutdown."""
     request_shutdown()
     logger.info(f"Shutdown requested (signal {signum})")
 
 
-# Register signal handlers
-signal.signal(signal.SIGINT, _handle_shutdown)
-signal.signal(signal.SIGTERM, _handle_shutdown)
-signal.signal(signal.SIGHUP, _handle_shutdown)
+def _install_signal_handlers() -> dict:
+    """Register _handle_shutdown for the shutdown signals.
+
+    Done from main() rather than at import so importing this module
+    leaves the caller's handlers alone.
+
+    Returns:
+        Previous handler per signal, for _restore_signal_handlers().
+    """
+    return {sig: signal.signal(sig, _handle_shutdown) for sig in _SHUTDOWN_SIGNALS}
+
+
+def _restore_signal_handlers(previous: dict) -> None:
+    """Reinstate handlers returned by _install_signal_handlers()."""
+    for sig, handler in previous.items():
+        signal.signal(sig, handler)
 
 
 def setup_logging(verbose: bool, log_file: Optional[Path] = None):
@@ -4641,6 +5081,13 @@ Examples:
         default=DEFAULT_MAX_TASK_FAILURES,
         help=f"Skip task after this many failures (default: {DEFAULT_MAX_TASK_FAILURES})"
     )
+    parser.add_argument(
+        "--circuit-cooldown",
+        type=float,
+        default=None,
+        metavar="S",
+        help="When the circuit breaker trips, wait S seconds and probe with one iteration instead of stopping"
+    )
     parser.add_argument(
         "--idle-timeout",
         type=int,
@@ -4689,6 +5136,9 @@ Examples:
         exit_code = 0 if health['healthy'] else 1
         sys.exit(exit_code)
 
+    # Route shutdown signals to a graceful stop for the rest of the run
+    previous_handlers = _install_signal_handlers()
+
     # Write PID file if requested (atomic to prevent race on concurrent starts)
     if args.pid_file:
         try:
@@ -4722,9 +5172,11 @@ Examples:
             max_task_failures=args.max_task_failures,
             idle_timeout=args.idle_timeout,
             idle_action=args.idle_action,
-            epic_mode=args.epic
+            epic_mode=args.epic,
+            circuit_cooldown=args.circuit_cooldown
         )
     finally:
+        _restore_signal_handlers(previous_handlers)
         # Clean up PID file on exit
         if args.pid_file and args.pid_file.exists():
             try:
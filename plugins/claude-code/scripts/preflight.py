@@ -9,6 +9,7 @@ Usage:
     python3 plugins/claude-code/scripts/preflight.py              # Full check
     python3 plugins/claude-code/scripts/preflight.py --json       # JSON output
     python3 plugins/claude-code/scripts/preflight.py --check git  # Git only
+    python3 plugins/claude-code/scripts/preflight.py --no-untracked  # Skip untracked scan
 
 Exit codes:
     0: All checks pass (warnings are informational, not failures)
@@ -18,52 +19,64 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
-from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-from helpers import run_cmd
+from helpers import loads_json, run_cmd, set_budget
 
 
-@dataclass
+# Result containers are plain classes rather than dataclasses: preflight runs
+# many times per agent session, and importing dataclasses (which pulls in
+# inspect and ast) roughly doubles its cold-start import time.
+
 class GitInfo:
     """Git repository state."""
-    clean: bool = True
-    branch: Optional[str] = None
-    has_remote: bool = False
-    dirty_files: list[str] = field(default_factory=list)
+
+    def __init__(self):
+        self.clean: bool = True
+        self.branch: Optional[str] = None
+        self.has_remote: bool = False
+        self.dirty_files: list[str] = []
 
 
-@dataclass
 class BeadsInfo:
     """Beads tracker state."""
-    available: bool = False
-    configured: bool = False
-    ready_count: int = 0
+
+    def __init__(self):
+        self.available: bool = False
+        self.configured: bool = False
+        self.ready_count: int = 0
 
 
-@dataclass
 class ToolsInfo:
     """Detected project tools."""
-    test: Optional[str] = None
-    build: Optional[str] = None
-    lint: Optional[str] = None
+
+    def __init__(self):
+        self.test: Optional[str] = None
+        self.build: Optional[str] = None
+        self.lint: Optional[str] = None
 
 
-@dataclass
 class PreflightResult:
     """Combined pre-flight check result."""
-    git: Optional[GitInfo] = None
-    beads: Optional[BeadsInfo] = None
-    tools: Optional[ToolsInfo] = None
-    passed: bool = True
-    errors: list[str] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
 
+    def __init__(self):
+        self.git: Optional[GitInfo] = None
+        self.beads: Optional[BeadsInfo] = None
+        self.tools: Optional[ToolsInfo] = None
+        self.passed: bool = True
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+
+
+def check_git(include_untracked=True):
+    """Check git repository state.
 
-def check_git():
-    """Check git repository state."""
+    With include_untracked=False, git skips the recursive untracked-file
+    scan, which dominates status time in trees with large build outputs.
+    """
     info = GitInfo()
 
     # Check if we're in a git repo
@@ -81,7 +94,8 @@ def check_git():
     info.has_remote = rc == 0 and len(out) > 0
 
     # Dirty state
-    rc, out, _ = run_cmd(["git", "status", "--porcelain"])
+    untracked = "--untracked-files=normal" if include_untracked else "--untracked-files=no"
+    rc, out, _ = run_cmd(["git", "status", "--porcelain", untracked])
     if rc == 0 and out:
         info.dirty_files = out.splitlines()
         info.clean = False
@@ -97,18 +111,17 @@ def check_beads():
     if Path(".beads").is_dir():
         info.configured = True
 
-    # Check bd command exists
-    rc, _, _ = run_cmd(["bd", "--version"])
-    if rc != 0:
+    # Count ready items. rc -1 means bd never ran (not installed, timed
+    # out, or the --budget was spent), so it can't be reported available.
+    rc, out, _ = run_cmd(["bd", "ready", "--json"], timeout=15)
+    if rc == -1:
         return info, []
 
     info.available = True
 
-    # Count ready items
-    rc, out, _ = run_cmd(["bd", "ready", "--json"], timeout=15)
     if rc == 0 and out:
         try:
-            data = json.loads(out)
+            data = loads_json(out)
             if isinstance(data, list):
                 info.ready_count = len(data)
         except (json.JSONDecodeError, TypeError):
@@ -117,51 +130,68 @@ def check_beads():
     return info, []
 
 
+# Tool detection rules: (marker, command), first marker present wins.
+_TEST_RULES = (
+    ("package.json", "npm test"),
+    ("pytest.ini", "pytest"),
+    ("pyproject.toml", "pytest"),
+    ("setup.py", "pytest"),
+    ("go.mod", "go test"),
+    ("Cargo.toml", "cargo test"),
+    ("Makefile", "make test"),
+)
+
+_BUILD_RULES = (
+    ("Makefile", "make"),
+    ("package.json", "npm run build"),
+    ("go.mod", "go build"),
+    ("Cargo.toml", "cargo build"),
+)
+
+# Markers here are substrings of pyproject.toml rather than file names
+_PYPROJECT_LINT_RULES = (
+    ("[tool.ruff]", "ruff"),
+    ("[tool.flake8]", "flake8"),
+)
+
+_LINT_RULES = (
+    ("ruff.toml", "ruff"),
+    (".ruff.toml", "ruff"),
+    (".eslintrc.js", "eslint"),
+    (".eslintrc.json", "eslint"),
+    ("pyproject.toml", _PYPROJECT_LINT_RULES),
+    (".golangci.yml", "golangci-lint"),
+)
+
+
+def _first_match(rules, haystack):
+    """Return the command of the first rule whose marker is in haystack."""
+    return next((cmd for marker, cmd in rules if marker in haystack), None)
+
+
 def detect_tools():
     """Detect project test/build/lint tools from project files."""
     info = ToolsInfo()
     warnings = []
-    cwd = Path(".")
-
-    # Test runner detection
-    if (cwd / "package.json").exists():
-        info.test = "npm test"
-    elif (cwd / "pytest.ini").exists() or (cwd / "pyproject.toml").exists() or (cwd / "setup.py").exists():
-        info.test = "pytest"
-    elif (cwd / "go.mod").exists():
-        info.test = "go test"
-    elif (cwd / "Cargo.toml").exists():
-        info.test = "cargo test"
-    elif (cwd / "Makefile").exists():
-        info.test = "make test"
-
-    # Build tool detection
-    if (cwd / "Makefile").exists():
-        info.build = "make"
-    elif (cwd / "package.json").exists():
-        info.build = "npm run build"
-    elif (cwd / "go.mod").exists():
-        info.build = "go build"
-    elif (cwd / "Cargo.toml").exists():
-        info.build = "cargo build"
-
-    # Lint tool detection
-    if (cwd / "ruff.toml").exists() or (cwd / ".ruff.toml").exists():
-        info.lint = "ruff"
-    elif (cwd / ".eslintrc.js").exists() or (cwd / ".eslintrc.json").exists():
-        info.lint = "eslint"
-    elif (cwd / "pyproject.toml").exists():
-        # Check if ruff or flake8 is configured in pyproject.toml
+
+    # One directory listing and at most one pyproject.toml read serve every rule
+    try:
+        names = set(os.listdir("."))
+    except OSError:
+        names = set()
+    pyproject = ""
+    if "pyproject.toml" in names:
         try:
-            content = (cwd / "pyproject.toml").read_text()
-            if "[tool.ruff]" in content:
-                info.lint = "ruff"
-            elif "[tool.flake8]" in content:
-                info.lint = "flake8"
+            pyproject = Path("pyproject.toml").read_text(errors="replace")
         except OSError:
             pass
-    elif (cwd / ".golangci.yml").exists():
-        info.lint = "golangci-lint"
+
+    info.test = _first_match(_TEST_RULES, names)
+    info.build = _first_match(_BUILD_RULES, names)
+    info.lint = _first_match(_LINT_RULES, names)
+    if isinstance(info.lint, tuple):
+        # pyproject.toml: lint tool depends on which [tool.*] table is configured
+        info.lint = _first_match(info.lint, pyproject)
 
     if not info.test:
         warnings.append("No test runner detected")
@@ -226,8 +256,8 @@ def format_human(result):
     return "\n".join(lines)
 
 
-def format_json(result):
-    """Format PreflightResult as JSON."""
+def _as_dict(result):
+    """Convert PreflightResult to a JSON-serializable dict."""
     data = {
         "git": None,
         "beads": None,
@@ -262,7 +292,28 @@ def format_json(result):
             "lint": tools.lint,
         }
 
-    return json.dumps(data, indent=2)
+    return data
+
+
+def format_json(result, fp=None):
+    """Format PreflightResult as JSON.
+
+    Returns the JSON string, or streams it to fp when given.
+    """
+    data = _as_dict(result)
+    if fp is None:
+        return json.dumps(data, indent=2)
+    json.dump(data, fp, indent=2)
+    fp.write("\n")
+    return None
+
+
+def _ci_enabled():
+    """Return True if the CI environment variable marks a CI run.
+
+    Unset, empty, "0" and "false" (any case) count as not CI.
+    """
+    return os.environ.get("CI", "").strip().lower() not in ("", "0", "false")
 
 
 def main():
@@ -277,13 +328,24 @@ def main():
         "--check", choices=["git", "bd", "tools"],
         help="Only run specific check category"
     )
+    parser.add_argument(
+        "--no-untracked", action="store_true",
+        help="Skip untracked files in git status (default when CI is set to "
+             "anything other than empty, 0 or false)"
+    )
+    parser.add_argument(
+        "--budget", type=float, default=30.0,
+        help="Wall-clock ceiling in seconds across all subprocess calls (default: %(default)s)"
+    )
 
     args = parser.parse_args()
+    set_budget(args.budget)
 
     result = PreflightResult()
 
     if args.check is None or args.check == "git":
-        result.git, git_errors = check_git()
+        include_untracked = not (args.no_untracked or _ci_enabled())
+        result.git, git_errors = check_git(include_untracked=include_untracked)
         result.errors.extend(git_errors)
 
     if args.check is None or args.check == "bd":
@@ -297,7 +359,7 @@ def main():
     result.passed = len(result.errors) == 0
 
     if args.json:
-        print(format_json(result))
+        format_json(result, sys.stdout)
     else:
         print(format_human(result))
 
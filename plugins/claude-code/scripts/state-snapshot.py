@@ -8,7 +8,7 @@ hierarchy walk, and branch recommendation.
 Usage:
     python3 plugins/claude-code/scripts/state-snapshot.py              # Human output
     python3 plugins/claude-code/scripts/state-snapshot.py --json       # JSON output
-    python3 plugins/claude-code/scripts/state-snapshot.py --sync       # Force sync
+    python3 plugins/claude-code/scripts/state-snapshot.py --sync       # Force sync (ignore --min-sync-interval)
     python3 plugins/claude-code/scripts/state-snapshot.py --no-sync    # Skip sync
 
 Exit codes:
@@ -20,12 +20,32 @@ import argparse
 import json
 import os
 import sys
+import time
+from pathlib import Path
 
-from helpers import run_cmd, run_bd_json, validate_bead_id
+from helpers import loads_json, run_cmd, run_bd_json, set_budget, validate_bead_id
 
+# Stamp file whose mtime records the last successful sync
+SYNC_STAMP = os.path.join(".beads", ".last-sync")
+
+# Child statuses eligible for drill-down suggestion
+_OPEN_STATES = frozenset({"open", "ready"})
+
+
+def do_sync(min_interval=0.0):
+    """Sync git and beads, return status dict.
+
+    Skips the network round-trips when the last successful sync happened
+    less than min_interval seconds ago (tracked by SYNC_STAMP's mtime).
+    """
+    if min_interval > 0:
+        try:
+            last = os.stat(SYNC_STAMP).st_mtime
+        except OSError:
+            last = 0.0
+        if time.time() - last < min_interval:
+            return {"git": "skipped (fresh)", "beads": "skipped (fresh)"}
 
-def do_sync():
-    """Sync git and beads, return status dict."""
     result = {"git": "skipped", "beads": "skipped"}
 
     # Git sync
@@ -40,6 +60,12 @@ def do_sync():
     rc, _, _ = run_cmd(["bd", "sync"], timeout=30)
     result["beads"] = "ok" if rc == 0 else "failed"
 
+    if result["git"] == "ok" and result["beads"] == "ok":
+        try:
+            Path(SYNC_STAMP).touch()
+        except OSError:
+            pass
+
     return result
 
 
@@ -67,7 +93,7 @@ def _fetch_bead_list(cmd_args):
     if rc != 0 or not out:
         return []
     try:
-        data = json.loads(out)
+        data = loads_json(out)
         if isinstance(data, list):
             return [_summarize_bead(b) for b in data]
     except (json.JSONDecodeError, TypeError):
@@ -98,17 +124,17 @@ def suggest_next_task(roster):
         return {"suggestion": None, "drill_path": []}
 
     # Build blocked IDs set to avoid suggesting blocked tasks during drill-down
-    blocked_ids = {
+    blocked_ids = frozenset(
         b.get("id", "") for b in roster.get("blocked", [])
         if isinstance(b, dict)
-    }
+    )
 
     candidate = ready[0]
     candidate_id = candidate.get("id", "")
     if not validate_bead_id(candidate_id):
         return {"suggestion": None, "drill_path": []}
 
-    detail = run_bd_json(["show", candidate_id])
+    detail = _get_detail(candidate_id)
     if not isinstance(detail, dict):
         suggestion = _extract_task_detail(candidate) if isinstance(candidate, dict) else None
         return {"suggestion": suggestion, "drill_path": [candidate_id]}
@@ -131,7 +157,7 @@ def _drill_epic_transparent(epic_id, drill_path, depth=0, blocked_ids=None):
         return {"suggestion": None, "drill_path": drill_path}
 
     if blocked_ids is None:
-        blocked_ids = set()
+        blocked_ids = frozenset()
 
     # Intentionally omit --all: we only want non-closed children for drill-down
     rc, out, _ = run_cmd(["bd", "list", "--parent=" + epic_id, "--json"], timeout=15)
@@ -139,7 +165,7 @@ def _drill_epic_transparent(epic_id, drill_path, depth=0, blocked_ids=None):
         return {"suggestion": None, "drill_path": drill_path}
 
     try:
-        children = json.loads(out)
+        children = loads_json(out)
         if not isinstance(children, list):
             return {"suggestion": None, "drill_path": drill_path}
     except (json.JSONDecodeError, TypeError):
@@ -153,7 +179,7 @@ def _drill_epic_transparent(epic_id, drill_path, depth=0, blocked_ids=None):
         if child_id in blocked_ids:
             continue
         status = child.get("status", "")
-        if status in ("open", "ready"):
+        if status in _OPEN_STATES:
             drill_path.append(child_id)
             child_type = child.get("type") or child.get("issue_type", "")
             if child_type in ("epic", "feature"):
@@ -199,6 +225,25 @@ def _extract_task_detail(detail):
 
 
 _parent_children_cache = {}
+_detail_cache = {}
+
+
+def _get_detail(bead_id):
+    """Fetch bd show detail for a bead, with caching.
+
+    The suggested task is shown once during drill-down and again when its
+    hierarchy is walked; the cache makes the second lookup free.
+    """
+    if bead_id in _detail_cache:
+        return _detail_cache[bead_id]
+
+    if not validate_bead_id(bead_id):
+        _detail_cache[bead_id] = None
+        return None
+
+    detail = run_bd_json(["show", bead_id])
+    _detail_cache[bead_id] = detail
+    return detail
 
 
 def _get_children(parent_id):
@@ -216,7 +261,7 @@ def _get_children(parent_id):
         return None
 
     try:
-        children = json.loads(out)
+        children = loads_json(out)
         if not isinstance(children, list):
             _parent_children_cache[parent_id] = None
             return None
@@ -231,9 +276,7 @@ def build_hierarchy(task_id):
     """Walk parent chain to build epic→feature→task hierarchy."""
     hierarchy = {"epic": None, "feature": None, "completed_siblings": []}
 
-    if not validate_bead_id(task_id):
-        return hierarchy
-    detail = run_bd_json(["show", task_id])
+    detail = _get_detail(task_id)
     if not isinstance(detail, dict):
         return hierarchy
 
@@ -242,7 +285,7 @@ def build_hierarchy(task_id):
         return hierarchy
 
     # Parent = feature (usually)
-    parent = run_bd_json(["show", parent_id])
+    parent = _get_detail(parent_id)
     if isinstance(parent, dict):
         parent_type = parent.get("type") or parent.get("issue_type", "")
 
@@ -257,7 +300,7 @@ def build_hierarchy(task_id):
             # Walk up to epic
             grandparent_id = parent.get("parent")
             if grandparent_id:
-                grandparent = run_bd_json(["show", grandparent_id])
+                grandparent = _get_detail(grandparent_id)
                 if isinstance(grandparent, dict):
                     hierarchy["epic"] = {
                         "id": grandparent.get("id", ""),
@@ -302,14 +345,24 @@ def _calc_progress(parent_id):
     children = _get_children(parent_id)
     if children is None:
         return None
-    total = len(children)
-    closed = sum(
-        1 for c in children
-        if isinstance(c, dict) and c.get("status") == "closed"
-    )
+    total, closed = _closed_stats(children)
     return "{}/{}".format(closed, total)
 
 
+def _closed_stats(children):
+    """Count (total, closed) children in one pass.
+
+    Every entry counts toward total; only dict entries can count as
+    closed, so a malformed child keeps its parent from looking complete.
+    """
+    total = closed = 0
+    for c in children:
+        total += 1
+        if isinstance(c, dict) and c.get("status") == "closed":
+            closed += 1
+    return total, closed
+
+
 def get_branch_recommendation(hierarchy, current_branch):
     """Determine expected branch based on hierarchy.
 
@@ -362,7 +415,7 @@ def detect_plate_ready():
         if rc != 0 or not out:
             continue
         try:
-            items = json.loads(out)
+            items = loads_json(out)
             if not isinstance(items, list):
                 continue
         except (json.JSONDecodeError, TypeError):
@@ -379,11 +432,7 @@ def detect_plate_ready():
             if children is None or not children:
                 continue
 
-            total = len(children)
-            closed = sum(
-                1 for c in children
-                if isinstance(c, dict) and c.get("status") == "closed"
-            )
+            total, closed = _closed_stats(children)
             if total == closed:
                 result[key].append({
                     "id": item_id,
@@ -506,17 +555,27 @@ def main():
     )
     sync_group = parser.add_mutually_exclusive_group()
     sync_group.add_argument(
-        "--sync", action="store_true", default=False,
-        help="Force git fetch/pull and bd sync"
+        "--sync", "--force-sync", action="store_true", default=False,
+        help="Force git fetch/pull and bd sync, even if the last sync is recent"
     )
     sync_group.add_argument(
         "--no-sync", action="store_true", default=False,
         help="Skip sync step entirely"
     )
+    parser.add_argument(
+        "--min-sync-interval", type=float, default=60.0,
+        help="Skip sync if the last successful sync was within this many seconds (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--budget", type=float, default=60.0,
+        help="Wall-clock ceiling in seconds across all subprocess calls (default: %(default)s)"
+    )
 
     args = parser.parse_args()
+    set_budget(args.budget)
 
     _parent_children_cache.clear()
+    _detail_cache.clear()
 
     data = {}
 
@@ -524,7 +583,7 @@ def main():
     if args.no_sync:
         data["sync"] = {"git": "skipped", "beads": "skipped"}
     else:
-        data["sync"] = do_sync()
+        data["sync"] = do_sync(0.0 if args.sync else args.min_sync_interval)
 
     # Project info
     data["project"] = get_project_info()
@@ -556,7 +615,8 @@ def main():
     data["plate_ready"] = detect_plate_ready()
 
     if args.json:
-        print(json.dumps(data, indent=2))
+        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.write("\n")
     else:
         print(format_human(data))
 
@@ -12,13 +12,134 @@ Options:
 """
 
 import argparse
+import filecmp
 import json
+import os
 import shutil
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Optional
 
 VERSION = "0.14.0"
 
+# Agent configs are only parsed for validation; use orjson when available,
+# keeping the installer zero-dependency otherwise. orjson's decode error
+# subclasses json.JSONDecodeError.
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# Per-file installs are small and syscall-bound; overlap them across threads.
+# Every worker writes a distinct destination path, so no locking is needed.
+MAX_WORKERS = 8
+
+# Relative config path rewritten to an absolute prefix on global install
+KIRO_PATH_NEEDLE = b".kiro/"
+
+# Static tail of the post-install summary
+NEXT_STEPS = """
+Next steps:
+  1. Start Kiro CLI with: kiro-cli --agent line-cook
+  2. Use @line-prep, @line-cook, etc. or natural language
+
+Available @prompts:
+  @line-brainstorm      - Explore problem space
+  @line-scope           - Structure work breakdown
+  @line-finalize        - Convert plan to beads
+  @line-mise            - Full planning (brainstorm→scope→finalize)
+  @line-prep            - Sync state, show ready tasks
+  @line-cook            - Execute task with TDD cycle
+  @line-serve           - Review changes
+  @line-tidy            - Commit and push
+  @line-plate           - Validate feature
+  @line-close-service   - Validate and close epic
+  @line-run             - Full workflow cycle
+  @line-decision        - Manage architecture decisions
+  @line-architecture-audit - Audit codebase architecture
+  @line-plan-audit      - Audit planning quality
+  @line-help            - Show help
+  @line-loop            - Manage autonomous loop
+  @line-getting-started - Show workflow guide
+"""
+
+
+def _install_agent(agents_dst: str, kiro_prefix: Optional[bytes], agent_file: Path) -> None:
+    """Install one agent config, validating it as JSON first.
+
+    When kiro_prefix is set, every KIRO_PATH_NEEDLE in the raw bytes is
+    replaced with it in a single pass. Local installs, and files with no
+    needle, are copied byte-for-byte.
+
+    Raises:
+        ValueError: If the agent file isn't valid JSON. This runs in a pool
+            worker, so main() reports it and exits rather than the worker.
+    """
+    with open(agent_file, "rb") as f:
+        raw = f.read()
+    try:
+        _loads(raw)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {agent_file}: {e}") from e
+
+    agent_dst = os.path.join(agents_dst, agent_file.name)
+    if kiro_prefix is None or KIRO_PATH_NEEDLE not in raw:
+        # Nothing to rewrite: plain copy
+        if not _up_to_date(agent_file, agent_dst):
+            shutil.copyfile(agent_file, agent_dst)
+        return
+
+    raw = raw.replace(KIRO_PATH_NEEDLE, kiro_prefix)
+    if not raw.endswith(b"\n"):
+        raw += b"\n"
+    try:
+        with open(agent_dst, "rb") as f:
+            if f.read() == raw:
+                return  # Unchanged; skip the write (and the indexer/AV rescan)
+    except OSError:
+        pass
+    with open(agent_dst, "wb") as f:
+        f.write(raw)
+
+
+def _up_to_date(src, dst: str) -> bool:
+    """Return True if dst is an identical copy of src.
+
+    Sizes are compared first, and contents only when they match, so
+    repeat installs skip rewriting unchanged files. Contents are checked
+    rather than mtimes, which miss same-size edits within the timestamp
+    granularity and checkouts that preserve mtimes.
+    """
+    try:
+        return filecmp.cmp(src, dst, shallow=False)
+    except OSError:
+        return False
+
+
+def _copy_to(dst_dir: str, src: Path) -> None:
+    """Copy src's contents into dst_dir, keeping its file name.
+
+    Uses copyfile (sendfile/copy_file_range on Linux) and skips the
+    permission copy, which is irrelevant for markdown installs. Files
+    already up to date are left alone.
+    """
+    dst = os.path.join(dst_dir, src.name)
+    if not _up_to_date(src, dst):
+        shutil.copyfile(src, dst)
+
+
+def _install_script(dst_dir: str, script: str) -> None:
+    """Copy a hook script into dst_dir and make it executable (user only)."""
+    # One stat of the source and one chmod of the copy; shutil.copy would
+    # chmod once and the exec bit would need a second stat + chmod.
+    src_mode = stat.S_IMODE(os.stat(script).st_mode)
+    script_dst = os.path.join(dst_dir, os.path.basename(script))
+    shutil.copyfile(script, script_dst)
+    os.chmod(script_dst, src_mode | stat.S_IXUSR)
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Install line-cook for Kiro CLI")
@@ -44,6 +165,9 @@ def main() -> None:
     args = parser.parse_args()
 
     script_dir = Path(__file__).parent.resolve()
+    # One scandir answers every "does this source directory exist" probe
+    with os.scandir(script_dir) as entries:
+        src_dirs = {e.name for e in entries if e.is_dir()}
 
     if args.global_install:
         kiro_dir = Path.home() / ".kiro"
@@ -61,127 +185,89 @@ def main() -> None:
         kiro_dir = Path(".kiro")
         print(f"Installing line-cook v{VERSION} for Kiro CLI (local)...")
 
-    # Create directories
-    (kiro_dir / "agents").mkdir(parents=True, exist_ok=True)
-    (kiro_dir / "steering").mkdir(parents=True, exist_ok=True)
-    (kiro_dir / "skills" / "line-cook").mkdir(parents=True, exist_ok=True)
-    (kiro_dir / "scripts").mkdir(parents=True, exist_ok=True)
-    (kiro_dir / "prompts").mkdir(parents=True, exist_ok=True)
+    # Destinations as plain strings: the per-file workers join onto them
+    # with os.path.join rather than building Path objects per file
+    kiro_root = str(kiro_dir)
+    agents_dst = os.path.join(kiro_root, "agents")
+    steering_dst = os.path.join(kiro_root, "steering")
+    skill_dst = os.path.join(kiro_root, "skills", "line-cook")
+    scripts_dst = os.path.join(kiro_root, "scripts")
+    prompts_dst = os.path.join(kiro_root, "prompts")
 
-    # Path transformer for global install (converts .kiro/ to absolute paths)
+    # Create directories: the root once, then each leaf under it
+    os.makedirs(kiro_root, exist_ok=True)
+    for sub_dir in (agents_dst, steering_dst, skill_dst, scripts_dst, prompts_dst):
+        os.makedirs(sub_dir, exist_ok=True)
+
+    # Path prefix for global install (converts .kiro/ to absolute paths).
+    # Use full path instead of ~ because skill:// URIs don't expand tilde.
+    # JSON-escaped and encoded because it is substituted into raw agent JSON.
     if args.global_install:
-        home_kiro = str(Path.home() / ".kiro")
-
-        def transform_path(obj):
-            """Transform .kiro/ paths to absolute paths for global install.
-            Use full path instead of ~ because skill:// URIs don't expand tilde."""
-            if isinstance(obj, str):
-                return obj.replace(".kiro/", f"{home_kiro}/")
-            if isinstance(obj, list):
-                return [transform_path(item) for item in obj]
-            if isinstance(obj, dict):
-                return {k: transform_path(v) for k, v in obj.items()}
-            return obj
+        kiro_prefix = json.dumps(f"{kiro_dir}/")[1:-1].encode()
     else:
-        def transform_path(obj):
-            return obj
-
-    # Copy agent configurations
-    agents_src = script_dir / "agents"
-    agent_files = sorted(agents_src.glob("*.json"))
-    if not agent_files:
-        sys.exit(f"Error: No agent JSON files found in {agents_src}")
-    print(f"Installing agent configurations ({len(agent_files)} agents)...")
-    for agent_file in agent_files:
+        kiro_prefix = None
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        # Copy agent configurations
+        agents_src = script_dir / "agents"
+        agent_files = sorted(agents_src.glob("*.json"))
+        if not agent_files:
+            sys.exit(f"Error: No agent JSON files found in {agents_src}")
+        print(f"Installing agent configurations ({len(agent_files)} agents)...")
         try:
-            with open(agent_file) as f:
-                agent_config = json.load(f)
-        except json.JSONDecodeError as e:
-            sys.exit(f"Error: Invalid JSON in {agent_file}: {e}")
-
-        agent_config = transform_path(agent_config)
-        agent_dst = kiro_dir / "agents" / agent_file.name
-        with open(agent_dst, "w") as f:
-            json.dump(agent_config, f, indent=2)
-            f.write("\n")
-
-    # Copy steering files
-    steering_src = script_dir / "steering"
-    steering_files = list(steering_src.glob("*.md"))
-    if steering_files:
-        print("Installing steering files...")
-        for md_file in steering_files:
-            shutil.copy(md_file, kiro_dir / "steering" / md_file.name)
-    else:
-        print("  Warning: No steering files found")
+            list(pool.map(partial(_install_agent, agents_dst, kiro_prefix), agent_files))
+        except ValueError as e:
+            sys.exit(f"Error: {e}")
 
-    # Copy skills
-    print("Installing skills...")
-    skill_src = script_dir / "skills" / "line-cook" / "SKILL.md"
-    if skill_src.exists():
-        shutil.copy(skill_src, kiro_dir / "skills" / "line-cook" / "SKILL.md")
-    else:
-        print("  Warning: SKILL.md not found")
-
-    # Copy prompts
-    prompts_src = script_dir / "prompts"
-    if prompts_src.exists():
-        prompt_files = list(prompts_src.glob("*.md"))
-        if prompt_files:
-            print("Installing prompts...")
-            for prompt_file in prompt_files:
-                shutil.copy(prompt_file, kiro_dir / "prompts" / prompt_file.name)
+        # Copy steering files
+        steering_src = script_dir / "steering"
+        steering_files = list(steering_src.glob("*.md"))
+        if steering_files:
+            print("Installing steering files...")
+            list(pool.map(partial(_copy_to, steering_dst), steering_files))
         else:
-            print("  Warning: No prompt files found")
-    else:
-        print("  Warning: prompts directory not found")
-
-    # Copy hook scripts (supports both .sh and .py scripts)
-    scripts_src = script_dir / "scripts"
-    if scripts_src.exists():
-        hook_scripts = list(scripts_src.glob("*.sh")) + list(scripts_src.glob("*.py"))
-        if hook_scripts:
-            print("Installing hook scripts...")
-            for script in hook_scripts:
-                script_dst = kiro_dir / "scripts" / script.name
-                shutil.copy(script, script_dst)
-                script_dst.chmod(script_dst.stat().st_mode | 0o100)  # Make executable (user only)
-
-    print()
-    print("Installation complete!")
-    print()
-    print(f"Installed to: {kiro_dir}")
-    print()
-    print("Files installed:")
-    for agent_file in agent_files:
-        print(f"  agents/{agent_file.name}")
-    print("  steering/*.md              - Workflow instructions")
-    print("  skills/line-cook/SKILL.md  - Lazy-loaded documentation")
-    prompt_count = len(list((kiro_dir / "prompts").glob("*.md")))
-    print(f"  prompts/line-*.md          - {prompt_count} @prompt invocations")
-    print()
-    print("Next steps:")
-    print("  1. Start Kiro CLI with: kiro-cli --agent line-cook")
-    print("  2. Use @line-prep, @line-cook, etc. or natural language")
-    print()
-    print("Available @prompts:")
-    print("  @line-brainstorm      - Explore problem space")
-    print("  @line-scope           - Structure work breakdown")
-    print("  @line-finalize        - Convert plan to beads")
-    print("  @line-mise            - Full planning (brainstorm→scope→finalize)")
-    print("  @line-prep            - Sync state, show ready tasks")
-    print("  @line-cook            - Execute task with TDD cycle")
-    print("  @line-serve           - Review changes")
-    print("  @line-tidy            - Commit and push")
-    print("  @line-plate           - Validate feature")
-    print("  @line-close-service   - Validate and close epic")
-    print("  @line-run             - Full workflow cycle")
-    print("  @line-decision        - Manage architecture decisions")
-    print("  @line-architecture-audit - Audit codebase architecture")
-    print("  @line-plan-audit      - Audit planning quality")
-    print("  @line-help            - Show help")
-    print("  @line-loop            - Manage autonomous loop")
-    print("  @line-getting-started - Show workflow guide")
+            print("  Warning: No steering files found")
+
+        # Copy skills
+        print("Installing skills...")
+        skill_src = script_dir / "skills" / "line-cook" / "SKILL.md"
+        if skill_src.exists():
+            _copy_to(skill_dst, skill_src)
+        else:
+            print("  Warning: SKILL.md not found")
+
+        # Copy prompts
+        prompt_count = 0
+        prompts_src = script_dir / "prompts"
+        if "prompts" in src_dirs:
+            prompt_files = list(prompts_src.glob("*.md"))
+            if prompt_files:
+                print("Installing prompts...")
+                list(pool.map(partial(_copy_to, prompts_dst), prompt_files))
+                prompt_count = len(prompt_files)
+            else:
+                print("  Warning: No prompt files found")
+        else:
+            print("  Warning: prompts directory not found")
+
+        # Copy hook scripts (supports both .sh and .py scripts)
+        scripts_src = script_dir / "scripts"
+        if "scripts" in src_dirs:
+            with os.scandir(scripts_src) as entries:
+                hook_scripts = sorted(
+                    e.path for e in entries
+                    if e.is_file() and e.name.endswith((".sh", ".py"))
+                )
+            if hook_scripts:
+                print("Installing hook scripts...")
+                list(pool.map(partial(_install_script, scripts_dst), hook_scripts))
+
+    lines = ["", "Installation complete!", "", f"Installed to: {kiro_dir}", "", "Files installed:"]
+    lines.extend(f"  agents/{agent_file.name}" for agent_file in agent_files)
+    lines.append("  steering/*.md              - Workflow instructions")
+    lines.append("  skills/line-cook/SKILL.md  - Lazy-loaded documentation")
+    lines.append(f"  prompts/line-*.md          - {prompt_count} @prompt invocations")
+    sys.stdout.write("\n".join(lines) + "\n" + NEXT_STEPS)
 
 
 if __name__ == "__main__":
@@ -110,6 +110,12 @@ class TestPreflight(unittest.TestCase):
         if Path(REPO_ROOT / ".beads").is_dir():
             self.assertTrue(beads["configured"])
 
+    def test_beads_unavailable_when_budget_exceeded(self):
+        """bd skipped by a spent --budget is reported unavailable."""
+        data = parse_json_output("preflight.py", ["--check", "bd", "--budget", "0"])
+        self.assertFalse(data["beads"]["available"])
+        self.assertEqual(data["beads"]["ready_count"], 0)
+
     def test_check_filter(self):
         """--check git only returns git info."""
         data = parse_json_output("preflight.py", ["--check", "git"])
@@ -11,7 +11,7 @@ from unittest.mock import patch, MagicMock
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "plugins" / "claude-code" / "scripts"))
 
-from helpers import run_cmd, run_bd_json, validate_bead_id
+from helpers import loads_json, run_cmd, run_bd_json, set_budget, validate_bead_id
 
 
 class TestValidateBeadId(unittest.TestCase):
@@ -52,6 +52,10 @@ class TestValidateBeadId(unittest.TestCase):
         self.assertFalse(validate_bead_id("lc/1"))
         self.assertFalse(validate_bead_id("lc$1"))
 
+    def test_rejects_trailing_newline(self):
+        """Trailing newline is rejected."""
+        self.assertFalse(validate_bead_id("lc-1\n"))
+
 
 class TestRunCmd(unittest.TestCase):
     """Test run_cmd() function."""
@@ -124,6 +128,39 @@ class TestRunCmd(unittest.TestCase):
         )
 
 
+class TestRunCmdBudget(unittest.TestCase):
+    """Test set_budget() interaction with run_cmd()."""
+
+    def tearDown(self):
+        set_budget(None)
+
+    @patch("helpers.subprocess.run")
+    def test_expired_budget_skips_spawn(self, mock_run):
+        """Commands after the deadline fail without spawning."""
+        set_budget(0)
+        rc, out, err = run_cmd(["git", "status"])
+        self.assertEqual(rc, -1)
+        self.assertEqual(out, "")
+        self.assertEqual(err, "budget exceeded")
+        mock_run.assert_not_called()
+
+    @patch("helpers.subprocess.run")
+    def test_timeout_clamped_to_remaining_budget(self, mock_run):
+        """Timeout is lowered to the remaining budget."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        set_budget(5)
+        run_cmd(["cmd"], timeout=30)
+        self.assertLessEqual(mock_run.call_args.kwargs["timeout"], 5)
+
+    @patch("helpers.subprocess.run")
+    def test_short_timeout_kept_within_budget(self, mock_run):
+        """Timeout shorter than the remaining budget is unchanged."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        set_budget(60)
+        run_cmd(["cmd"], timeout=10)
+        self.assertEqual(mock_run.call_args.kwargs["timeout"], 10)
+
+
 class TestRunBdJson(unittest.TestCase):
     """Test run_bd_json() function."""
 
@@ -179,5 +216,18 @@ class TestRunBdJson(unittest.TestCase):
         mock_cmd.assert_called_once_with(["bd", "show", "lc-1", "--json"], timeout=30)
 
 
+class TestLoadsJson(unittest.TestCase):
+    """Test loads_json() function."""
+
+    def test_parses_list(self):
+        """JSON array parses to a list of dicts."""
+        self.assertEqual(loads_json('[{"id": "lc-1"}]'), [{"id": "lc-1"}])
+
+    def test_invalid_json_raises_stdlib_error(self):
+        """Malformed input raises json.JSONDecodeError regardless of backend."""
+        with self.assertRaises(json.JSONDecodeError):
+            loads_json("not json")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Unit tests for line-loop.py functions."""
 
+import json
 import sys
 import unittest
 from pathlib import Path
@@ -137,6 +138,144 @@ Reason: API timeout
         # Should return None because UNKNOWN_STATE isn't a valid verdict
         self.assertIsNone(result)
 
+    def test_parse_reads_next_step_from_block(self):
+        """next_step inside the SERVE_RESULT block is captured."""
+        output = "SERVE_RESULT\nverdict: APPROVED\ncontinue: true\nnext_step: /line:tidy\nblocking_issues: 0\n"
+        result = line_loop.parse_serve_result(output)
+        self.assertEqual(result.next_step, "/line:tidy")
+
+    def test_parse_block_fields_win_over_earlier_mentions(self):
+        """Fields in the SERVE_RESULT block override stray earlier ones."""
+        output = (
+            "Template says continue: false and blocking_issues: 9\n"
+            "SERVE_RESULT\nverdict: APPROVED\ncontinue: true\nblocking_issues: 0\n"
+        )
+        result = line_loop.parse_serve_result(output)
+        self.assertTrue(result.continue_)
+        self.assertEqual(result.blocking_issues, 0)
+
+    def test_parse_stream_json_fields(self):
+        """Fields inside a stream-json event are all recovered in one scan."""
+        event = {"type": "assistant", "message": {"content": [{"type": "text", "text":
+            "SERVE_RESULT\nverdict: NEEDS_CHANGES\ncontinue: false\nnext_step: /line:cook\nblocking_issues: 3\n"}]}}
+        result = line_loop.parse_serve_result(json.dumps(event) + "\n")
+        self.assertIsNotNone(result)
+        self.assertEqual(result.verdict, "NEEDS_CHANGES")
+        self.assertFalse(result.continue_)
+        self.assertEqual(result.blocking_issues, 3)
+
+    def test_parse_capitalized_verdict_key(self):
+        """Capitalized field keys still reach the parser."""
+        result = line_loop.parse_serve_result("Verdict: APPROVED\nContinue: true")
+        self.assertIsNotNone(result)
+        self.assertEqual(result.verdict, "APPROVED")
+
+    def test_parse_mixed_case_verdict_key(self):
+        """Any casing of the verdict key reaches the parser."""
+        for key in ("VerDict", "vERDICT"):
+            result = line_loop.parse_serve_result(f"{key}: needs_changes\nblocking_issues: 1")
+            self.assertIsNotNone(result, key)
+            self.assertEqual(result.verdict, "NEEDS_CHANGES")
+
+    def test_parse_skips_invalid_verdict_before_valid_one(self):
+        """First valid verdict wins even if an invalid one appears earlier."""
+        result = line_loop.parse_serve_result("verdict: UNKNOWN\nverdict: blocked")
+        self.assertIsNotNone(result)
+        self.assertEqual(result.verdict, "BLOCKED")
+
+
+class TestParseServeFeedback(unittest.TestCase):
+    """Test parse_serve_feedback() issue extraction."""
+
+    def test_parses_sous_chef_issue_blocks(self):
+        """Each Severity block yields one issue with its own fields."""
+        output = (
+            "Summary:\nSome problems.\n\n"
+            "Issues found:\n"
+            "  - Severity: major\n"
+            "    File/line: src/foo.py:42\n"
+            "    Issue: Missing error handling\n"
+            "    Suggestion: Wrap in try/except\n\n"
+            "  - Severity: minor\n"
+            "    File/line: src/bar.py:7\n"
+            "    Issue: Naming\n"
+            "Positive notes: good tests\n"
+        )
+        feedback = line_loop.parse_serve_feedback(output)
+        self.assertEqual(
+            [(i.severity, i.location, i.problem, i.suggestion) for i in feedback.issues],
+            [("major", "src/foo.py:42", "Missing error handling", "Wrap in try/except"),
+             ("minor", "src/bar.py:7", "Naming", None)]
+        )
+
+    def test_section_keeps_final_line_without_newline(self):
+        """Output ending mid-section without a newline keeps its last line."""
+        output = (
+            "Issues found:\n"
+            "  - Severity: major\n"
+            "    File/line: src/foo.py:42\n"
+            "    Issue: Missing error handling"
+        )
+        feedback = line_loop.parse_serve_feedback(output)
+        self.assertEqual(
+            [(i.location, i.problem) for i in feedback.issues],
+            [("src/foo.py:42", "Missing error handling")]
+        )
+
+    def test_section_ends_at_two_blank_lines(self):
+        """Blocks after two consecutive blank lines are outside the section."""
+        output = (
+            "Issues found:\n"
+            "Severity: major\nFile/line: a.py:1\nIssue: first\n"
+            "\n\n"
+            "Severity: minor\nFile/line: b.py:2\nIssue: second\n"
+        )
+        feedback = line_loop.parse_serve_feedback(output)
+        self.assertEqual([i.problem for i in feedback.issues], ["first"])
+
+    def test_blocks_missing_fields_parse_quickly(self):
+        """Blocks without an Issue line don't trigger regex backtracking."""
+        import time
+        output = "Issues found:\n" + "Severity: major\nFile/line: a.py:1\n" * 500
+        start = time.monotonic()
+        self.assertIsNone(line_loop.parse_serve_feedback(output))
+        self.assertLess(time.monotonic() - start, 2.0)
+
+    def test_unterminated_section_parses_quickly(self):
+        """A section running to end of output without a newline stays linear."""
+        import time
+        output = "Issues found:\n" + "\n".join("- item" for _ in range(500))
+        start = time.monotonic()
+        line_loop.parse_serve_feedback(output)
+        self.assertLess(time.monotonic() - start, 2.0)
+
+
+class TestLoadsJson(unittest.TestCase):
+    """Test loads_json() parser selection."""
+
+    def setUp(self):
+        from line_loop import parsing
+        self.addCleanup(setattr, parsing, "_json_loads", None)
+
+    def test_parses_bd_output(self):
+        """Decodes a bd-style JSON list."""
+        data = line_loop.loads_json('[{"id": "lc-001", "title": "T"}]')
+        self.assertEqual(data, [{"id": "lc-001", "title": "T"}])
+
+    def test_falls_back_to_stdlib_json(self):
+        """Uses json.loads when orjson is not installed."""
+        from unittest.mock import patch
+        from line_loop import parsing
+        parsing._json_loads = None
+        with patch("line_loop.parsing.importlib.import_module", side_effect=ImportError):
+            self.assertEqual(line_loop.loads_json('{"a": 1}'), {"a": 1})
+        self.assertIs(parsing._json_loads, json.loads)
+
+    def test_invalid_json_raises_json_decode_error(self):
+        """Invalid input raises json.JSONDecodeError with either parser."""
+        with self.assertRaises(json.JSONDecodeError):
+            line_loop.loads_json("not json")
+
 
 class TestDetectKitchenComplete(unittest.TestCase):
     """Test detect_kitchen_complete() function."""
@@ -275,6 +414,54 @@ class TestCircuitBreaker(unittest.TestCase):
         # 9/10 failures — should trip
         self.assertTrue(cb.is_open())
 
+    def test_window_keeps_most_recent_results(self):
+        """Results older than window_size drop out of the window."""
+        cb = line_loop.CircuitBreaker(failure_threshold=3, window_size=4)
+        for success in (False, False, False, True, True, True, True):
+            cb.record(success)
+        self.assertEqual(list(cb.window), [True, True, True, True])
+        self.assertFalse(cb.is_open())
+
+    def test_failure_count_tracks_evictions(self):
+        """recent_failures matches the failures left in the window."""
+        cb = line_loop.CircuitBreaker(failure_threshold=3, window_size=3)
+        for success in (False, True, False, False, True, True, False):
+            cb.record(success)
+            self.assertEqual(cb.recent_failures, list(cb.window).count(False))
+
+    def test_without_cooldown_stays_open(self):
+        """A tripped breaker without cooldown never offers a probe."""
+        cb = line_loop.CircuitBreaker(failure_threshold=2)
+        cb.record(False)
+        cb.record(False)
+        self.assertEqual(cb.retry_after(), float("inf"))
+        self.assertTrue(cb.is_open())
+
+    def test_half_open_after_cooldown(self):
+        """Once the cooldown passes, is_open allows a probe."""
+        from unittest.mock import patch
+        cb = line_loop.CircuitBreaker(failure_threshold=2, cooldown=60)
+        with patch("line_loop.models.time.monotonic", return_value=1000.0):
+            cb.record(False)
+            cb.record(False)
+            self.assertTrue(cb.is_open())
+            self.assertEqual(cb.retry_after(), 60)
+        with patch("line_loop.models.time.monotonic", return_value=1061.0):
+            self.assertFalse(cb.is_open())
+
+    def test_failed_probe_reopens(self):
+        """A failure during half-open restarts the cooldown."""
+        from unittest.mock import patch
+        cb = line_loop.CircuitBreaker(failure_threshold=2, cooldown=60)
+        with patch("line_loop.models.time.monotonic", return_value=1000.0):
+            cb.record(False)
+            cb.record(False)
+        with patch("line_loop.models.time.monotonic", return_value=1061.0):
+            self.assertFalse(cb.is_open())
+            cb.record(False)
+            self.assertTrue(cb.is_open())
+            self.assertEqual(cb.retry_after(), 60)
+
     def test_reset_clears_state(self):
         """Reset clears all recorded results."""
         cb = line_loop.CircuitBreaker(failure_threshold=2)
@@ -285,6 +472,31 @@ class TestCircuitBreaker(unittest.TestCase):
         self.assertFalse(cb.is_open())
 
 
+class TestLoopMetrics(unittest.TestCase):
+    """Test LoopMetrics.from_iterations."""
+
+    def test_empty_iterations(self):
+        """No iterations yields all-zero metrics."""
+        metrics = line_loop.LoopMetrics.from_iterations([])
+        self.assertEqual(metrics.p50_duration, 0.0)
+        self.assertEqual(metrics.success_rate, 0.0)
+
+    def test_rates_and_nearest_rank_percentiles(self):
+        """Rates count outcomes; percentiles pick exact recorded durations."""
+        iterations = [
+            make_iteration_result(duration_seconds=30.0),
+            make_iteration_result(duration_seconds=10.0, outcome="timeout", success=False),
+            make_iteration_result(duration_seconds=20.0, outcome="needs_retry", success=False),
+            make_iteration_result(duration_seconds=40.0),
+        ]
+        metrics = line_loop.LoopMetrics.from_iterations(iterations)
+        self.assertEqual(metrics.success_rate, 0.5)
+        self.assertEqual(metrics.timeout_rate, 0.25)
+        self.assertEqual(metrics.retry_rate, 0.25)
+        self.assertEqual(metrics.p50_duration, 30.0)
+        self.assertEqual(metrics.p95_duration, 40.0)
+
+
 class TestProgressState(unittest.TestCase):
     """Test ProgressState class for intra-iteration progress tracking."""
 
@@ -303,6 +515,23 @@ class TestProgressState(unittest.TestCase):
             iterations=[]
         )
 
+    def test_mid_phase_write_reuses_recent_iterations(self):
+        """In-phase status writes show the loop's serialized entries unchanged."""
+        import tempfile
+        from collections import deque
+        entry = {"iteration": 1, "task_id": "lc-000", "completed_at": "2026-01-01T00:00:00"}
+        recent = deque([entry], maxlen=5)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            status_file = Path(tmpdir) / "status.json"
+            ps = self._create_progress_state(status_file)
+            ps.iterations = [make_iteration_result(iteration=1, outcome="completed")]
+            ps.recent_iterations = recent
+            ps._status_writer = line_loop.write_status_file
+            ps.start_phase("cook")
+            status = json.loads(status_file.read_text())
+        self.assertEqual(status["current_phase"], "cook")
+        self.assertEqual(status["recent_iterations"], [entry])
+
     def test_start_phase_sets_fields(self):
         """start_phase() sets phase name and start time."""
         ps = self._create_progress_state()
@@ -374,6 +603,31 @@ class TestCalculateRetryDelay(unittest.TestCase):
         self.assertLessEqual(delay, max_with_jitter)
 
 
+class TestWaitUnlessShutdown(unittest.TestCase):
+    """Test wait_unless_shutdown() retry backoff wait."""
+
+    def setUp(self):
+        line_loop.reset_shutdown_flag()
+        self.addCleanup(line_loop.reset_shutdown_flag)
+
+    def test_waits_full_delay_without_shutdown(self):
+        """Returns False once the delay elapses."""
+        from line_loop.loop import wait_unless_shutdown
+        self.assertFalse(wait_unless_shutdown(0.01))
+
+    def test_shutdown_from_signal_handler_ends_wait(self):
+        """A shutdown requested by a signal handler cuts the wait short."""
+        import signal
+        import time
+        from line_loop.loop import wait_unless_shutdown
+        previous = signal.signal(signal.SIGALRM, lambda s, f: line_loop.request_shutdown())
+        self.addCleanup(signal.signal, signal.SIGALRM, previous)
+        signal.setitimer(signal.ITIMER_REAL, 0.05)
+        start = time.monotonic()
+        self.assertTrue(wait_unless_shutdown(10))
+        self.assertLess(time.monotonic() - start, 5)
+
+
 class TestSkipList(unittest.TestCase):
     """Test SkipList class for tracking failing tasks."""
 
@@ -696,6 +950,15 @@ class TestBeadSnapshotProperties(unittest.TestCase):
         s = self._make_snapshot()
         self.assertEqual(s.ready_work_ids, ["f-001", "t-001"])
 
+    def test_id_sets(self):
+        """ID sets mirror the ID lists and are built only once."""
+        s = self._make_snapshot()
+        self.assertEqual(s.ready_set, frozenset({"e-001", "f-001", "t-001"}))
+        self.assertEqual(s.ready_work_set, frozenset({"f-001", "t-001"}))
+        self.assertEqual(s.in_progress_set, frozenset({"t-002"}))
+        self.assertEqual(s.closed_set, frozenset({"t-003"}))
+        self.assertIs(s.closed_set, s.closed_set)
+
     def test_ready_work(self):
         """ready_work returns BeadInfo objects excluding epics."""
         s = self._make_snapshot()
@@ -1073,6 +1336,20 @@ class TestActionRecordDuration(unittest.TestCase):
         )
         self.assertEqual(record.duration_ms, 42.5)
 
+    def test_result_sets_duration_from_monotonic_clock(self):
+        """A tool_result sets duration_ms from the monotonic start, not the timestamp."""
+        from unittest.mock import patch
+        record = line_loop.ActionRecord.from_tool_use({"name": "Read", "id": "tu-1", "input": {}})
+        record._started = 100.0
+        record.timestamp = "not-a-timestamp"
+        pending = {"tu-1": record}
+        event = {"type": "user", "message": {"content": [
+            {"type": "tool_result", "tool_use_id": "tu-1", "content": "ok"}
+        ]}}
+        with patch("line_loop.parsing.time.monotonic", return_value=100.25):
+            line_loop.update_action_from_result(event, pending)
+        self.assertAlmostEqual(record.duration_ms, 250.0)
+
 
 class TestSerializeAction(unittest.TestCase):
     """Test serialize_action() for history JSONL format."""
@@ -1818,6 +2095,72 @@ class TestRunIterationTargetTaskId(unittest.TestCase):
         self.assertEqual(cook_calls[0][1], "")
 
 
+class TestRunIterationReportedState(unittest.TestCase):
+    """Test the state run_iteration reports back to the loop."""
+
+    def _run(self, feature_complete):
+        from unittest.mock import patch
+
+        before = line_loop.BeadSnapshot(ready=[make_bead("lc-123", "Test task", "task")])
+        after = line_loop.BeadSnapshot(closed=[make_bead("lc-123", "Test task", "task")])
+
+        def mock_run_phase(phase, cwd, **kwargs):
+            output = "verdict: APPROVED\ncontinue: true\nblocking_issues: 0" if phase == "serve" else ""
+            return line_loop.PhaseResult(
+                phase=phase, success=True, output=output,
+                exit_code=0, duration_seconds=1.0
+            )
+
+        with patch("line_loop.iteration.run_phase", side_effect=mock_run_phase), \
+             patch("line_loop.iteration.get_bead_snapshot", return_value=after), \
+             patch("line_loop.iteration.get_latest_commit", return_value="abc1234"), \
+             patch("line_loop.iteration.check_feature_completion", return_value=feature_complete), \
+             patch("line_loop.iteration.check_epic_completion_after_feature", return_value=(False, None)):
+            result = line_loop.run_iteration(
+                1, 10, Path("/tmp"),
+                json_output=True,
+                before_snapshot=before,
+                target_task_id="lc-123"
+            )
+        return result, after
+
+    def test_after_snapshot_returned(self):
+        """The post-tidy snapshot is attached when no later phase ran."""
+        result, after = self._run((False, None))
+        self.assertIs(result.after_snapshot, after)
+
+    def test_intent_parsed_from_cook_output(self):
+        """INTENT and BEFORE → AFTER are read from the cook phase buffer."""
+        from unittest.mock import patch
+
+        snapshot = line_loop.BeadSnapshot(ready=[make_bead("lc-123", "Test task", "task")])
+        cook_output = "INTENT:\n  Add auth\n  Goal: Secure API\n\nBEFORE → AFTER:\n  No auth → JWT\n"
+
+        def mock_run_phase(phase, cwd, **kwargs):
+            output = {"cook": cook_output, "serve": "verdict: APPROVED"}.get(phase, "")
+            return line_loop.PhaseResult(
+                phase=phase, success=True, output=output,
+                exit_code=0, duration_seconds=1.0
+            )
+
+        with patch("line_loop.iteration.run_phase", side_effect=mock_run_phase), \
+             patch("line_loop.iteration.get_bead_snapshot", return_value=snapshot), \
+             patch("line_loop.iteration.get_latest_commit", return_value="abc1234"), \
+             patch("line_loop.iteration.check_feature_completion", return_value=(False, None)):
+            result = line_loop.run_iteration(
+                1, 10, Path("/tmp"), json_output=True,
+                before_snapshot=snapshot, target_task_id="lc-123"
+            )
+        self.assertEqual(result.intent, "Add auth | Goal: Secure API")
+        self.assertEqual(result.before_state, "No auth")
+        self.assertEqual(result.after_state, "JWT")
+
+    def test_after_snapshot_dropped_after_plate(self):
+        """Plate changes bead state, so the snapshot is not handed back."""
+        result, _ = self._run((True, "lc-feat"))
+        self.assertIsNone(result.after_snapshot)
+
+
 class TestNeedsChangesReopensTask(unittest.TestCase):
     """Test that NEEDS_CHANGES verdict reopens the task for retry."""
 
@@ -2860,6 +3203,17 @@ class TestSerializeFindingsCount(unittest.TestCase):
         self.assertIn("findings_count", data)
         self.assertEqual(data["findings_count"], 5)
 
+    def test_serialize_for_report_shape(self):
+        """serialize_iteration_for_report keeps the report's key order and delta."""
+        from line_loop.loop import serialize_iteration_for_report
+        delta = line_loop.BeadDelta(newly_closed=[make_bead("t-1", "Test")], newly_filed=[])
+        result = make_iteration_result(findings_count=1, delta=delta)
+        data = serialize_iteration_for_report(result)
+        self.assertEqual(list(data)[:3], ["iteration", "task_id", "task_title"])
+        self.assertEqual(list(data)[-2:], ["findings_count", "delta"])
+        self.assertEqual(data["delta"]["newly_closed"], [{"id": "t-1", "title": "Test", "type": "task"}])
+        self.assertNotIn("delta", serialize_iteration_for_report(make_iteration_result()))
+
     def test_serialize_for_status_zero_findings(self):
         """serialize_iteration_for_status includes findings_count even when 0."""
         from line_loop.loop import serialize_iteration_for_status
@@ -2869,6 +3223,41 @@ class TestSerializeFindingsCount(unittest.TestCase):
         self.assertEqual(data["findings_count"], 0)
 
 
+class TestWriteStatusFile(unittest.TestCase):
+    """Test write_status_file recent_iterations handling."""
+
+    def _write(self, **kwargs):
+        import tempfile
+        from datetime import datetime
+        with tempfile.TemporaryDirectory() as tmpdir:
+            status_file = Path(tmpdir) / "status.json"
+            line_loop.write_status_file(
+                status_file=status_file, running=True, iteration=1, max_iterations=5,
+                current_task=None, current_task_title=None, last_verdict=None,
+                tasks_completed=0, tasks_remaining=0, started_at=datetime.now(),
+                **kwargs
+            )
+            return json.loads(status_file.read_text())
+
+    def test_recent_iterations_derived_from_iterations(self):
+        """Completed iterations are serialized when no entries are passed."""
+        status = self._write(iterations=[
+            make_iteration_result(iteration=1, outcome="completed"),
+            make_iteration_result(iteration=2, outcome="needs_retry"),
+        ])
+        self.assertEqual([i["iteration"] for i in status["recent_iterations"]], [1])
+
+    def test_preserialized_recent_iterations_used_as_is(self):
+        """Pre-serialized entries are written without re-reading iterations."""
+        from collections import deque
+        entries = deque([{"iteration": 3}], maxlen=5)
+        status = self._write(
+            iterations=[make_iteration_result(iteration=1, outcome="completed")],
+            recent_iterations=entries
+        )
+        self.assertEqual(status["recent_iterations"], [{"iteration": 3}])
+
+
 class TestPeriodicSync(unittest.TestCase):
     """Test periodic_sync function for long-running loop resilience."""
 
@@ -3085,5 +3474,281 @@ class TestResolveIdleTimeout(unittest.TestCase):
         self.assertEqual(resolve_idle_timeout("unknown-phase", None), line_loop.DEFAULT_IDLE_TIMEOUT)
 
 
+class TestRunSubprocess(unittest.TestCase):
+    """Test run_subprocess() executable, stdin and cwd handling."""
+
+    def setUp(self):
+        from line_loop import phase
+        phase._resolved_executables.clear()
+        self.addCleanup(phase._resolved_executables.clear)
+
+    def test_resolves_executable_once(self):
+        """PATH lookup happens once per executable; stdin is closed."""
+        import subprocess
+        from unittest.mock import patch, MagicMock
+        with patch("line_loop.phase.shutil.which", return_value="/usr/bin/bd") as mock_which, \
+             patch("line_loop.phase.subprocess.run", return_value=MagicMock(returncode=0)) as mock_run:
+            line_loop.run_subprocess(["bd", "ready", "--json"], 5, Path("/tmp"))
+            line_loop.run_subprocess(["bd", "list", "--json"], 5, Path("/tmp"))
+        mock_which.assert_called_once_with("bd")
+        self.assertEqual(mock_run.call_args[0][0], ["/usr/bin/bd", "list", "--json"])
+        self.assertIs(mock_run.call_args[1]["stdin"], subprocess.DEVNULL)
+
+    def test_cwd_dropped_when_already_current(self):
+        """cwd is only passed to the child when it differs from the process cwd."""
+        import os
+        from unittest.mock import patch, MagicMock
+        with patch("line_loop.phase.subprocess.run", return_value=MagicMock(returncode=0)) as mock_run:
+            line_loop.run_subprocess(["git", "status"], 5, Path(os.getcwd()))
+            self.assertIsNone(mock_run.call_args[1]["cwd"])
+            line_loop.run_subprocess(["git", "status"], 5, Path("/nonexistent-dir"))
+            self.assertEqual(mock_run.call_args[1]["cwd"], Path("/nonexistent-dir"))
+
+    def test_missing_executable_keeps_bare_name(self):
+        """An unresolvable executable is passed through and not cached."""
+        from unittest.mock import patch, MagicMock
+        with patch("line_loop.phase.shutil.which", return_value=None) as mock_which, \
+             patch("line_loop.phase.subprocess.run", return_value=MagicMock(returncode=0)) as mock_run:
+            line_loop.run_subprocess(["bd", "ready"], 5, Path("/tmp"))
+            line_loop.run_subprocess(["bd", "ready"], 5, Path("/tmp"))
+        self.assertEqual(mock_which.call_count, 2)
+        self.assertEqual(mock_run.call_args[0][0], ["bd", "ready"])
+
+
+class TestGetTaskTitleCache(unittest.TestCase):
+    """Test get_task_title() title caching."""
+
+    def setUp(self):
+        from line_loop import iteration
+        iteration._title_cache.clear()
+        self.addCleanup(iteration._title_cache.clear)
+
+    def test_second_lookup_skips_bd(self):
+        """A fetched title is served from cache on the next call."""
+        from unittest.mock import patch, MagicMock
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = json.dumps([{"id": "lc-001", "title": "Cached"}])
+        with patch("line_loop.iteration.run_subprocess", return_value=mock_result) as mock_sub:
+            self.assertEqual(line_loop.get_task_title("lc-001", Path("/tmp")), "Cached")
+            self.assertEqual(line_loop.get_task_title("lc-001", Path("/tmp")), "Cached")
+            mock_sub.assert_called_once()
+
+    def test_failed_lookup_not_cached(self):
+        """A failed lookup is retried on the next call."""
+        from unittest.mock import patch, MagicMock
+        mock_result = MagicMock()
+        mock_result.returncode = 1
+        mock_result.stdout = ""
+        with patch("line_loop.iteration.run_subprocess", return_value=mock_result) as mock_sub:
+            self.assertIsNone(line_loop.get_task_title("lc-404", Path("/tmp")))
+            self.assertIsNone(line_loop.get_task_title("lc-404", Path("/tmp")))
+            self.assertEqual(mock_sub.call_count, 2)
+
+    def test_clear_bead_caches_forces_lookup(self):
+        """clear_bead_caches drops cached titles so bd is queried again."""
+        from unittest.mock import patch, MagicMock
+        from line_loop.iteration import clear_bead_caches
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = json.dumps({"id": "lc-001", "title": "Cached"})
+        with patch("line_loop.iteration.run_subprocess", return_value=mock_result) as mock_sub:
+            line_loop.get_task_title("lc-001", Path("/tmp"))
+            clear_bead_caches()
+            line_loop.get_task_title("lc-001", Path("/tmp"))
+            self.assertEqual(mock_sub.call_count, 2)
+
+    def test_snapshot_seeds_cache(self):
+        """Titles from a bead snapshot are served without bd show."""
+        from unittest.mock import patch, MagicMock
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = json.dumps([{"id": "lc-002", "title": "From snapshot"}])
+        with patch("line_loop.iteration.run_subprocess", return_value=mock_result):
+            line_loop.get_bead_snapshot(Path("/tmp"))
+        with patch("line_loop.iteration.run_subprocess") as mock_sub:
+            self.assertEqual(line_loop.get_task_title("lc-002", Path("/tmp")), "From snapshot")
+            mock_sub.assert_not_called()
+
+
+class TestGetLatestCommitCache(unittest.TestCase):
+    """Test get_latest_commit() HEAD-gated caching."""
+
+    def setUp(self):
+        import tempfile
+        from line_loop import iteration
+        self.addCleanup(iteration._commit_cache.clear)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cwd = Path(tmp.name)
+        (self.cwd / ".git" / "refs" / "heads").mkdir(parents=True)
+        (self.cwd / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        self.ref = self.cwd / ".git" / "refs" / "heads" / "main"
+        self.ref.write_text("a" * 40 + "\n")
+
+    def _git_log(self):
+        from unittest.mock import MagicMock
+        result = MagicMock()
+        result.returncode = 0
+        result.stdout = "abc1234\n"
+        return result
+
+    def test_unchanged_head_skips_git(self):
+        """Without a new commit the cached hash is returned."""
+        from unittest.mock import patch
+        with patch("line_loop.iteration.run_subprocess", return_value=self._git_log()) as mock_sub:
+            self.assertEqual(line_loop.get_latest_commit(self.cwd), "abc1234")
+            self.assertEqual(line_loop.get_latest_commit(self.cwd), "abc1234")
+            self.assertEqual(mock_sub.call_count, 1)
+
+    def test_branch_ref_update_requeries(self):
+        """Rewriting the branch ref (a commit) invalidates the cache."""
+        import os
+        from unittest.mock import patch
+        with patch("line_loop.iteration.run_subprocess", return_value=self._git_log()) as mock_sub:
+            line_loop.get_latest_commit(self.cwd)
+            os.utime(self.ref, ns=(0, 0))
+            line_loop.get_latest_commit(self.cwd)
+            self.assertEqual(mock_sub.call_count, 2)
+
+    def test_branch_switch_requeries(self):
+        """Pointing HEAD at another branch invalidates the cache."""
+        from unittest.mock import patch
+        with patch("line_loop.iteration.run_subprocess", return_value=self._git_log()) as mock_sub:
+            line_loop.get_latest_commit(self.cwd)
+            (self.cwd / ".git" / "HEAD").write_text("ref: refs/heads/epic/lc-001\n")
+            line_loop.get_latest_commit(self.cwd)
+            self.assertEqual(mock_sub.call_count, 2)
+
+    def test_reftable_repo_not_cached(self):
+        """Reftable repos commit without touching HEAD or loose refs, so git is always asked."""
+        from unittest.mock import patch
+        (self.cwd / ".git" / "HEAD").write_text("ref: refs/heads/.invalid\n")
+        self.ref.unlink()
+        (self.cwd / ".git" / "reftable").mkdir()
+        (self.cwd / ".git" / "reftable" / "tables.list").write_text("0x000000000001-0x000000000001-abcd.ref\n")
+        with patch("line_loop.iteration.run_subprocess", return_value=self._git_log()) as mock_sub:
+            line_loop.get_latest_commit(self.cwd)
+            line_loop.get_latest_commit(self.cwd)
+            self.assertEqual(mock_sub.call_count, 2)
+
+
+class TestGetBeadSnapshot(unittest.TestCase):
+    """Test get_bead_snapshot() query fan-out."""
+
+    def setUp(self):
+        from line_loop import iteration
+        self.addCleanup(iteration._title_cache.clear)
+        self.addCleanup(iteration._snapshot_cache.clear)
+
+    def _mock_run_subprocess(self, responses):
+        from unittest.mock import MagicMock
+
+        def run(cmd, timeout, cwd):
+            key = cmd[1] if cmd[1] == "ready" else cmd[2]
+            response = responses[key]
+            if isinstance(response, Exception):
+                raise response
+            result = MagicMock()
+            result.returncode = 0
+            result.stdout = response
+            return result
+        return run
+
+    def test_collects_all_three_queries(self):
+        """Ready, in_progress and closed lists are each populated."""
+        from unittest.mock import patch
+        responses = {
+            "ready": json.dumps([{"id": "lc-001", "title": "Ready", "issue_type": "task"}]),
+            "--status=in_progress": json.dumps([{"id": "lc-002", "title": "Doing"}]),
+            "--status=closed": json.dumps([{"id": "lc-003", "title": "Done"}]),
+        }
+        with patch("line_loop.iteration.run_subprocess", side_effect=self._mock_run_subprocess(responses)):
+            snapshot = line_loop.get_bead_snapshot(Path("/tmp"))
+        self.assertEqual(snapshot.ready_ids, ["lc-001"])
+        self.assertEqual(snapshot.in_progress_ids, ["lc-002"])
+        self.assertEqual(snapshot.closed_ids, ["lc-003"])
+
+    def test_failed_query_leaves_others_intact(self):
+        """One failing query yields an empty list without losing the rest."""
+        import subprocess
+        from unittest.mock import patch
+        responses = {
+            "ready": json.dumps([{"id": "lc-001"}]),
+            "--status=in_progress": subprocess.TimeoutExpired("bd list", 30),
+            "--status=closed": "not json",
+        }
+        with patch("line_loop.iteration.run_subprocess", side_effect=self._mock_run_subprocess(responses)):
+            snapshot = line_loop.get_bead_snapshot(Path("/tmp"))
+        self.assertEqual(snapshot.ready_ids, ["lc-001"])
+        self.assertEqual(snapshot.in_progress, [])
+        self.assertEqual(snapshot.closed, [])
+
+    def test_non_json_output_not_parsed(self):
+        """Output that can't be JSON is skipped without a parse attempt."""
+        from unittest.mock import patch
+        responses = {
+            "ready": "Error: no beads database found",
+            "--status=in_progress": "",
+            "--status=closed": "  \n",
+        }
+        with patch("line_loop.iteration.run_subprocess", side_effect=self._mock_run_subprocess(responses)), \
+             patch("line_loop.iteration.loads_json") as mock_loads:
+            snapshot = line_loop.get_bead_snapshot(Path("/tmp"))
+        mock_loads.assert_not_called()
+        self.assertEqual(snapshot.ready, [])
+
+    def test_include_closed_false_skips_closed_query(self):
+        """include_closed=False leaves closed empty without running bd list."""
+        from unittest.mock import patch
+        responses = {
+            "ready": json.dumps([{"id": "lc-001"}]),
+            "--status=in_progress": "[]",
+        }
+        with patch("line_loop.iteration.run_subprocess", side_effect=self._mock_run_subprocess(responses)) as mock_sub:
+            snapshot = line_loop.get_bead_snapshot(Path("/tmp"), include_closed=False)
+        self.assertEqual(snapshot.ready_ids, ["lc-001"])
+        self.assertEqual(snapshot.closed, [])
+        self.assertEqual(mock_sub.call_count, 2)
+
+    def test_unchanged_database_reuses_snapshot(self):
+        """A second call with untouched .beads files skips the bd queries."""
+        import os
+        import tempfile
+        from unittest.mock import patch
+        responses = {
+            "ready": json.dumps([{"id": "lc-001"}]),
+            "--status=in_progress": "[]",
+            "--status=closed": "[]",
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = Path(tmpdir) / ".beads" / "beads.db"
+            db.parent.mkdir()
+            db.write_text("")
+            with patch("line_loop.iteration.run_subprocess", side_effect=self._mock_run_subprocess(responses)) as mock_sub:
+                first = line_loop.get_bead_snapshot(Path(tmpdir))
+                second = line_loop.get_bead_snapshot(Path(tmpdir))
+                self.assertIs(second, first)
+                self.assertEqual(mock_sub.call_count, 3)
+
+                os.utime(db, ns=(0, 0))
+                third = line_loop.get_bead_snapshot(Path(tmpdir))
+                self.assertIsNot(third, first)
+                self.assertEqual(mock_sub.call_count, 6)
+
+    def test_no_beads_directory_not_cached(self):
+        """Without a .beads directory every call queries bd."""
+        from unittest.mock import patch
+        responses = {
+            "ready": "[]",
+            "--status=in_progress": "[]",
+            "--status=closed": "[]",
+        }
+        with patch("line_loop.iteration.run_subprocess", side_effect=self._mock_run_subprocess(responses)) as mock_sub:
+            line_loop.get_bead_snapshot(Path("/nonexistent"))
+            line_loop.get_bead_snapshot(Path("/nonexistent"))
+        self.assertEqual(mock_sub.call_count, 6)
+
+
 if __name__ == "__main__":
     unittest.main()